@@ -0,0 +1,340 @@
+"""
+Run batches of seeded sessions and summarize their results.
+
+Every session ``i`` of a batch rolls the dice of
+:meth:`crapssim.table.Table.from_seed_stream`, so batches are reproducible and
+can be split across workers freely.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Mapping, Sequence, SupportsFloat
+
+import numpy as np
+
+from crapssim.dice import session_seed
+from crapssim.strategy import Strategy
+from crapssim.table import Table
+
+__all__ = [
+    "PairedDifference",
+    "StrategyComparison",
+    "SessionResults",
+    "ActionComparison",
+    "compare_strategies",
+    "run_sessions",
+    "compare_actions",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class PairedDifference:
+    """Difference in net result between two strategies played on the same dice.
+
+    Attributes:
+        mean: Mean of the per-session differences.
+        variance: Sample variance of the per-session differences.
+        std_error: Standard error of :attr:`mean`.
+        independent_std_error: Standard error the same estimate would have if
+            the two strategies had been played on independent dice.
+        variance_reduction: How many times fewer sessions the paired estimate
+            needs than the independent one for the same accuracy.
+    """
+
+    mean: float
+    variance: float
+    std_error: float
+    independent_std_error: float
+    variance_reduction: float
+
+
+@dataclass(frozen=True)
+class StrategyComparison:
+    """Results of :func:`compare_strategies`.
+
+    Attributes:
+        names: Name of each strategy, in column order.
+        net: Array of shape ``(n_sessions, n_strategies)`` with the net change
+            in each player's cash (bankroll plus bets on the table) per session.
+    """
+
+    names: tuple[str, ...]
+    net: np.ndarray
+
+    @property
+    def n_sessions(self) -> int:
+        """Number of sessions played."""
+        return len(self.net)
+
+    def mean(self) -> dict[str, float]:
+        """Return the mean net result of each strategy."""
+        return dict(zip(self.names, self.net.mean(axis=0).tolist()))
+
+    def difference(self, first: str, second: str) -> PairedDifference:
+        """Return the paired difference ``first - second`` of two strategies.
+
+        Args:
+            first: Name of the first strategy.
+            second: Name of the second strategy.
+
+        Returns:
+            PairedDifference: The difference and its variance.
+        """
+        a = self.net[:, self.names.index(first)]
+        b = self.net[:, self.names.index(second)]
+        n = self.n_sessions
+        variance = float(np.var(a - b, ddof=1))
+        independent_variance = float(np.var(a, ddof=1) + np.var(b, ddof=1))
+        return PairedDifference(
+            mean=float(np.mean(a - b)),
+            variance=variance,
+            std_error=(variance / n) ** 0.5,
+            independent_std_error=(independent_variance / n) ** 0.5,
+            variance_reduction=(
+                independent_variance / variance if variance > 0 else float("inf")
+            ),
+        )
+
+
+def compare_strategies(
+    strategies: Mapping[str, Strategy] | Sequence[Strategy],
+    n_sessions: int,
+    max_rolls: int,
+    root_seed: int = 0,
+    bankroll: SupportsFloat = 100,
+    max_shooter: float | int = float("inf"),
+    runout: bool = False,
+) -> StrategyComparison:
+    """Play several strategies on exactly the same dice (common random numbers).
+
+    Each session seats one player per strategy, each with their own bankroll,
+    at a single table, so every strategy sees the same rolls. Differences
+    between strategies are then free of most of the dice noise, which usually
+    needs several times fewer sessions than comparing separate tables.
+
+    A session ends when it reaches ``max_rolls`` or ``max_shooter``, or when
+    every strategy has completed.
+
+    Args:
+        strategies: Strategies to compare, keyed by name. A sequence is named by
+            each strategy's ``repr``.
+        n_sessions: Number of sessions to play.
+        max_rolls: Maximum number of rolls per session.
+        root_seed: Seed for the batch, see :func:`crapssim.dice.session_seed`.
+        bankroll: Starting bankroll of each player.
+        max_shooter: Maximum number of shooters per session.
+        runout: If True, keep rolling at the end of a session until every bet
+            is resolved.
+
+    Returns:
+        StrategyComparison: Net results per session and strategy.
+    """
+    if not isinstance(strategies, Mapping):
+        named = {repr(strategy): strategy for strategy in strategies}
+        if len(named) != len(strategies):
+            raise ValueError("Strategies must have distinct names, pass a mapping")
+        strategies = named
+    names = tuple(strategies)
+    if len(names) == 0:
+        raise ValueError("At least one strategy is required")
+
+    net = np.array(
+        [
+            _play_session(
+                Table.from_seed_stream(root_seed, session),
+                strategies,
+                max_rolls,
+                bankroll,
+                max_shooter,
+                runout,
+            )
+            for session in range(n_sessions)
+        ]
+    ).reshape(n_sessions, len(names))
+    return StrategyComparison(names=names, net=net)
+
+
+@dataclass(frozen=True)
+class SessionResults:
+    """Results of :func:`run_sessions`.
+
+    Attributes:
+        net: Net change in the player's cash in each session.
+        antithetic_net: Net change in each session's antithetic twin, or None
+            if the sessions were run without twins.
+    """
+
+    net: np.ndarray
+    antithetic_net: np.ndarray | None = None
+
+    @property
+    def n_sessions(self) -> int:
+        """Number of seeded sessions (not counting antithetic twins)."""
+        return len(self.net)
+
+    @property
+    def estimates(self) -> np.ndarray:
+        """One independent estimate per session: the average of each session
+        and its twin, or the session's own result without twins."""
+        if self.antithetic_net is None:
+            return self.net
+        return (self.net + self.antithetic_net) / 2
+
+    @property
+    def mean(self) -> float:
+        """Estimate of the expected net result."""
+        return float(np.mean(self.estimates))
+
+    @property
+    def std_error(self) -> float:
+        """Standard error of :attr:`mean`."""
+        return float(np.std(self.estimates, ddof=1) / np.sqrt(self.n_sessions))
+
+    @property
+    def variance_reduction(self) -> float:
+        """How many times lower the variance of :attr:`mean` is than that of
+        the plain average of the same number of independent sessions."""
+        if self.antithetic_net is None:
+            return 1.0
+        all_net = np.concatenate([self.net, self.antithetic_net])
+        independent_variance = np.var(all_net, ddof=1) / len(all_net)
+        variance = self.std_error**2
+        return float(independent_variance / variance) if variance > 0 else np.inf
+
+
+def run_sessions(
+    strategy: Strategy,
+    n_sessions: int,
+    max_rolls: int,
+    root_seed: int = 0,
+    bankroll: SupportsFloat = 100,
+    max_shooter: float | int = float("inf"),
+    runout: bool = False,
+    antithetic: bool = False,
+) -> SessionResults:
+    """Play a strategy for a batch of seeded sessions.
+
+    With ``antithetic=True`` every session also gets a twin played on the
+    antithetic dice of the same seed (each face ``f`` rolled as ``7 - f``). The
+    two results are averaged into one estimate per session. The mapping turns
+    each total ``t`` into ``14 - t``, so payoffs that are monotone in the total
+    get a lower variance than from two independent sessions. Line bets, for
+    which a 7 stays a 7, can instead be positively correlated with their twin;
+    :attr:`SessionResults.variance_reduction` reports the effect either way.
+
+    Args:
+        strategy: The strategy to play.
+        n_sessions: Number of seeded sessions to play.
+        max_rolls: Maximum number of rolls per session.
+        root_seed: Seed for the batch, see :func:`crapssim.dice.session_seed`.
+        bankroll: Starting bankroll of the player.
+        max_shooter: Maximum number of shooters per session.
+        runout: If True, keep rolling at the end of a session until every bet
+            is resolved.
+        antithetic: If True, also play the antithetic twin of every session.
+
+    Returns:
+        SessionResults: The net result of every session (and twin).
+    """
+    strategies = {"Player": strategy}
+
+    def play(antithetic: bool) -> np.ndarray:
+        return np.array(
+            [
+                _play_session(
+                    Table.from_seed_stream(root_seed, session, antithetic),
+                    strategies,
+                    max_rolls,
+                    bankroll,
+                    max_shooter,
+                    runout,
+                )[0]
+                for session in range(n_sessions)
+            ]
+        )
+
+    return SessionResults(
+        net=play(antithetic=False),
+        antithetic_net=play(antithetic=True) if antithetic else None,
+    )
+
+
+@dataclass(frozen=True)
+class ActionComparison(StrategyComparison):
+    """Results of :func:`compare_actions`.
+
+    Attributes:
+        names: Name of each action, in column order.
+        net: Array of shape ``(n_continuations, n_actions)`` with the net change
+            in the player's cash from the fork to the end of each continuation.
+    """
+
+
+def compare_actions(
+    table: Table,
+    actions: Mapping[str, Callable[[Table], None]],
+    n_continuations: int,
+    max_rolls: int,
+    root_seed: int = 0,
+    player: int = 0,
+    max_shooter: float | int = float("inf"),
+    runout: bool = False,
+) -> ActionComparison:
+    """Fork a table into one branch per action and play each branch forward.
+
+    Every action is applied to its own copy of the table as it is now (for
+    example pressing a bet, taking it down or adding odds), and the result is
+    played ``n_continuations`` times. Continuation ``i`` rolls the same dice
+    after every action: the table's dice, reseeded with
+    :func:`crapssim.dice.session_seed` of ``root_seed`` and ``i`` (see
+    :meth:`crapssim.dice.Dice.reseed`), so differences between actions are
+    paired and the dice keep their model and roll count. ``table`` itself is
+    left unchanged.
+
+    Args:
+        table: The table at the decision point, between two rolls.
+        actions: Functions applying each alternative to a copy of the table,
+            keyed by name, e.g. ``{"press": lambda t: t.players[0].add_bet(...)}``.
+        n_continuations: Number of random continuations of each action.
+        max_rolls: Maximum number of rolls per continuation.
+        root_seed: Seed for the continuations.
+        player: Index of the player whose result is reported.
+        max_shooter: Maximum number of shooters per continuation.
+        runout: If True, keep rolling at the end of a continuation until every
+            bet is resolved.
+
+    Returns:
+        ActionComparison: Net results per continuation and action.
+    """
+    names = tuple(actions)
+    if len(names) == 0:
+        raise ValueError("At least one action is required")
+
+    snapshot = table.snapshot()
+    start_cash = table.players[player].total_player_cash
+    branch = Table.from_snapshot(snapshot)
+    net = np.empty((n_continuations, len(names)))
+    for column, action in enumerate(actions.values()):
+        for continuation in range(n_continuations):
+            branch.restore(snapshot)
+            action(branch)
+            branch.dice.reseed(session_seed(root_seed, continuation))
+            branch.run(max_rolls, max_shooter, verbose=False, runout=runout)
+            net[continuation, column] = (
+                branch.players[player].total_player_cash - start_cash
+            )
+    return ActionComparison(names=names, net=net)
+
+
+def _play_session(
+    table: Table,
+    strategies: Mapping[str, Strategy],
+    max_rolls: int,
+    bankroll: SupportsFloat,
+    max_shooter: float | int,
+    runout: bool,
+) -> list[float]:
+    """Seat one player per strategy, run the table and return each net result."""
+    for name, strategy in strategies.items():
+        table.add_player(bankroll=bankroll, strategy=strategy, name=name)
+    table.run(max_rolls, max_shooter, verbose=False, runout=runout)
+    return [player.total_player_cash - float(bankroll) for player in table.players]
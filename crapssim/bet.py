@@ -1,13 +1,36 @@
+import collections
 import copy
+import functools
+import itertools
 import math
 from abc import ABC, ABCMeta, abstractmethod
-from dataclasses import dataclass
-from typing import Hashable, Literal, Protocol, SupportsFloat, TypedDict, cast
-
-from crapssim.dice import Dice
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import (
+    Any,
+    Hashable,
+    Literal,
+    Mapping,
+    Protocol,
+    Sequence,
+    SupportsFloat,
+    TypedDict,
+    cast,
+)
+
+from crapssim.dice import (
+    DICE_PAIRS,
+    OUTCOME_IS_HARD,
+    OUTCOME_SORTED_PAIRS,
+    OUTCOME_TOTALS,
+    Dice,
+    DicePair,
+)
 from crapssim.point import Point
 
 __all__ = [
+    "CompiledSettings",
+    "compiled_settings",
     "BetResult",
     "Bet",
     "_WinningLosingNumbersBet",
@@ -42,6 +65,59 @@ __all__ = [
 ]
 ALL_DICE_NUMBERS = {2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12}
 
+_NUMBERS: dict[int, tuple[int]] = {n: (n,) for n in ALL_DICE_NUMBERS}
+"""Shared one-number tuples, e.g. ``_NUMBERS[7] == (7,)``."""
+_SEVEN: tuple[int] = _NUMBERS[7]
+_NATURALS: tuple[int, ...] = (7, 11)
+_CRAPS: tuple[int, ...] = (2, 3, 12)
+_NO_NUMBERS: tuple[int, ...] = ()
+
+
+def _numbers(number: int) -> tuple[int, ...]:
+    """Return the shared tuple holding just ``number``."""
+    numbers = _NUMBERS.get(number)
+    return (number,) if numbers is None else numbers
+
+
+@functools.lru_cache(maxsize=4096)
+def _no_action(amount: float) -> "BetResult":
+    """Shared result of a roll that leaves a bet of ``amount`` as it is."""
+    return BetResult(0, False, amount)
+
+
+_MAX_PAYOUT_TABLES: int = 4096
+"""Number of payout tables kept, dropping the least recently used first."""
+_PAYOUT_TABLES: collections.OrderedDict[Hashable, tuple["BetResult", ...]] = (
+    collections.OrderedDict()
+)
+"""Results of tabulated bets for each outcome index, by payout key and amount,
+from the least to the most recently used."""
+
+
+class _RolledDice:
+    """Dice showing one outcome without an outcome index, to tabulate results."""
+
+    __slots__ = ("outcome", "result", "total", "is_hard", "pair")
+
+    def __init__(self, index: int) -> None:
+        self.outcome: None = None
+        self.result: DicePair = DICE_PAIRS[index]
+        self.total: int = OUTCOME_TOTALS[index]
+        self.is_hard: bool = OUTCOME_IS_HARD[index]
+        self.pair: DicePair = OUTCOME_SORTED_PAIRS[index]
+
+
+_ROLLED_DICE: tuple[_RolledDice, ...] = tuple(_RolledDice(i) for i in range(36))
+
+
+@dataclass(slots=True)
+class _RolledTable:
+    """The parts of a table that tabulated bets read, with stand-in dice."""
+
+    dice: _RolledDice
+    point: Point
+    settings: "TableSettings"
+
 
 class TableSettings(TypedDict, total=False):
     """Subset of table policy toggles referenced by bet logic."""
@@ -57,6 +133,173 @@ class TableSettings(TypedDict, total=False):
     vig_paid_on_win: bool
 
 
+_COMPILED_SETTINGS: dict[Hashable, "CompiledSettings"] = {}
+"""Compiled settings by their values, so equal settings share a version."""
+_SETTINGS_VERSIONS = itertools.count()
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSettings:
+    """
+    Table settings resolved into the form bets read them in
+
+    Created by :func:`compiled_settings`. Settings with the same values
+    compile to the same object, and any change to the settings gives a new
+    :attr:`version`, so caches of results that depend on the settings can be
+    keyed by it.
+    """
+
+    version: int
+    """Stamp of the settings' values, unique to them within the process."""
+    ATS_payouts: Mapping[str, float]
+    """Payout ratio of each All/Tall/Small bet type."""
+    field_payouts: tuple[float, ...]
+    """Field payout ratio of each dice total (index), 0 where it does not pay."""
+    fire_payouts: tuple[float | None, ...]
+    """Fire payout ratio for each number of points made (index), None where it
+    does not pay."""
+    hop_payouts: Mapping[str, float]
+    """Payout ratio of easy and hard hops."""
+    max_odds: Mapping[int, float]
+    """Maximum odds behind light-side bets, by number."""
+    max_dont_odds: Mapping[int, float]
+    """Maximum odds behind dark-side bets, by number."""
+    vig_rounding: Literal["ceil_dollar", "nearest_dollar", "none"]
+    vig_floor: float
+    vig_paid_on_win: bool
+    _vig: dict[float, float] = field(default_factory=dict, compare=False, repr=False)
+
+    @staticmethod
+    def from_settings(settings: TableSettings) -> "CompiledSettings":
+        """Compile ``settings``, reusing the compiled settings of equal values."""
+        field_payouts = settings.get("field_payouts", {})
+        fire_payouts = settings.get("fire_payouts", {})
+        rounding, floor = _vig_policy(settings)
+        values = (
+            MappingProxyType(dict(settings.get("ATS_payouts", {}))),
+            tuple(
+                float(field_payouts[total]) if total in field_payouts else 0.0
+                for total in range(13)
+            ),
+            tuple(fire_payouts.get(n) for n in range(7)),
+            MappingProxyType(dict(settings.get("hop_payouts", {}))),
+            MappingProxyType(dict(settings.get("max_odds", {}))),
+            MappingProxyType(dict(settings.get("max_dont_odds", {}))),
+            rounding,
+            floor,
+            settings.get("vig_paid_on_win", True),
+        )
+        try:
+            key = tuple(
+                tuple(value.items()) if isinstance(value, Mapping) else value
+                for value in values
+            )
+            compiled = _COMPILED_SETTINGS.get(key)
+        except TypeError:
+            key, compiled = None, None
+        if compiled is None:
+            compiled = CompiledSettings(next(_SETTINGS_VERSIONS), *values)
+            if key is not None:
+                if len(_COMPILED_SETTINGS) >= _MAX_PAYOUT_TABLES:
+                    _COMPILED_SETTINGS.clear()
+                _COMPILED_SETTINGS[key] = compiled
+        return compiled
+
+    def vig(self, amount: float) -> float:
+        """Vig charged on a Buy or Lay of ``amount``, computed once per amount."""
+        vig = self._vig.get(amount)
+        if vig is None:
+            vig = self._vig[amount] = _compute_vig(
+                amount, rounding=self.vig_rounding, floor=self.vig_floor
+            )
+        return vig
+
+
+class _SettingsDict(dict):
+    """
+    Table settings that keep their compiled form until they change
+
+    Dicts stored in the settings (the payout tables) are copied into nested
+    settings dicts, so that changing them also counts as changing the settings.
+    """
+
+    __slots__ = ("_owner", "_compiled")
+
+    def __init__(
+        self, settings: Mapping = (), owner: "_SettingsDict | None" = None
+    ) -> None:
+        super().__init__()
+        self._owner: _SettingsDict = self if owner is None else owner
+        self._compiled: CompiledSettings | None = None
+        for key, value in dict(settings).items():
+            super().__setitem__(key, self._wrap(value))
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return _SettingsDict(value, self._owner)
+        return value
+
+    def _changed(self) -> None:
+        self._owner._compiled = None
+
+    @property
+    def compiled(self) -> CompiledSettings:
+        """The compiled settings, recompiled only after the settings change."""
+        owner = self._owner
+        if owner._compiled is None:
+            owner._compiled = CompiledSettings.from_settings(owner)
+        return owner._compiled
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        super().__setitem__(key, self._wrap(value))
+        self._changed()
+
+    def __delitem__(self, key: Hashable) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Mapping) -> "_SettingsDict":
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            super().__setitem__(key, self._wrap(value))
+        self._changed()
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args) -> Any:
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[Hashable, Any]:
+        self._changed()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._changed()
+        super().clear()
+
+
+def compiled_settings(settings: TableSettings) -> CompiledSettings:
+    """
+    Return ``settings`` compiled for the bets to read.
+
+    The settings of a :class:`~crapssim.table.Table` keep their compiled form
+    until they change. Any other mapping is compiled on every call.
+    """
+    if isinstance(settings, _SettingsDict):
+        return settings.compiled
+    return CompiledSettings.from_settings(settings)
+
+
 class Table(Protocol):
     dice: Dice
     point: Point
@@ -111,6 +354,21 @@ class BetResult:
         return self.amount if self.amount > 0 else 0
 
 
+@functools.cache
+def _slot_names(cls: type) -> tuple[tuple[str, ...], bool]:
+    """Names of the attributes in the slots of ``cls`` and its bases, and
+    whether ``cls`` or a base below :class:`Bet` keeps attributes in a dict
+    instead (a subclass that does not define ``__slots__``)."""
+    names = tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in klass.__dict__.get("__slots__", ())
+        if name not in ("__dict__", "__weakref__")
+    )
+    bet_classes = cls.__mro__[: cls.__mro__.index(Bet)]
+    return names, any("__slots__" not in klass.__dict__ for klass in bet_classes)
+
+
 class _MetaBetABC(ABCMeta):
     # Trick to get a bet like `PassLine` to have it's repr be `crapssim.bet.PassLine`
     def __repr__(cls):
@@ -125,6 +383,21 @@ class Bet(ABC, metaclass=_MetaBetABC):
     All bets will be a subclass of this.
     """
 
+    # Bets keep their attributes in slots. The dict is only created if
+    # something else is set on a bet, like a mocked method in a test.
+    __slots__ = ("amount", "__dict__")
+
+    _set_attributes: tuple[str, ...] = ()
+    """Attributes holding sets, which the bet's state keeps as frozensets."""
+    tabulated: bool = False
+    """Whether :meth:`get_result` depends only on the roll, the point, the
+    table settings and the bet's placement key and amount, so that it can be
+    read from a payout table of the 36 dice outcomes (see
+    :meth:`_tabulated_result`)."""
+    placement_totals: frozenset[int] = frozenset()
+    """Dice totals whose roll can change whether the bet is allowed, besides
+    those that move the point or end the shooter (see :meth:`is_allowed`)."""
+
     def __init__(self, amount: SupportsFloat) -> None:
         self.amount: float = float(amount)
         """Wagered amount for the bet."""
@@ -141,7 +414,12 @@ class Bet(ABC, metaclass=_MetaBetABC):
         pass
 
     def cost(self, table: Table) -> float:
-        """Total bankroll required to put this bet in action on ``table``."""
+        """Total bankroll required to put this bet in action on ``table``.
+
+        Players keep the total cost of their bets until the bets or the table
+        settings change, so the cost must depend only on the bet and the
+        settings.
+        """
         return self.amount
 
     def update_number(self, table: Table):
@@ -155,6 +433,54 @@ class Bet(ABC, metaclass=_MetaBetABC):
         """
         pass
 
+    def _payout_key(self, table: Table) -> Hashable:
+        """Everything besides the roll and amount that the result depends on."""
+        return (
+            self._placed_key,
+            table.point.number,
+            compiled_settings(table.settings).version,
+        )
+
+    def _tabulated_result(self, table: Table) -> BetResult:
+        """
+        Result of a tabulated bet, read from the payout table of its key.
+
+        The first lookup of a key computes the result of every outcome by
+        calling :meth:`get_result` with dice that have no outcome index,
+        which makes it compute the result instead of looking it up.
+
+        Returns:
+            The result of the bet for the table's latest roll.
+        """
+        key = (self._payout_key(table), self.amount)
+        results = _PAYOUT_TABLES.get(key)
+        if results is None:
+            results = _PAYOUT_TABLES[key] = tuple(
+                self.get_result(_RolledTable(dice, table.point, table.settings))
+                for dice in _ROLLED_DICE
+            )
+            if len(_PAYOUT_TABLES) > _MAX_PAYOUT_TABLES:
+                _PAYOUT_TABLES.popitem(last=False)
+        else:
+            _PAYOUT_TABLES.move_to_end(key)
+        return results[table.dice.outcome]
+
+    def get_active_numbers(self, table: Table) -> frozenset[int]:
+        """
+        Dice totals that can resolve or change the bet on the next roll.
+
+        Rolling any other total must leave the bet exactly as it is, which
+        lets the table skip over such rolls (see ``Table.run(engine="skip")``)
+        and players settle only the bets active for the rolled total. The
+        numbers must depend only on the bet's ``_placed_key`` and the point,
+        since players cache them by both. Returning extra totals is always
+        safe, so this defaults to every total.
+
+        Returns:
+            The totals that can affect the bet.
+        """
+        return frozenset(ALL_DICE_NUMBERS)
+
     def is_removable(self, table: Table) -> bool:
         """
         Checks whether the bet is removable. May depend on the
@@ -180,6 +506,39 @@ class Bet(ABC, metaclass=_MetaBetABC):
         new_bet = self.__class__(self.amount)
         return new_bet
 
+    def get_state(self) -> tuple[type["Bet"], tuple[tuple[str, Any], ...]]:
+        """
+        Compact copy of the bet's attributes, see :meth:`from_state`.
+
+        Returns:
+            The type of the bet and its attributes as ``(name, value)`` pairs.
+        """
+        names, has_dict = _slot_names(type(self))
+        attributes = {
+            name: getattr(self, name) for name in names if hasattr(self, name)
+        }
+        if has_dict:
+            attributes.update(self.__dict__)
+        for name in self._set_attributes:
+            attributes[name] = frozenset(attributes[name])
+        return type(self), tuple(attributes.items())
+
+    @staticmethod
+    def from_state(state: tuple[type["Bet"], tuple[tuple[str, Any], ...]]) -> "Bet":
+        """
+        Create a new bet from the state returned by :meth:`get_state`.
+
+        Returns:
+            A bet equal to the one the state was taken from.
+        """
+        bet_type, attributes = state
+        bet = bet_type.__new__(bet_type)
+        for name, value in attributes:
+            setattr(bet, name, value)
+        for name in bet_type._set_attributes:
+            setattr(bet, name, set(getattr(bet, name)))
+        return bet
+
     @property
     def _placed_key(self) -> Hashable:
         return type(self)
@@ -236,6 +595,8 @@ class _WinningLosingNumbersBet(Bet, ABC):
     calculate the result.
     """
 
+    __slots__ = ()
+
     def get_result(self, table: Table) -> BetResult:
         """Core bet logic that determines the result.
 
@@ -246,6 +607,9 @@ class _WinningLosingNumbersBet(Bet, ABC):
         in a loss of the original bet amount. Otherwise the bet stays
         on the table.
         """
+        if self.tabulated and table.dice.outcome is not None:
+            return self._tabulated_result(table)
+
         if table.dice.total in self.get_winning_numbers(table):
             result_amount = self.get_payout_ratio(table) * self.amount + self.amount
             should_remove = True
@@ -256,24 +620,29 @@ class _WinningLosingNumbersBet(Bet, ABC):
             result_amount = self.amount
             should_remove = True
         else:
-            result_amount = 0
-            should_remove = False
+            return _no_action(self.amount)
 
         return BetResult(result_amount, should_remove, self.amount)
 
     @abstractmethod
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         """Returns the winnings numbers, based on table features"""
         pass
 
     @abstractmethod
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         """Returns the losing numbers, based on table features"""
         pass
 
-    def get_push_numbers(self, table: Table) -> list[int]:
+    def get_push_numbers(self, table: Table) -> Sequence[int]:
         """Returns the push numbers, based on table features"""
-        return []
+        return _NO_NUMBERS
+
+    def get_active_numbers(self, table: Table) -> frozenset[int]:
+        """Winning, losing and push numbers"""
+        return frozenset(self.get_winning_numbers(table)).union(
+            self.get_losing_numbers(table), self.get_push_numbers(table)
+        )
 
     @abstractmethod
     def get_payout_ratio(self, table: Table) -> float:
@@ -289,18 +658,22 @@ class _SimpleBet(_WinningLosingNumbersBet, ABC):
     at instantiation and don't depend on the table.
     """
 
-    winning_numbers: list[int] = []
+    __slots__ = ()
+
+    tabulated: bool = True
+
+    winning_numbers: tuple[int, ...] = ()
     """Winning numbers for the bet"""
-    losing_numbers: list[int] = []
+    losing_numbers: tuple[int, ...] = ()
     """Losing numbers for the bet"""
     payout_ratio: int = 1
     """Payout ratio for the bet"""
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         """Returns the winning numbers (table not used here)"""
         return self.winning_numbers
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         """Returns the losing numbers (table not used here)"""
         return self.losing_numbers
 
@@ -322,23 +695,27 @@ class PassLine(_WinningLosingNumbersBet):
     the point number again before rolling a 7. Pays 1 to 1.
     """
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    __slots__ = ()
+
+    tabulated: bool = True
+
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         """Winnings numbers are 7, 11 before point is set,
         and the point number after point is set. Uses table
         to determine the point number and status.
         """
         if table.point.number is None:
-            return [7, 11]
-        return [table.point.number]
+            return _NATURALS
+        return _numbers(table.point.number)
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         """Losing numbers are 2, 3, 12 before point is set,
         and 7 after point is set. Uses table to determine the
         point number and status.
         """
         if table.point.number is None:
-            return [2, 3, 12]
-        return [7]
+            return _CRAPS
+        return _SEVEN
 
     def get_payout_ratio(self, table: Table) -> float:
         """PassLine always pays out 1:1"""
@@ -372,6 +749,10 @@ class Come(_WinningLosingNumbersBet):
     the point number. Pays 1 to 1.
     """
 
+    __slots__ = ("number",)
+
+    tabulated: bool = True
+
     def __init__(self, amount: SupportsFloat, number: int | None = None):
         super().__init__(amount)
         possible_numbers = (4, 5, 6, 7, 8, 9, 10)
@@ -380,28 +761,34 @@ class Come(_WinningLosingNumbersBet):
         else:
             self.number = None
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         """Winnings numbers are 7, 11 before the number is set,
         and the number after it is set. Number is stored within
         the bet.
         """
         if self.number is None:
-            return [7, 11]
-        return [self.number]
+            return _NATURALS
+        return _numbers(self.number)
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         """Losing numbers are 2, 3, 12 before the number is set,
         and 7 after it is set. Number is stored within
         the bet.
         """
         if self.number is None:
-            return [2, 3, 12]
-        return [7]
+            return _CRAPS
+        return _SEVEN
 
     def get_payout_ratio(self, table: Table) -> float:
         """Come always pays out 1:1"""
         return 1.0
 
+    def get_active_numbers(self, table: Table) -> frozenset[int]:
+        """Every total before the number is set, since it then moves or resolves."""
+        if self.number is None:
+            return frozenset(ALL_DICE_NUMBERS)
+        return super().get_active_numbers(table)
+
     def update_number(self, table: Table):
         """
         Update the bet's number to the first number rolled if it's in (4, 5, 6, 8, 9, 10).
@@ -448,28 +835,32 @@ class DontPass(_WinningLosingNumbersBet):
     established, the player wins by rolling a 7 before the point number. Bet pays 1 to 1.
     """
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    __slots__ = ()
+
+    tabulated: bool = True
+
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         """Winnings numbers are 2 or 3 before point is set,
         and 7 after point is set. Uses table to determine the point
         number and status.
         """
         if table.point.number is None:
-            return [2, 3]
-        return [7]
+            return _CRAPS[:2]
+        return _SEVEN
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         """Losing numbers are 7 or 11 before point is set,
         and table point number after point is set. Uses table to determine the
         point number and status.
         """
         if table.point.number is None:
-            return [7, 11]
-        return [table.point.number]
+            return _NATURALS
+        return _numbers(table.point.number)
 
-    def get_push_numbers(self, table: "Table") -> list[int]:
+    def get_push_numbers(self, table: "Table") -> Sequence[int]:
         if table.point.number is None:
-            return [12]
-        return []
+            return _CRAPS[2:]
+        return _NO_NUMBERS
 
     def get_payout_ratio(self, table: Table) -> float:
         """Don't pass always pays out 1:1"""
@@ -495,6 +886,10 @@ class DontCome(_WinningLosingNumbersBet):
     the number is rolled before a 7. Pays 1 to 1.
     """
 
+    __slots__ = ("number",)
+
+    tabulated: bool = True
+
     def __init__(self, amount: SupportsFloat, number: int | None = None):
         super().__init__(amount)
         possible_numbers = (4, 5, 6, 7, 8, 9, 10)
@@ -503,25 +898,31 @@ class DontCome(_WinningLosingNumbersBet):
         else:
             self.number = None
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         if self.number is None:
-            return [2, 3]
-        return [7]
+            return _CRAPS[:2]
+        return _SEVEN
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         if self.number is None:
-            return [7, 11]
-        return [self.number]
+            return _NATURALS
+        return _numbers(self.number)
 
-    def get_push_numbers(self, table: "Table") -> list[int]:
+    def get_push_numbers(self, table: "Table") -> Sequence[int]:
         if self.number is None:
-            return [12]
-        return []
+            return _CRAPS[2:]
+        return _NO_NUMBERS
 
     def get_payout_ratio(self, table: Table) -> float:
         """Don't Come always pays out 1:1"""
         return 1.0
 
+    def get_active_numbers(self, table: Table) -> frozenset[int]:
+        """Every total before the number is set, since it then moves or resolves."""
+        if self.number is None:
+            return frozenset(ALL_DICE_NUMBERS)
+        return super().get_active_numbers(table)
+
     def update_number(self, table: Table):
         possible_numbers = (4, 5, 6, 7, 8, 9, 10)
         if self.number is None and table.dice.total in possible_numbers:
@@ -561,6 +962,21 @@ class Odds(_WinningLosingNumbersBet):
     or "dark side" (Don't Pass/Don't Come) bet.
     """
 
+    __slots__ = ("base_type", "number", "always_working")
+
+    tabulated: bool = True
+    light_ratios: dict[int, float] = {
+        4: 2,
+        5: 3 / 2,
+        6: 6 / 5,
+        8: 6 / 5,
+        9: 3 / 2,
+        10: 2,
+    }
+    """True odds paid on the light side (X to 1) for each number."""
+    dark_ratios: dict[int, float] = {n: 1 / x for n, x in light_ratios.items()}
+    """True odds paid on the dark side (X to 1) for each number."""
+
     def __init__(
         self,
         base_type: type["PassLine | DontPass | Come | DontCome | Put"],
@@ -573,6 +989,9 @@ class Odds(_WinningLosingNumbersBet):
         self.number = number
         self.always_working = always_working
 
+    def _payout_key(self, table: Table) -> Hashable:
+        return super()._payout_key(table), self.always_working
+
     @property
     def light_side(self) -> bool:
         return issubclass(self.base_type, (PassLine, Come, Put))
@@ -582,12 +1001,14 @@ class Odds(_WinningLosingNumbersBet):
         return issubclass(self.base_type, (DontPass, DontCome))
 
     def get_result(self, table: Table) -> BetResult:
+        if self.tabulated and table.dice.outcome is not None:
+            return self._tabulated_result(table)
 
         if table.point.status == "Off" and not self.always_working:
 
-            if table.dice.total in (
-                self.get_losing_numbers(table) + self.get_winning_numbers(table)
-            ):
+            if table.dice.total in self.get_losing_numbers(
+                table
+            ) or table.dice.total in self.get_winning_numbers(table):
                 # Bet "pushes" and returns to the player
                 return BetResult(
                     amount=self.amount, remove=True, bet_amount=self.amount
@@ -595,26 +1016,23 @@ class Odds(_WinningLosingNumbersBet):
 
         return super().get_result(table)
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         if self.light_side:
-            return [self.number]
+            return _numbers(self.number)
         elif self.dark_side:
-            return [7]
+            return _SEVEN
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         if self.light_side:
-            return [7]
+            return _SEVEN
         elif self.dark_side:
-            return [self.number]
+            return _numbers(self.number)
 
     def get_payout_ratio(self, table: Table) -> float:
-        light_ratios = {4: 2, 5: 3 / 2, 6: 6 / 5, 8: 6 / 5, 9: 3 / 2, 10: 2}
-        dark_ratios = {n: 1 / x for n, x in light_ratios.items()}
-
         if self.light_side:
-            return light_ratios[self.number]
+            return self.light_ratios[self.number]
         elif self.dark_side:
-            return dark_ratios[self.number]
+            return self.dark_ratios[self.number]
 
     def is_allowed(self, player: Player) -> bool:
         """Odds are allowed if they do not exceed the table maximums.
@@ -628,9 +1046,9 @@ class Odds(_WinningLosingNumbersBet):
 
     def get_max_odds(self, table: Table) -> float:
         if self.light_side:
-            return table.settings["max_odds"][self.number]
+            return compiled_settings(table.settings).max_odds[self.number]
         elif self.dark_side:
-            return table.settings["max_dont_odds"][self.number]
+            return compiled_settings(table.settings).max_dont_odds[self.number]
         else:
             raise NotImplementedError
 
@@ -671,13 +1089,18 @@ class Odds(_WinningLosingNumbersBet):
 class Put(_SimpleBet):
     """Flat line bet on a box number; point must be ON and odds obey table policy."""
 
-    losing_numbers: list[int] = [7]
+    __slots__ = ("number",)
+
+    losing_numbers: tuple[int, ...] = (7,)
+    payout_ratio: float = 1.0
 
     def __init__(self, number: int, amount: SupportsFloat) -> None:
         super().__init__(amount)
         self.number = number
-        self.winning_numbers = [number]
-        self.payout_ratio = 1.0
+
+    @property
+    def winning_numbers(self) -> tuple[int, ...]:
+        return _numbers(self.number)
 
     def is_allowed(self, player: "Player") -> bool:
         return player.table.point == "On"
@@ -705,16 +1128,26 @@ class Place(_SimpleBet):
     Remains active until the number or a 7 is rolled.
     """
 
+    __slots__ = ("number",)
+
     payout_ratios = {4: 9 / 5, 5: 7 / 5, 6: 7 / 6, 8: 7 / 6, 9: 7 / 5, 10: 9 / 5}
     """Stores the place bet payouts: 9 to 5 on (4, 10), 7 to 5 on (5, 9), and 7 to 6 on (6, 8)."""
-    losing_numbers: list[int] = [7]
+    losing_numbers: tuple[int, ...] = (7,)
 
     def __init__(self, number: int, amount: SupportsFloat):
+        if number not in self.payout_ratios:
+            raise KeyError(number)
         super().__init__(amount)
         self.number = number
         """The placed number, which determines payout ratio"""
-        self.payout_ratio = self.payout_ratios[number]
-        self.winning_numbers = [number]
+
+    @property
+    def payout_ratio(self) -> float:
+        return self.payout_ratios[self.number]
+
+    @property
+    def winning_numbers(self) -> tuple[int, ...]:
+        return _numbers(self.number)
 
     def copy(self) -> "Bet":
         """Create a fresh copy of this bet"""
@@ -769,39 +1202,50 @@ class Buy(_SimpleBet):
     Vig (commission) may be taken on the win or upfront based on ``vig_paid_on_win``.
     """
 
+    __slots__ = ("number",)
+
+    tabulated: bool = True
+
     true_odds = {4: 2.0, 10: 2.0, 5: 1.5, 9: 1.5, 6: 1.2, 8: 1.2}
-    losing_numbers: list[int] = [7]
+    losing_numbers: tuple[int, ...] = (7,)
 
     def __init__(self, number: int, amount: SupportsFloat) -> None:
         if number not in (4, 5, 6, 8, 9, 10):
             raise ValueError(f"Invalid Buy number: {number}")
         super().__init__(amount)
         self.number = number
-        self.payout_ratio = self.true_odds[number]
-        self.winning_numbers = [number]
-        """Base amount that determines true-odds payouts."""
+
+    @property
+    def payout_ratio(self) -> float:
+        return self.true_odds[self.number]
+
+    @property
+    def winning_numbers(self) -> tuple[int, ...]:
+        return _numbers(self.number)
 
     def vig(self, table: "Table") -> float:
-        rounding, floor = _vig_policy(table.settings)
-        return _compute_vig(self.amount, rounding=rounding, floor=floor)
+        return compiled_settings(table.settings).vig(self.amount)
 
     def cost(self, table: "Table") -> float:
-        if table.settings.get("vig_paid_on_win", True):
+        settings = compiled_settings(table.settings)
+        if settings.vig_paid_on_win:
             return self.amount
-        return self.amount + self.vig(table)
+        return self.amount + settings.vig(self.amount)
 
     def get_result(self, table: "Table") -> BetResult:
+        if self.tabulated and table.dice.outcome is not None:
+            return self._tabulated_result(table)
+
         if table.dice.total == self.number:
             result_amount = self.payout_ratio * self.amount + self.amount
-            if table.settings.get("vig_paid_on_win", True):
+            if compiled_settings(table.settings).vig_paid_on_win:
                 result_amount -= self.vig(table)
             remove = True
         elif table.dice.total == 7:
             result_amount = -self.cost(table)
             remove = True
         else:
-            result_amount = 0
-            remove = False
+            return _no_action(self.amount)
         return BetResult(result_amount, remove, self.amount)
 
     def copy(self) -> "Buy":
@@ -822,39 +1266,50 @@ class Lay(_SimpleBet):
     Commission may be taken on the win or upfront based on ``vig_paid_on_win``.
     """
 
+    __slots__ = ("number",)
+
+    tabulated: bool = True
+
     true_odds = {4: 0.5, 10: 0.5, 5: 2 / 3, 9: 2 / 3, 6: 5 / 6, 8: 5 / 6}
-    winning_numbers: list[int] = [7]
+    winning_numbers: tuple[int, ...] = (7,)
 
     def __init__(self, number: int, amount: SupportsFloat) -> None:
         if number not in (4, 5, 6, 8, 9, 10):
             raise ValueError(f"Invalid Lay number: {number}")
         super().__init__(amount)
         self.number = number
-        self.payout_ratio = self.true_odds[number]
-        self.losing_numbers = [number]
-        """Base amount risked against the box number."""
+
+    @property
+    def payout_ratio(self) -> float:
+        return self.true_odds[self.number]
+
+    @property
+    def losing_numbers(self) -> tuple[int, ...]:
+        return _numbers(self.number)
 
     def vig(self, table: "Table") -> float:
-        rounding, floor = _vig_policy(table.settings)
-        return _compute_vig(self.amount, rounding=rounding, floor=floor)
+        return compiled_settings(table.settings).vig(self.amount)
 
     def cost(self, table: "Table") -> float:
-        if table.settings.get("vig_paid_on_win", True):
+        settings = compiled_settings(table.settings)
+        if settings.vig_paid_on_win:
             return self.amount
-        return self.amount + self.vig(table)
+        return self.amount + settings.vig(self.amount)
 
     def get_result(self, table: "Table") -> BetResult:
+        if self.tabulated and table.dice.outcome is not None:
+            return self._tabulated_result(table)
+
         if table.dice.total == 7:
             result_amount = self.payout_ratio * self.amount + self.amount
-            if table.settings.get("vig_paid_on_win", True):
+            if compiled_settings(table.settings).vig_paid_on_win:
                 result_amount -= self.vig(table)
             remove = True
         elif table.dice.total == self.number:
             result_amount = -self.cost(table)
             remove = True
         else:
-            result_amount = 0
-            remove = False
+            return _no_action(self.amount)
         return BetResult(result_amount, remove, self.amount)
 
     def copy(self) -> "Lay":
@@ -882,16 +1337,20 @@ class Field(_WinningLosingNumbersBet):
     "field_payouts":, which default to 2 to 1 for (2, 12) and 1 to 1 otherwise.
     """
 
-    winning_numbers = [2, 3, 4, 9, 10, 11, 12]
+    __slots__ = ()
+
+    tabulated: bool = True
+
+    winning_numbers = (2, 3, 4, 9, 10, 11, 12)
     """Field wins on 2, 3, 4, 9, 10, 11, or 12"""
-    losing_numbers = [5, 6, 7, 8]
+    losing_numbers = (5, 6, 7, 8)
     """Field loses on 5, 6, 7, or 8"""
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         """Returns the winning numbers (table not used here)"""
         return self.winning_numbers
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         """Returns the losing numbers (table not used here)"""
         return self.losing_numbers
 
@@ -899,8 +1358,9 @@ class Field(_WinningLosingNumbersBet):
         """Returns the payout ratio (X to 1) based on table settings
         (:func:`~crapssim.table.TableSettings`, "field_payouts":
         """
-        if table.dice.total in table.settings["field_payouts"]:
-            return float(table.settings["field_payouts"][table.dice.total])
+        payouts = compiled_settings(table.settings).field_payouts
+        if 0 <= table.dice.total < len(payouts):
+            return payouts[table.dice.total]
         return 0.0
 
 
@@ -915,16 +1375,20 @@ class CAndE(_WinningLosingNumbersBet):
     Loses on all other numbers.
     """
 
-    winning_numbers: list[int] = [2, 3, 11, 12]
+    __slots__ = ()
+
+    tabulated: bool = True
+
+    winning_numbers: tuple[int, ...] = (2, 3, 11, 12)
     """Winning numbers are (2, 3, 11, 12)."""
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2, 3, 11, 12})
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {2, 3, 11, 12}))
     """Losing numbers are anything besides (2, 3, 11, 12)."""
 
-    def get_winning_numbers(self, table: Table) -> list[int]:
+    def get_winning_numbers(self, table: Table) -> Sequence[int]:
         """Returns the winning numbers (table not used here)"""
         return self.winning_numbers
 
-    def get_losing_numbers(self, table: Table) -> list[int]:
+    def get_losing_numbers(self, table: Table) -> Sequence[int]:
         """Returns the losing numbers (table not used here)"""
         return self.losing_numbers
 
@@ -949,8 +1413,10 @@ class Any7(_SimpleBet):
     Offers a 4 to 1 payout and loses on all other numbers.
     """
 
-    winning_numbers: list[int] = [7]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {7})
+    __slots__ = ()
+
+    winning_numbers: tuple[int, ...] = (7,)
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {7}))
     """Losing number is anything except 7."""
     payout_ratio: int = 4
 
@@ -963,8 +1429,10 @@ class Two(_SimpleBet):
     Offers a 30 to 1 payout and loses on all other numbers.
     """
 
-    winning_numbers: list[int] = [2]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2})
+    __slots__ = ()
+
+    winning_numbers: tuple[int, ...] = (2,)
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {2}))
     """Losing number is anything except 2."""
     payout_ratio: int = 30
 
@@ -977,8 +1445,10 @@ class Three(_SimpleBet):
     Offers a 15 to 1 payout and loses on all other numbers.
     """
 
-    winning_numbers: list[int] = [3]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {3})
+    __slots__ = ()
+
+    winning_numbers: tuple[int, ...] = (3,)
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {3}))
     """Losing number is anything except 3."""
     payout_ratio: int = 15
 
@@ -991,8 +1461,10 @@ class Yo(_SimpleBet):
     Offers a 15 to 1 payout and loses on all other numbers.
     """
 
-    winning_numbers: list[int] = [11]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {11})
+    __slots__ = ()
+
+    winning_numbers: tuple[int, ...] = (11,)
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {11}))
     """Losing number is anything except 11."""
     payout_ratio: int = 15
 
@@ -1005,8 +1477,10 @@ class Boxcars(_SimpleBet):
     Offers a 30 to 1 payout and loses on all other numbers.
     """
 
-    winning_numbers: list[int] = [12]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {12})
+    __slots__ = ()
+
+    winning_numbers: tuple[int, ...] = (12,)
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {12}))
     """Losing number is anything except 12."""
     payout_ratio: int = 30
 
@@ -1019,8 +1493,10 @@ class AnyCraps(_SimpleBet):
     Offers a 7 to 1 payout and loses on all other numbers.
     """
 
-    winning_numbers: list[int] = [2, 3, 12]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2, 3, 12})
+    __slots__ = ()
+
+    winning_numbers: tuple[int, ...] = (2, 3, 12)
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {2, 3, 12}))
     """Losing number is anything except (2, 3, 12)."""
     payout_ratio: int = 7
 
@@ -1028,16 +1504,20 @@ class AnyCraps(_SimpleBet):
 class Horn(_WinningLosingNumbersBet):
     """One-roll bet split across 2, 3, 11, and 12; loses on all other totals."""
 
-    winning_numbers: list[int] = [2, 3, 11, 12]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2, 3, 11, 12})
+    __slots__ = ()
+
+    tabulated: bool = True
+
+    winning_numbers: tuple[int, ...] = (2, 3, 11, 12)
+    losing_numbers: tuple[int, ...] = tuple(sorted(ALL_DICE_NUMBERS - {2, 3, 11, 12}))
 
     def __init__(self, amount: SupportsFloat) -> None:
         super().__init__(amount)
 
-    def get_winning_numbers(self, table: "Table") -> list[int]:
+    def get_winning_numbers(self, table: "Table") -> Sequence[int]:
         return self.winning_numbers
 
-    def get_losing_numbers(self, table: "Table") -> list[int]:
+    def get_losing_numbers(self, table: "Table") -> Sequence[int]:
         return self.losing_numbers
 
     def get_payout_ratio(self, table: "Table") -> float:
@@ -1061,16 +1541,22 @@ class Horn(_WinningLosingNumbersBet):
 class World(_WinningLosingNumbersBet):
     """One-roll bet covering Horn numbers plus 7; pays break-even on 7."""
 
-    winning_numbers: list[int] = [2, 3, 7, 11, 12]
-    losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2, 3, 7, 11, 12})
+    __slots__ = ()
+
+    tabulated: bool = True
+
+    winning_numbers: tuple[int, ...] = (2, 3, 7, 11, 12)
+    losing_numbers: tuple[int, ...] = tuple(
+        sorted(ALL_DICE_NUMBERS - {2, 3, 7, 11, 12})
+    )
 
     def __init__(self, amount: SupportsFloat) -> None:
         super().__init__(amount)
 
-    def get_winning_numbers(self, table: "Table") -> list[int]:
+    def get_winning_numbers(self, table: "Table") -> Sequence[int]:
         return self.winning_numbers
 
-    def get_losing_numbers(self, table: "Table") -> list[int]:
+    def get_losing_numbers(self, table: "Table") -> Sequence[int]:
         return self.losing_numbers
 
     def get_payout_ratio(self, table: "Table") -> float:
@@ -1097,13 +1583,12 @@ class World(_WinningLosingNumbersBet):
 class Big6(_SimpleBet):
     """Even-money bet that wins on 6 before 7."""
 
-    winning_numbers: list[int] = [6]
-    losing_numbers: list[int] = [7]
-    payout_ratio: float = 1.0
+    __slots__ = ()
 
-    def __init__(self, amount: SupportsFloat) -> None:
-        super().__init__(amount)
-        self.number = 6
+    number: int = 6
+    winning_numbers: tuple[int, ...] = (6,)
+    losing_numbers: tuple[int, ...] = (7,)
+    payout_ratio: float = 1.0
 
     def __repr__(self) -> str:
         return f"Big6(amount={self.amount})"
@@ -1112,13 +1597,12 @@ class Big6(_SimpleBet):
 class Big8(_SimpleBet):
     """Even-money bet that wins on 8 before 7."""
 
-    winning_numbers: list[int] = [8]
-    losing_numbers: list[int] = [7]
-    payout_ratio: float = 1.0
+    __slots__ = ()
 
-    def __init__(self, amount: SupportsFloat) -> None:
-        super().__init__(amount)
-        self.number = 8
+    number: int = 8
+    winning_numbers: tuple[int, ...] = (8,)
+    losing_numbers: tuple[int, ...] = (7,)
+    payout_ratio: float = 1.0
 
     def __repr__(self) -> str:
         return f"Big8(amount={self.amount})"
@@ -1137,26 +1621,41 @@ class HardWay(Bet):
     the number is rolled in a "soft" way.
     """
 
+    __slots__ = ("number",)
+
+    tabulated: bool = True
+
     payout_ratios = {4: 7, 6: 9, 8: 9, 10: 7}
     """Payout ratios vary: 7 to 1 for hard 4 or 10, 9 to 1 for hard 6 or 8."""
 
     def __init__(self, number: int, amount: SupportsFloat) -> None:
+        if number not in self.payout_ratios:
+            raise KeyError(number)
         super().__init__(amount)
         self.number: int = number
-        self.payout_ratio: float = self.payout_ratios[number]
+
+    @property
+    def payout_ratio(self) -> float:
+        return self.payout_ratios[self.number]
 
     def get_result(self, table: Table) -> BetResult:
-        if table.dice.result == self.winning_result:
+        if self.tabulated and table.dice.outcome is not None:
+            return self._tabulated_result(table)
+
+        if table.dice.is_hard and table.dice.total == self.number:
             result_amount = self.payout_ratio * self.amount + self.amount
             should_remove = True
         elif table.dice.total in (7, self.number):
             result_amount = -1 * self.amount
             should_remove = True
         else:
-            result_amount = 0
-            should_remove = False
+            return _no_action(self.amount)
         return BetResult(result_amount, should_remove, self.amount)
 
+    def get_active_numbers(self, table: Table) -> frozenset[int]:
+        """The hard way number (made either way) and 7"""
+        return frozenset((7, self.number))
+
     @property
     def winning_result(self) -> tuple[int, int]:
         """Returns the dice result that wins, e.g. (2, 2) for Hard 4."""
@@ -1193,12 +1692,19 @@ class Hop(Bet):
     - Hard hop: higher payout (default 30 to 1)
     """
 
+    __slots__ = ("result",)
+
+    tabulated: bool = True
+
     def __init__(self, result: tuple[int, int], amount: SupportsFloat) -> None:
         super().__init__(amount)
         self.result: tuple[int, int] = tuple(sorted(result))
 
     def get_result(self, table: Table) -> BetResult:
-        if table.dice.result in self.winning_results:
+        if self.tabulated and table.dice.outcome is not None:
+            return self._tabulated_result(table)
+
+        if table.dice.pair == self.result:
             result_amount = self.payout_ratio(table) * self.amount + self.amount
             should_remove = True
         else:
@@ -1219,7 +1725,7 @@ class Hop(Bet):
 
     def payout_ratio(self, table: Table) -> int:
         payout_type = "easy" if self.is_easy else "hard"
-        return table.settings["hop_payouts"][payout_type]
+        return compiled_settings(table.settings).hop_payouts[payout_type]
 
     def copy(self) -> "Bet":
         """Create a fresh copy of this bet"""
@@ -1252,6 +1758,10 @@ class Fire(Bet):
     - Automatically ends when all 6 points are made or a 7 is rolled while the point is On.
     """
 
+    __slots__ = ("points_made", "ended")
+
+    _set_attributes = ("points_made",)
+
     def __init__(self, amount: float):
         super().__init__(amount)
         self.points_made: set[int] = set()
@@ -1260,7 +1770,7 @@ class Fire(Bet):
     def get_result(self, table: Table) -> BetResult:
 
         if table.point.status == "Off":
-            return BetResult(amount=0, remove=False, bet_amount=self.amount)
+            return _no_action(self.amount)
 
         if table.dice.total == table.point.number:
             self.points_made.add(table.point.number)
@@ -1270,16 +1780,22 @@ class Fire(Bet):
         n_points_made = len(self.points_made)
         ended = table.dice.total == 7 or len(self.points_made) == 6
 
-        if ended and n_points_made in table.settings["fire_payouts"]:
-            payout_ratio = table.settings["fire_payouts"][n_points_made]
+        payout_ratio = compiled_settings(table.settings).fire_payouts[n_points_made]
+        if ended and payout_ratio is not None:
             result_amount = payout_ratio * self.amount + self.amount
-        elif ended and n_points_made not in table.settings["fire_payouts"]:
+        elif ended:
             result_amount = -1 * self.amount
         else:
-            result_amount = 0
+            return _no_action(self.amount)
 
         return BetResult(result_amount, remove=ended, bet_amount=self.amount)
 
+    def get_active_numbers(self, table: Table) -> frozenset[int]:
+        """Nothing while the point is Off, the point number and 7 while it is On"""
+        if table.point.status == "Off":
+            return frozenset()
+        return frozenset((7, table.point.number))
+
     def is_removable(self, table: Table) -> bool:
         """Fire bet is removable only if there is a new shooter.
 
@@ -1303,8 +1819,12 @@ class Fire(Bet):
 class _ATSBet(Bet):
     """Class representing ATS (All, Tall, Small) bets, not a usable bet by itself."""
 
+    __slots__ = ("rolled_numbers",)
+
     numbers: list[int] = []
     type: str = "_ATSBet"
+    _set_attributes = ("rolled_numbers",)
+    placement_totals = frozenset({7})
 
     def __init__(self, amount: float):
         super().__init__(amount)
@@ -1316,18 +1836,21 @@ class _ATSBet(Bet):
             self.rolled_numbers.add(table.dice.total)
 
         if self.numbers == list(self.rolled_numbers):
-            payout_ratio = table.settings["ATS_payouts"][self.type]
+            payout_ratio = compiled_settings(table.settings).ATS_payouts[self.type]
             result_amount = payout_ratio * self.amount + self.amount
             should_remove = True
         elif table.dice.total == 7:
             result_amount = -1 * self.amount
             should_remove = True
         else:
-            result_amount = 0
-            should_remove = False
+            return _no_action(self.amount)
 
         return BetResult(result_amount, should_remove, self.amount)
 
+    def get_active_numbers(self, table: Table) -> frozenset[int]:
+        """The bet's numbers and 7"""
+        return frozenset(self.numbers + [7])
+
     def is_removable(self, table: Table) -> bool:
         """All/Tall/Small bets are removable only if the last roll was a 7
         (or starting a round, with a new shooter).
@@ -1357,6 +1880,8 @@ class All(_ATSBet):
     (["ATS_payouts"]["all"]), which defaults to 150 to 1.
     """
 
+    __slots__ = ()
+
     type: str = "all"
     numbers: list[int] = [2, 3, 4, 5, 6, 8, 9, 10, 11, 12]
 
@@ -1371,6 +1896,8 @@ class Tall(_ATSBet):
     (["ATS_payouts"]["tall"]), which defaults to 30 to 1.
     """
 
+    __slots__ = ()
+
     type: str = "tall"
     numbers: list[int] = [8, 9, 10, 11, 12]
 
@@ -1385,5 +1912,7 @@ class Small(_ATSBet):
     (["ATS_payouts"]["small"]), which defaults to 30.
     """
 
+    __slots__ = ()
+
     type: str = "small"
     numbers: list[int] = [2, 3, 4, 5, 6]
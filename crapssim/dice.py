@@ -1,72 +1,659 @@
-"""
-The dice are used by the craps Table for keeping track of the latest roll
-and the total number of rolls so far. The dice object is mostly handled
-internally, but advanced users may access it (through the Table, as table.dice)
-for new bets or strategies as needed.
-"""
-
-from typing import Generator, Iterable, TypeAlias
-
-import numpy as np
-
-DicePair: TypeAlias = tuple[int, int]
-"""Pair of dice represented as (die_one, die_two)."""
-
-DicePairInput: TypeAlias = Iterable[int]
-"""Pair of dice represented as an iterable of two integers."""
-
-
-class Dice:
-    """
-    Simulate the rolling of a dice.
-
-    Args:
-        seed (int): The seed passed to the random number generator.
-    """
-
-    def __init__(self, seed=None) -> None:
-        self._result: DicePairInput | None = None
-        self.n_rolls: int = 0
-        """Number of rolls for the dice"""
-        self.rng: Generator = np.random.default_rng(seed)
-        """Random number generated used when rolling"""
-
-    @property
-    def total(self) -> int:
-        """Sum of dice outcome, e.g. 8 for (2, 6)"""
-        if self._result is not None:
-            return sum(self.result)
-
-    @property
-    def result(self) -> DicePair:
-        """Most recent outcome of the roll of two dice, e.g. (2, 6)"""
-        if self._result is not None:
-            return tuple(self._result)
-
-    @result.setter
-    def result(self, value: DicePairInput) -> DicePair:
-        # Allows setting of result, used for some tests, but not recommended
-        # NOTE: no checking is done here, so use with caution
-        # NOTE: this does not increment the number of rolls
-        self._result = value
-
-    def roll(self) -> None:
-        """
-        Randomly roll the dice
-
-        The randomness of the dice is based on numpy.random,
-        which uses the PCG-64 pseudo-random number generation
-        (see numpy.random.PCG64`).
-        """
-        self.n_rolls += 1
-        self._result = self.rng.integers(1, 7, size=2).tolist()
-
-    def fixed_roll(self, outcome: DicePairInput) -> None:
-        """
-        Roll the dice with a specified outcome
-
-        Args:
-            outcome: The desired dice result to roll
-        """
-        self.n_rolls += 1
-        self._result = outcome
+"""
+The dice are used by the craps Table for keeping track of the latest roll
+and the total number of rolls so far. The dice object is mostly handled
+internally, but advanced users may access it (through the Table, as table.dice)
+for new bets or strategies as needed.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Generator, Iterable, TypeAlias
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+if TYPE_CHECKING:
+    from crapssim.tape import RollRecorder
+
+DicePair: TypeAlias = tuple[int, int]
+"""Pair of dice represented as (die_one, die_two)."""
+
+DicePairInput: TypeAlias = Iterable[int]
+"""Pair of dice represented as an iterable of two integers."""
+
+DEFAULT_BUFFER_SIZE: int = 65_536
+"""Suggested number of rolls drawn per block for buffered dice."""
+
+DICE_PAIRS: tuple[DicePair, ...] = tuple(
+    (d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)
+)
+"""All 36 dice pairs, indexed by outcome index ``6 * (d1 - 1) + (d2 - 1)``."""
+
+OUTCOME_TOTALS: tuple[int, ...] = tuple(d1 + d2 for d1, d2 in DICE_PAIRS)
+"""Dice total for each outcome index, e.g. ``OUTCOME_TOTALS[0] == 2``."""
+
+OUTCOME_IS_HARD: tuple[bool, ...] = tuple(d1 == d2 for d1, d2 in DICE_PAIRS)
+"""Whether each outcome index is a pair (both dice showing the same value)."""
+
+OUTCOME_SORTED_PAIRS: tuple[DicePair, ...] = tuple(
+    (min(pair), max(pair)) for pair in DICE_PAIRS
+)
+"""Dice pair with the lower die first for each outcome index, e.g. (2, 6) for (6, 2)."""
+
+_DICE_PAIRS_ARRAY: np.ndarray = np.array(DICE_PAIRS, dtype=np.uint8)
+_DICE_PAIRS_ARRAY.flags.writeable = False
+_OUTCOME_TOTALS_ARRAY: np.ndarray = np.array(OUTCOME_TOTALS)
+
+_OUTCOME_RECORDS: tuple[tuple[int, DicePair, int, bool, DicePair], ...] = tuple(
+    zip(range(36), DICE_PAIRS, OUTCOME_TOTALS, OUTCOME_IS_HARD, OUTCOME_SORTED_PAIRS)
+)
+_NO_OUTCOME_RECORD = (None, None, None, None, None)
+
+
+def outcome_index(outcome: DicePairInput) -> int:
+    """Return the outcome index (0 to 35) of a dice pair, e.g. 7 for (2, 2).
+
+    Args:
+        outcome: Dice pair, with each die in 1 to 6.
+
+    Raises:
+        ValueError: If the outcome is not a valid pair of dice.
+    """
+    d1, d2 = outcome
+    if d1 not in (1, 2, 3, 4, 5, 6) or d2 not in (1, 2, 3, 4, 5, 6):
+        raise ValueError(f"Invalid dice outcome: {tuple(outcome)}")
+    return 6 * int(d1) + int(d2) - 7
+
+
+def session_seed(root_seed: int, session_index: int) -> np.random.SeedSequence:
+    """Return the seed for session ``session_index`` of the stream ``root_seed``.
+
+    This is the ``session_index``-th child of ``SeedSequence(root_seed).spawn``,
+    computed directly, so a session always gets the same dice no matter how many
+    sessions are spawned, how they are split between workers, or in what order
+    they run.
+
+    Args:
+        root_seed: Seed for the whole batch of sessions.
+        session_index: Position of the session in the batch (0, 1, 2, ...).
+    """
+    if session_index < 0:
+        raise ValueError(f"session_index must be non-negative, got {session_index}")
+    return np.random.SeedSequence(root_seed, spawn_key=(session_index,))
+
+
+def _outcome_record(outcome: DicePairInput) -> tuple:
+    """Return the outcome record of a dice pair.
+
+    Pairs outside of 1 to 6 (sometimes used in tests to force a total) get a
+    record with no outcome index.
+    """
+    d1, d2 = outcome
+    if d1 in (1, 2, 3, 4, 5, 6) and d2 in (1, 2, 3, 4, 5, 6):
+        return _OUTCOME_RECORDS[6 * int(d1) + int(d2) - 7]
+    return (None, (d1, d2), d1 + d2, d1 == d2, (min(d1, d2), max(d1, d2)))
+
+
+def _normalized_weights(weights: ArrayLike, size: int, name: str) -> np.ndarray:
+    """Validate non-negative weights and scale them to sum to one."""
+    weights = np.asarray(weights, dtype=np.float64).ravel()
+    if weights.shape != (size,):
+        raise ValueError(f"{name} must have {size} weights, got {weights.size}")
+    if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+        raise ValueError(f"{name} must be finite and non-negative")
+    total = weights.sum()
+    if total <= 0:
+        raise ValueError(f"{name} must have a positive sum")
+    return weights / total
+
+
+class DiceModel(ABC):
+    """
+    Probability distribution of the 36 dice outcomes
+
+    A model exposes its exact :attr:`probabilities`, indexed by outcome index
+    (see :data:`DICE_PAIRS`), so analytic tools can use the same distribution as
+    the simulation, and draws blocks of outcome indices with :meth:`sample`.
+
+    The default :meth:`sample` uses Walker's alias method: one uniform integer
+    and one uniform float per roll, vectorized over the whole block, so any
+    distribution costs the same to sample.
+    """
+
+    _alias_table: tuple[np.ndarray, np.ndarray] | None = None
+
+    @property
+    @abstractmethod
+    def probabilities(self) -> np.ndarray:
+        """Read-only array of the probability of each of the 36 outcomes."""
+        pass
+
+    def total_probabilities(self) -> dict[int, float]:
+        """Return the probability of each dice total, e.g. ``{2: 1/36, ...}``."""
+        totals = np.bincount(OUTCOME_TOTALS, weights=self.probabilities)
+        return {total: float(totals[total]) for total in range(2, 13)}
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Draw ``size`` outcome indices.
+
+        Args:
+            rng: Random number generator to draw from.
+            size: Number of rolls to draw.
+
+        Returns:
+            np.ndarray: Integer array of outcome indices (0 to 35).
+        """
+        if self._alias_table is None:
+            self._alias_table = self._build_alias_table()
+        accept, alias = self._alias_table
+        columns = rng.integers(0, 36, size=size)
+        return np.where(rng.random(size) < accept[columns], columns, alias[columns])
+
+    def _build_alias_table(self) -> tuple[np.ndarray, np.ndarray]:
+        """Build the acceptance and alias columns (Vose's construction)."""
+        scaled = list(self.probabilities * 36)
+        accept = np.ones(36)
+        alias = np.arange(36)
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            i, j = small.pop(), large.pop()
+            accept[i] = scaled[i]
+            alias[i] = j
+            scaled[j] -= 1 - scaled[i]
+            (small if scaled[j] < 1 else large).append(j)
+        return accept, alias
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class UniformDice(DiceModel):
+    """Two fair, independent dice (the default model).
+
+    Outcomes are sampled as pairs of faces rather than with the alias method, so
+    the dice keep rolling the same sequence for a given seed.
+    """
+
+    _probabilities: np.ndarray = np.full(36, 1 / 36)
+    _probabilities.flags.writeable = False
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._probabilities
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        block = rng.integers(1, 7, size=(size, 2))
+        return 6 * block[:, 0] + block[:, 1] - 7
+
+
+class FaceWeightedDice(DiceModel):
+    """Two independent dice with weighted faces.
+
+    Args:
+        die_one: Relative weights of faces 1 to 6 of the first die.
+        die_two: Relative weights of faces 1 to 6 of the second die. If None,
+            the second die is weighted like the first.
+    """
+
+    def __init__(self, die_one: ArrayLike, die_two: ArrayLike | None = None) -> None:
+        self.die_one: np.ndarray = _normalized_weights(die_one, 6, "die_one")
+        self.die_two: np.ndarray = (
+            self.die_one
+            if die_two is None
+            else _normalized_weights(die_two, 6, "die_two")
+        )
+        self._probabilities = np.outer(self.die_one, self.die_two).ravel()
+        self._probabilities.flags.writeable = False
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._probabilities
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(die_one={self.die_one.tolist()}, "
+            f"die_two={self.die_two.tolist()})"
+        )
+
+
+class OutcomeTableDice(DiceModel):
+    """Arbitrary weights for each of the 36 dice outcomes.
+
+    Args:
+        weights: Relative weight of each outcome, either 36 values in outcome
+            index order or a 6x6 table where ``weights[d1 - 1][d2 - 1]`` is the
+            weight of ``(d1, d2)``.
+    """
+
+    def __init__(self, weights: ArrayLike) -> None:
+        self._probabilities = _normalized_weights(weights, 36, "weights")
+        self._probabilities.flags.writeable = False
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._probabilities
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(weights={self._probabilities.tolist()})"
+
+
+class Dice:
+    """
+    Simulate the rolling of a dice.
+
+    By default every call to :meth:`roll` asks the random number generator for
+    one new pair. With ``buffer_size`` set, the dice instead draw rolls in blocks
+    of ``buffer_size`` pairs (stored as a ``uint8`` array) and hand them out one
+    at a time, which removes most of the per-roll generator overhead. Buffered
+    dice produce exactly the same sequence of rolls as unbuffered dice with the
+    same seed, whatever the block size, so results stay reproducible.
+
+    Each roll is stored as a compact outcome record, computed once per roll and
+    exposed as plain attributes: :attr:`outcome` (an index from 0 to 35 that can
+    key lookup tables, see :data:`OUTCOME_TOTALS`), :attr:`total`,
+    :attr:`is_hard`, :attr:`pair` and :attr:`result`. Before the first roll all
+    of these are None.
+
+    For batches of sessions that may run in parallel, use
+    :meth:`from_seed_stream` rather than ad-hoc integer seeds.
+
+    Seekable dice (``seekable=True``) split the stream into blocks of
+    ``buffer_size`` rolls, where block ``j`` is drawn from the seeded PCG-64
+    generator jumped ahead ``j`` times (see ``numpy.random.PCG64.jumped``).
+    Because any block can be reached without generating the ones before it,
+    :meth:`seek` can put the dice at roll ``k`` of the stream directly, which
+    lets one long run be cut into contiguous segments. Seekable dice roll a
+    different (but equally random) sequence than sequential dice with the same
+    seed.
+
+    Biased dice are modelled by passing a :class:`DiceModel`, such as
+    :class:`FaceWeightedDice` or :class:`OutcomeTableDice`.
+
+    Antithetic dice (``antithetic=True``) turn every face ``f`` drawn from the
+    stream into ``7 - f``. Dice with the same seed, one antithetic and one not,
+    roll the same distribution but are negatively correlated, which can be used
+    to reduce the variance of estimates (see :func:`crapssim.batch.run_sessions`).
+
+    Args:
+        seed (int | SeedSequence): The seed passed to the random number generator.
+        buffer_size (int | None): Number of rolls to draw per block, e.g.
+            :data:`DEFAULT_BUFFER_SIZE`. If None (default), draw one roll at a
+            time, unless the dice are seekable or use a non-uniform model, which
+            use :data:`DEFAULT_BUFFER_SIZE`.
+        seekable (bool): If True, use the seekable block layout described above.
+            The block size is part of the stream, so seeking only reproduces rolls
+            from dice with the same seed and ``buffer_size``.
+        model (DiceModel | None): Distribution of the outcomes. If None
+            (default), two fair dice (:class:`UniformDice`).
+        antithetic (bool): If True, map every face ``f`` to ``7 - f``. The model
+            must be symmetric under this mapping.
+    """
+
+    def __init__(
+        self,
+        seed=None,
+        buffer_size: int | None = None,
+        seekable: bool = False,
+        model: DiceModel | None = None,
+        antithetic: bool = False,
+    ) -> None:
+        if model is None:
+            model = UniformDice()
+        if antithetic and not np.allclose(
+            model.probabilities, model.probabilities[::-1]
+        ):
+            raise ValueError(f"{model} is not symmetric under the face map f -> 7 - f")
+        if buffer_size is None and (seekable or not isinstance(model, UniformDice)):
+            buffer_size = DEFAULT_BUFFER_SIZE
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError(f"buffer_size must be positive, got {buffer_size}")
+        self.outcome: int | None = None
+        """Outcome index of the most recent roll, from 0 to 35"""
+        self._result: DicePair | None = None
+        self.total: int | None = None
+        """Sum of dice outcome, e.g. 8 for (2, 6)"""
+        self.is_hard: bool | None = None
+        """Whether both dice show the same value, e.g. True for (4, 4)"""
+        self.pair: DicePair | None = None
+        """Dice outcome with the lower die first, e.g. (2, 6) for (6, 2)"""
+        self.n_rolls: int = 0
+        """Number of rolls for the dice"""
+        self.rng: Generator = np.random.default_rng(seed)
+        """Random number generated used when rolling"""
+        self.buffer_size: int | None = buffer_size
+        """Number of rolls drawn per block, or None if rolling one at a time"""
+        self.seekable: bool = seekable
+        """Whether the dice use the seekable block layout, see :meth:`seek`"""
+        self.model: DiceModel = model
+        """Distribution the dice are rolled from"""
+        self.antithetic: bool = antithetic
+        """Whether every face ``f`` of the stream is rolled as ``7 - f``"""
+        self.recorder: "RollRecorder | None" = None
+        """Recorder that every roll is appended to, see :mod:`crapssim.tape`"""
+        self._buffer: np.ndarray = np.empty((0, 2), dtype=np.uint8)
+        self._buffer_outcomes: list[int] = []
+        self._buffer_index: int = 0
+        self._buffer_start_state: dict | None = None
+        self._root_bit_generator: np.random.PCG64 | None = None
+        self._block: int = -1
+        self._skip_tables: dict[tuple[DiceModel, frozenset[int]], tuple] = {}
+        if seekable:
+            self._root_bit_generator = np.random.PCG64(seed)
+
+    @classmethod
+    def from_seed_stream(
+        cls,
+        root_seed: int,
+        session_index: int,
+        buffer_size: int | None = None,
+        antithetic: bool = False,
+    ) -> "Dice":
+        """Create the dice for session ``session_index`` of the stream ``root_seed``.
+
+        See :func:`session_seed`.
+
+        Args:
+            root_seed: Seed for the whole batch of sessions.
+            session_index: Position of the session in the batch (0, 1, 2, ...).
+            buffer_size: Number of rolls to draw per block, see :class:`Dice`.
+            antithetic: If True, roll the antithetic twin of the session's dice.
+
+        Returns:
+            Dice: Dice seeded for that session.
+        """
+        return cls(
+            session_seed(root_seed, session_index),
+            buffer_size=buffer_size,
+            antithetic=antithetic,
+        )
+
+    def reseed(self, seed) -> None:
+        """
+        Continue the dice from a new random stream
+
+        The model, block layout, antithetic mapping, roll count and most recent
+        result are kept; only the rolls still to come change. Seekable dice
+        continue from position :attr:`n_rolls` of the new stream.
+
+        Args:
+            seed: Seed for the new stream, anything ``numpy.random.default_rng``
+                accepts, e.g. a :func:`session_seed`.
+        """
+        self._buffer_outcomes = []
+        self._buffer_index = 0
+        if self.seekable:
+            self._root_bit_generator = np.random.PCG64(seed)
+            self.seek(self.n_rolls)
+        else:
+            self.rng = np.random.default_rng(seed)
+
+    @property
+    def result(self) -> DicePair:
+        """Most recent outcome of the roll of two dice, e.g. (2, 6)"""
+        return self._result
+
+    @result.setter
+    def result(self, value: DicePairInput | None) -> None:
+        # Allows setting of result, used for some tests, but not recommended
+        # NOTE: no checking is done here, so use with caution
+        # NOTE: this does not increment the number of rolls
+        if value is None:
+            self._set_record(_NO_OUTCOME_RECORD)
+        else:
+            self._set_record(_outcome_record(value))
+
+    def _set_record(self, record: tuple) -> None:
+        """Unpack an outcome record into the per-roll attributes."""
+        self.outcome, self._result, self.total, self.is_hard, self.pair = record
+
+    def roll(self) -> None:
+        """
+        Randomly roll the dice
+
+        The randomness of the dice is based on numpy.random,
+        which uses the PCG-64 pseudo-random number generation
+        (see numpy.random.PCG64`).
+        """
+        self.n_rolls += 1
+        if self.buffer_size is None:
+            d1, d2 = self.rng.integers(1, 7, size=2).tolist()
+            index = 6 * d1 + d2 - 7
+            if self.antithetic:
+                index = 35 - index
+        else:
+            if self._buffer_index == len(self._buffer_outcomes):
+                self._fill_buffer()
+            index = self._buffer_outcomes[self._buffer_index]
+            self._buffer_index += 1
+        if self.recorder is not None:
+            self.recorder.append(index)
+        self.outcome, self._result, self.total, self.is_hard, self.pair = (
+            _OUTCOME_RECORDS[index]
+        )
+
+    def _fill_buffer(self) -> None:
+        """Draw the next block of ``buffer_size`` rolls."""
+        if self.seekable:
+            self._load_block(self._block + 1)
+            return
+        self._buffer_start_state = self.rng.bit_generator.state
+        self._draw_block()
+
+    def _load_block(self, block: int) -> None:
+        """Draw block ``block`` of a seekable stream from its jumped generator."""
+        self.rng = np.random.Generator(self._root_bit_generator.jumped(block))
+        self._block = block
+        self._draw_block()
+
+    def _draw_block(self) -> None:
+        """Draw ``buffer_size`` rolls from :attr:`rng` into the buffer.
+
+        For uniform dice the generator consumes exactly the same random stream
+        as ``buffer_size`` single rolls would. The pairs are stored compactly as
+        ``uint8``.
+        """
+        outcomes = self.model.sample(self.rng, self.buffer_size)
+        if self.antithetic:
+            outcomes = 35 - outcomes
+        self._buffer = _DICE_PAIRS_ARRAY[outcomes]
+        self._buffer_outcomes = outcomes.tolist()
+        self._buffer_index = 0
+
+    def skip_inert(self, active_totals: frozenset[int], limit: int | float) -> int:
+        """
+        Roll past a run of rolls whose totals are not in ``active_totals``
+
+        The length of the run is drawn from its geometric distribution under
+        :attr:`model`, capped at ``limit``, and :attr:`n_rolls` advances by that
+        many rolls at once. If any rolls were skipped, the result becomes the last
+        skipped roll, drawn from the model conditioned on being inert. When fewer
+        than ``limit`` rolls were skipped the next roll is active and should be
+        drawn with :meth:`sample_active`.
+
+        Skipping draws from :attr:`rng` directly, so the dice roll a different
+        (but identically distributed) sequence than when rolling one at a time,
+        and skipped rolls are not recorded.
+
+        Args:
+            active_totals: Totals that end the run of inert rolls.
+            limit: Maximum number of rolls to skip.
+
+        Returns:
+            int: The number of rolls skipped.
+        """
+        p_active, _, inert_cumulative = self._skip_table(active_totals)
+        if p_active <= 0:
+            n_skipped = limit
+        else:
+            n_skipped = min(int(self.rng.geometric(p_active)) - 1, limit)
+        if n_skipped > 0:
+            self.n_rolls += n_skipped
+            self._set_record(_OUTCOME_RECORDS[self._draw_from(inert_cumulative)])
+        return n_skipped
+
+    def sample_active(self, active_totals: frozenset[int]) -> DicePair:
+        """
+        Draw the next roll conditioned on its total being in ``active_totals``
+
+        The pair is only drawn, not rolled: pass it to :meth:`fixed_roll`.
+
+        Args:
+            active_totals: Totals the roll is restricted to.
+
+        Returns:
+            DicePair: The drawn pair of dice.
+        """
+        _, active_cumulative, _ = self._skip_table(active_totals)
+        return DICE_PAIRS[self._draw_from(active_cumulative)]
+
+    def _skip_table(self, active_totals: frozenset[int]) -> tuple:
+        """Return the active probability and active/inert cumulative weights."""
+        key = (self.model, active_totals)
+        table = self._skip_tables.get(key)
+        if table is None:
+            active = np.isin(_OUTCOME_TOTALS_ARRAY, list(active_totals))
+            probabilities = self.model.probabilities
+            table = (
+                float(probabilities[active].sum()),
+                np.cumsum(np.where(active, probabilities, 0)),
+                np.cumsum(np.where(active, 0, probabilities)),
+            )
+            self._skip_tables[key] = table
+        return table
+
+    def _draw_from(self, cumulative: np.ndarray) -> int:
+        """Draw an outcome index from cumulative (unnormalized) weights."""
+        u = self.rng.random() * cumulative[-1]
+        return min(int(np.searchsorted(cumulative, u, side="right")), 35)
+
+    def seek(self, n_rolls: int) -> None:
+        """
+        Position seekable dice so that the next roll is roll ``n_rolls + 1``
+
+        Only the block containing that roll is generated, so seeking is equally
+        cheap for any position in the stream. The most recent result is left
+        unchanged.
+
+        Args:
+            n_rolls: Number of rolls of the stream to skip over, which also
+                becomes the new value of :attr:`n_rolls`.
+
+        Raises:
+            ValueError: If the dice are not seekable or ``n_rolls`` is negative.
+        """
+        if not self.seekable:
+            raise ValueError("Only seekable dice can seek, use Dice(seekable=True)")
+        if n_rolls < 0:
+            raise ValueError(f"n_rolls must be non-negative, got {n_rolls}")
+        block, offset = divmod(n_rolls, self.buffer_size)
+        self._load_block(block)
+        self._buffer_index = offset
+        self.n_rolls = n_rolls
+
+    def get_state(self) -> dict:
+        """
+        Return the position of the dice in their random stream
+
+        The state is a small picklable dictionary that :meth:`set_state` accepts
+        on dice with the same configuration (``buffer_size`` and ``seekable``),
+        in this process or another one. It includes the dice model, which the
+        restored dice roll from. Buffered dice store the generator state at the
+        start of the current block rather than the block itself.
+
+        Returns:
+            dict: The dice state.
+        """
+        state = {
+            "n_rolls": self.n_rolls,
+            "result": self._result,
+            "buffer_size": self.buffer_size,
+            "antithetic": self.antithetic,
+            "model": self.model,
+        }
+        if self.seekable:
+            state["root"] = self._root_bit_generator.state
+        elif self._buffer_index < len(self._buffer_outcomes):
+            state["rng"] = self._buffer_start_state
+            state["buffer_index"] = self._buffer_index
+        else:
+            state["rng"] = self.rng.bit_generator.state
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Dice":
+        """Create dice with the layout of ``state`` and restore it.
+
+        Args:
+            state: A dice state returned by :meth:`get_state`.
+
+        Returns:
+            Dice: Dice positioned as described by ``state``.
+        """
+        dice = cls(
+            buffer_size=state["buffer_size"],
+            seekable="root" in state,
+            model=state["model"],
+            antithetic=state["antithetic"],
+        )
+        dice.set_state(state)
+        return dice
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restore a position previously returned by :meth:`get_state`
+
+        The dice take on the model of the state, so they must be buffered to
+        restore a non-uniform model.
+
+        Args:
+            state: The dice state.
+
+        Raises:
+            ValueError: If the state comes from dice with a different layout.
+        """
+        if (
+            ("root" in state) != self.seekable
+            or state["antithetic"] != self.antithetic
+            or ("buffer_index" in state or self.seekable)
+            and state["buffer_size"] != self.buffer_size
+            or self.buffer_size is None
+            and not isinstance(state["model"], UniformDice)
+        ):
+            raise ValueError("Dice state does not match the layout of these dice")
+
+        self.model = state["model"]
+        if self.seekable:
+            self._root_bit_generator.state = state["root"]
+            self.seek(state["n_rolls"])
+        else:
+            self.rng.bit_generator.state = state["rng"]
+            if "buffer_index" in state:
+                self._fill_buffer()
+                self._buffer_index = state["buffer_index"]
+            else:
+                self._buffer_outcomes = []
+                self._buffer_index = 0
+            self.n_rolls = state["n_rolls"]
+        self.result = state["result"]
+
+    def fixed_roll(self, outcome: DicePairInput) -> None:
+        """
+        Roll the dice with a specified outcome
+
+        Fixed rolls do not consume the random number generator (or the buffer),
+        so they can be mixed freely with random rolls.
+
+        Args:
+            outcome: The desired dice result to roll
+
+        Raises:
+            ValueError: If a recorder is attached and the outcome is not a
+                valid pair of dice.
+        """
+        record = _outcome_record(outcome)
+        if self.recorder is not None:
+            if record[0] is None:
+                raise ValueError(f"Cannot record invalid dice outcome {outcome}")
+            self.recorder.append(record[0])
+        self.n_rolls += 1
+        self._set_record(record)
@@ -0,0 +1,163 @@
+"""
+Typed events reported by a :class:`~crapssim.table.Table` to its observers.
+
+Subscribe a callable with :meth:`crapssim.table.Table.subscribe` to receive the
+events of every run, optionally only those of some types::
+
+    def log_seven_out(event: SevenOutEvent) -> None:
+        print(f"Shooter {event.shooter} sevened out on roll {event.roll}")
+
+    table.subscribe(log_seven_out, SevenOutEvent)
+    table.run(max_rolls=1000, verbose=False)
+
+Events are only built while the table has observers: without any, runs use the
+plain :class:`~crapssim.table.TableUpdate` loop and pay nothing for them.
+Within a roll, events arrive in phase order: bets placed or rejected by the
+strategies, the roll, bets resolved, seven-out and new shooter, and finally
+the point being set or turned off.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Literal
+
+from crapssim.dice import DicePair
+
+if TYPE_CHECKING:
+    from crapssim.bet import Bet, BetResult
+    from crapssim.table import Player
+
+__all__ = [
+    "TableEvent",
+    "RollEvent",
+    "BetPlacedEvent",
+    "BetRejectedEvent",
+    "BetResolvedEvent",
+    "PointSetEvent",
+    "PointOffEvent",
+    "SevenOutEvent",
+    "NewShooterEvent",
+    "Observer",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class TableEvent:
+    """Base class of all table events.
+
+    Attributes:
+        roll: Number of rolls made by the table's dice so far, including the
+            roll that caused the event. Bets placed before the first roll
+            have ``roll == 0``.
+        shooter: Number of the shooter (``table.n_shooters``) at the time of
+            the event.
+    """
+
+    roll: int
+    shooter: int
+
+
+@dataclass(frozen=True, slots=True)
+class RollEvent(TableEvent):
+    """The dice were rolled.
+
+    Attributes:
+        result: The pair of dice rolled.
+        total: Sum of the dice.
+        point: The point before the roll, or None if it was off.
+    """
+
+    result: DicePair
+    total: int
+    point: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class BetPlacedEvent(TableEvent):
+    """A player put a bet on the table (possibly added to an existing bet).
+
+    Attributes:
+        player: The player placing the bet.
+        bet: The bet as requested by the player's strategy.
+        cost: Amount taken from the player's bankroll.
+    """
+
+    player: "Player"
+    bet: "Bet"
+    cost: float
+
+
+@dataclass(frozen=True, slots=True)
+class BetRejectedEvent(TableEvent):
+    """A player's bet was not placed.
+
+    Attributes:
+        player: The player trying to place the bet.
+        bet: The bet as requested by the player's strategy.
+        reason: ``"not_allowed"`` if the table rules forbid the bet now,
+            ``"insufficient_bankroll"`` if the player cannot afford it.
+    """
+
+    player: "Player"
+    bet: "Bet"
+    reason: Literal["not_allowed", "insufficient_bankroll"]
+
+
+@dataclass(frozen=True, slots=True)
+class BetResolvedEvent(TableEvent):
+    """A bet won, lost or pushed on the latest roll.
+
+    Bets that the roll did not affect do not produce this event.
+
+    Attributes:
+        player: The player holding the bet.
+        bet: The bet that was resolved.
+        result: The result of the bet for the roll.
+    """
+
+    player: "Player"
+    bet: "Bet"
+    result: "BetResult"
+
+
+@dataclass(frozen=True, slots=True)
+class PointSetEvent(TableEvent):
+    """The come out roll set a point.
+
+    Attributes:
+        number: The new point.
+    """
+
+    number: int
+
+
+@dataclass(frozen=True, slots=True)
+class PointOffEvent(TableEvent):
+    """The point was made or the shooter sevened out, turning the point off.
+
+    Attributes:
+        number: The point that was turned off.
+        total: Total of the roll that turned it off (the point or 7).
+    """
+
+    number: int
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class SevenOutEvent(TableEvent):
+    """The shooter rolled a 7 with the point on.
+
+    Attributes:
+        point: The point the shooter was trying to make.
+    """
+
+    point: int
+
+
+@dataclass(frozen=True, slots=True)
+class NewShooterEvent(TableEvent):
+    """A new shooter takes the dice after a seven-out (``shooter`` is theirs)."""
+
+
+Observer = Callable[[TableEvent], None]
+"""A callable receiving table events."""
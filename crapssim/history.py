@@ -0,0 +1,144 @@
+"""
+Per-roll histories of a table, stored in NumPy structured arrays.
+
+Attach a :class:`RollHistory` to a table and every roll of its later runs is
+appended as one row of a preallocated array, which grows geometrically::
+
+    table.history = RollHistory(n_players=len(table.players))
+    table.run(max_rolls=1_000_000, verbose=False)
+    table.history.save("history.npz")
+
+Each row takes ``8 + 16 * n_players`` bytes: the dice, total, point and
+shooter, and each player's bankroll and exposure (total cost of their bets on
+the table) after the roll.
+"""
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from crapssim.table import Table
+
+__all__ = ["RollHistory", "history_dtype"]
+
+
+def history_dtype(n_players: int) -> np.dtype:
+    """Return the dtype of the rows of a :class:`RollHistory`.
+
+    Args:
+        n_players: Number of players at the table.
+
+    Returns:
+        np.dtype: Packed structured dtype with fields ``die_1``, ``die_2``,
+        ``total``, ``point`` (0 when off), ``shooter``, and ``bankroll`` and
+        ``exposure`` holding one value per player.
+    """
+    return np.dtype(
+        [
+            ("die_1", np.uint8),
+            ("die_2", np.uint8),
+            ("total", np.uint8),
+            ("point", np.uint8),
+            ("shooter", np.uint32),
+            ("bankroll", np.float64, (n_players,)),
+            ("exposure", np.float64, (n_players,)),
+        ]
+    )
+
+
+class RollHistory:
+    """
+    Record the state of a table after every roll into a structured array
+
+    Args:
+        n_players: Number of players at the table. Recording a table with a
+            different number of players raises ``ValueError``.
+        capacity: Number of rows to preallocate. The array doubles in size
+            whenever it is full.
+    """
+
+    def __init__(self, n_players: int, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.n_players: int = n_players
+        self._rows: np.ndarray = np.zeros(capacity, dtype=history_dtype(n_players))
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(n_players={self.n_players}, "
+            f"n_rolls={self._size})"
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows that fit before the array grows again."""
+        return len(self._rows)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Structured array of the recorded rows (a view, not a copy)."""
+        return self._rows[: self._size]
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """Return one column of the recorded rows, e.g. ``history["total"]``."""
+        return self.rows[field]
+
+    def record(self, table: "Table") -> None:
+        """Append the state of ``table`` after its latest roll.
+
+        Args:
+            table: The table that just rolled.
+
+        Raises:
+            ValueError: If the table does not have :attr:`n_players` players.
+        """
+        players = table.players
+        if len(players) != self.n_players:
+            raise ValueError(
+                f"History is for {self.n_players} players, table has {len(players)}"
+            )
+        if self._size == len(self._rows):
+            rows = np.zeros(2 * len(self._rows), dtype=self._rows.dtype)
+            rows[: self._size] = self._rows
+            self._rows = rows
+
+        die_1, die_2 = table.dice.result
+        self._rows[self._size] = (
+            die_1,
+            die_2,
+            die_1 + die_2,
+            table.point.number or 0,
+            # a seven-out already counted the next shooter
+            table.n_shooters - table.new_shooter,
+            [player.bankroll for player in players],
+            [player.total_bet_amount for player in players],
+        )
+        self._size += 1
+
+    def clear(self) -> None:
+        """Forget all recorded rows, keeping the allocated array."""
+        self._size = 0
+
+    def save(self, path: str | os.PathLike, compressed: bool = False) -> None:
+        """Save the recorded rows.
+
+        A path ending in ``.npz`` is saved with one array per column (see
+        :func:`numpy.savez`); any other path as a single ``.npy`` structured
+        array.
+
+        Args:
+            path: File to write.
+            compressed: If True, compress a ``.npz`` file.
+        """
+        if os.fspath(path).endswith(".npz"):
+            save = np.savez_compressed if compressed else np.savez
+            rows = self.rows
+            save(path, **{name: rows[name] for name in rows.dtype.names})
+        else:
+            np.save(path, self.rows)
@@ -1,5 +1,8 @@
 from crapssim import Dice
 
+# Whether the point is on, for the status strings checked on every roll
+_STATUS_IS_ON = {"On": True, "on": True, "Off": False, "off": False}
+
 
 class Point:
     """
@@ -11,24 +14,29 @@ class Point:
         The point number (in [4, 5, 6, 8, 9, 10]) is status == 'On'
     """
 
+    __slots__ = ("number",)
+
     def __init__(self, number: int | None = None) -> None:
         self.number: int | None = number
 
     @property
     def status(self) -> str:
         if self.number is None:
-            return 'Off'
+            return "Off"
         else:
-            return 'On'
+            return "On"
 
     def __hash__(self) -> int:
         return hash(self.number)
 
     def __repr__(self):
-        return f'Point(number={self.number})'
+        return f"Point(number={self.number})"
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, str):
+            is_on = _STATUS_IS_ON.get(other)
+            if is_on is not None:
+                return is_on is (self.number is not None)
             return self.status.lower() == other.lower() or str(self.number) == other
         elif isinstance(other, int) and other in (4, 5, 6, 8, 9, 10):
             return other == self.number
@@ -87,4 +95,4 @@ class Point:
         if self.status == "Off" and dice_object.total in [4, 5, 6, 8, 9, 10]:
             self.number = dice_object.total
         elif self.status == "On" and dice_object.total in [7, self.number]:
-            self.number = None
\ No newline at end of file
+            self.number = None
@@ -0,0 +1,173 @@
+"""
+Timers for finding where a table run spends its time.
+
+Profiling is switched on per table with
+:meth:`crapssim.table.Table.enable_profiling`. Later runs then time every phase
+of :class:`~crapssim.table.TableUpdate`, and the strategy and bet updates of
+each player, into a :class:`TableProfile`::
+
+    profile = table.enable_profiling()
+    table.run(max_rolls=100_000, verbose=False)
+    print(profile.report())
+
+Tables that are not being profiled run the plain loop, so leaving the calls in
+place costs nothing until profiling is enabled.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = ["PhaseTiming", "TableProfile", "TABLE_PHASES", "PLAYER_PHASES"]
+
+TABLE_PHASES: tuple[str, ...] = (
+    "run_strategies",
+    "print_player_summary",
+    "before_roll",
+    "update_table_stats",
+    "roll",
+    "after_roll",
+    "update_bets",
+    "set_new_shooter",
+    "update_numbers",
+)
+"""Phases of :meth:`crapssim.table.TableUpdate.run`, in the order they run."""
+
+PLAYER_PHASES: tuple[str, ...] = ("update_bets", "after_roll", "update_player_bets")
+"""Per-player parts of the phases: the strategy's ``update_bets`` and
+``after_roll``, and the settling of the player's bets."""
+
+
+@dataclass(slots=True)
+class PhaseTiming:
+    """Accumulated time spent in one phase.
+
+    Attributes:
+        calls: Number of times the phase ran.
+        total_ns: Total time spent in the phase, in nanoseconds.
+    """
+
+    calls: int = 0
+    total_ns: int = 0
+
+    def add(self, elapsed_ns: int) -> None:
+        """Record one call that took ``elapsed_ns`` nanoseconds."""
+        self.calls += 1
+        self.total_ns += elapsed_ns
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean time per call in nanoseconds, 0 if the phase never ran."""
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+@dataclass
+class TableProfile:
+    """Time and call counts of the phases of profiled runs.
+
+    Attributes:
+        phases: Timing of each table phase (see :data:`TABLE_PHASES`).
+        players: Timing of each player's share of the phases, keyed by player
+            name, then by phase (see :data:`PLAYER_PHASES`).
+        strategies: The same per-player timings summed by the class name of
+            each player's top-level strategy.
+    """
+
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+    players: dict[str, dict[str, PhaseTiming]] = field(default_factory=dict)
+    strategies: dict[str, dict[str, PhaseTiming]] = field(default_factory=dict)
+
+    @property
+    def total_ns(self) -> int:
+        """Total time spent in all table phases, in nanoseconds."""
+        return sum(timing.total_ns for timing in self.phases.values())
+
+    def add_phase(self, phase: str, elapsed_ns: int) -> None:
+        """Record one call of a table phase.
+
+        Args:
+            phase: Name of the phase.
+            elapsed_ns: Time the call took, in nanoseconds.
+        """
+        timing = self.phases.get(phase)
+        if timing is None:
+            timing = self.phases[phase] = PhaseTiming()
+        timing.add(elapsed_ns)
+
+    def add_player_phase(
+        self, player: str, strategy: str, phase: str, elapsed_ns: int
+    ) -> None:
+        """Record one call of a player's share of a phase.
+
+        Args:
+            player: Name of the player.
+            strategy: Class name of the player's strategy.
+            phase: Name of the phase.
+            elapsed_ns: Time the call took, in nanoseconds.
+        """
+        for key, timings in ((player, self.players), (strategy, self.strategies)):
+            phases = timings.setdefault(key, {})
+            timing = phases.get(phase)
+            if timing is None:
+                timing = phases[phase] = PhaseTiming()
+            timing.add(elapsed_ns)
+
+    def reset(self) -> None:
+        """Forget all recorded timings."""
+        self.phases.clear()
+        self.players.clear()
+        self.strategies.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile as nested dictionaries of plain values.
+
+        Returns:
+            dict[str, Any]: ``{"phases": ..., "players": ..., "strategies": ...}``
+            where each timing is ``{"calls": ..., "total_ns": ..., "mean_ns": ...}``.
+        """
+
+        def timing_dict(timing: PhaseTiming) -> dict[str, float]:
+            return {
+                "calls": timing.calls,
+                "total_ns": timing.total_ns,
+                "mean_ns": timing.mean_ns,
+            }
+
+        return {
+            "phases": {
+                phase: timing_dict(timing) for phase, timing in self.phases.items()
+            },
+            "players": {
+                player: {phase: timing_dict(t) for phase, t in phases.items()}
+                for player, phases in self.players.items()
+            },
+            "strategies": {
+                strategy: {phase: timing_dict(t) for phase, t in phases.items()}
+                for strategy, phases in self.strategies.items()
+            },
+        }
+
+    def report(self) -> str:
+        """Format the profile as a text table, slowest phases first.
+
+        Returns:
+            str: One line per phase with its calls, total and mean time and
+            share of the total.
+        """
+        total = self.total_ns or 1
+        lines = [f"{'phase':<40}{'calls':>10}{'total ms':>12}{'mean us':>10}{'%':>7}"]
+
+        def add_lines(timings: dict[str, PhaseTiming], prefix: str = "") -> None:
+            by_time = sorted(timings.items(), key=lambda item: -item[1].total_ns)
+            for phase, timing in by_time:
+                lines.append(
+                    f"{prefix + phase:<40}{timing.calls:>10}"
+                    f"{timing.total_ns / 1e6:>12.3f}{timing.mean_ns / 1e3:>10.3f}"
+                    f"{100 * timing.total_ns / total:>7.1f}"
+                )
+
+        add_lines(self.phases)
+        for player, phases in self.players.items():
+            add_lines(phases, f"{player}: ")
+        for strategy, phases in self.strategies.items():
+            add_lines(phases, f"{strategy}: ")
+        return "\n".join(lines)
@@ -80,6 +80,10 @@ class OddsAmount(Strategy):
             if bet.is_allowed(player) and not player.already_placed(bet):
                 player.add_bet(bet)
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the table and the player's bets."""
+        return frozenset()
+
     def _get_always_working_repr(self) -> str:
         """Since the default is false, only need to print when True"""
         return (
@@ -205,6 +209,10 @@ class OddsMultiplier(Strategy):
                 self.base_type, {point: amount}, self.always_working
             ).update_bets(player)
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the table and the player's bets."""
+        return frozenset()
+
     def completed(self, player: Player) -> bool:
         """Return True if there are no bets of base_type on the table.
 
@@ -124,6 +124,13 @@ class _BaseSingleBet(Strategy):
                     player.remove_bet(bet)
                 player.add_bet(self.bet.copy())
 
+    def triggers(self, player: Player) -> frozenset[int] | None:
+        """The totals that can allow the bet, or None in ADD_OR_INCREASE mode which adds to
+        the bet on every roll."""
+        if self.mode == StrategyMode.ADD_OR_INCREASE:
+            return None
+        return self.bet.placement_totals
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}(bet_amount={self.bet.amount},"
@@ -230,6 +237,12 @@ class BetPlace(Strategy):
                     continue
             _BaseSingleBet(Place(number, amount), mode=self.mode).update_bets(player)
 
+    def triggers(self, player: Player) -> frozenset[int] | None:
+        """No triggers, except in ADD_OR_INCREASE mode which adds to the bets on every roll."""
+        if self.mode == StrategyMode.ADD_OR_INCREASE:
+            return None
+        return frozenset()
+
     @staticmethod
     def remove_point_bet(player: Player) -> None:
         """If skip_point is true and the player has a place bet for the table point number,
@@ -3,7 +3,7 @@ strategies with the intended usage. Each of the strategies included in this pack
 to be used as building blocks when creating strategies."""
 
 from abc import ABC, abstractmethod
-from typing import Callable, Protocol, SupportsFloat
+from typing import Any, Callable, Protocol, SupportsFloat
 
 from crapssim.bet import Bet, HardWay, Hop, Place
 from crapssim.dice import Dice
@@ -90,6 +90,53 @@ class Strategy(ABC):
         and the table is updated. It triggers in :py:meth:`.table.TableUpdate.run_strategies`.
         """
 
+    def triggers(self, player: Player) -> frozenset[int] | None:
+        """Dice totals the Strategy needs to see, besides those that can change the player's bets
+        or the point.
+
+        The table may roll past any other total without calling :func:`update_bets` or
+        :func:`after_roll` (see ``Table.run(engine="skip")``). Declaring triggers is only valid if
+        the Strategy decides based on the state of the player and the table (bets, bankroll, point,
+        new shooter) rather than on individual rolls, and if calling :func:`update_bets` again when
+        nothing has changed does nothing.
+
+        Parameters
+        ----------
+        player
+            The Player using the strategy.
+
+        Returns
+        -------
+        The totals the Strategy reacts to, or None (the default) if it may react to any roll.
+        """
+        return None
+
+    def get_state(self) -> Any:
+        """Return what :func:`set_state` needs to put the Strategy back as it is now.
+
+        Used by ``Table.snapshot``. The default is a shallow copy of the Strategy's attributes,
+        which saves counters and other values the Strategy replaces as it plays (for example
+        ``HammerLock.place_win_count`` or ``WinProgression.current_progression``). A Strategy that
+        changes a list, dict or other object in place, or that holds other Strategies, must
+        override this method and :func:`set_state`.
+
+        Returns
+        -------
+        The state of the Strategy, which must not change as the Strategy keeps playing.
+        """
+        return self.__dict__.copy()
+
+    def set_state(self, state: Any) -> None:
+        """Put the Strategy back in a state returned by :func:`get_state`.
+
+        Parameters
+        ----------
+        state
+            The state, from this Strategy or a copy of it.
+        """
+        self.__dict__.clear()
+        self.__dict__.update(state)
+
     def __add__(self, other: "Strategy") -> "AggregateStrategy":
         return AggregateStrategy(self, other)
 
@@ -143,6 +190,37 @@ class AggregateStrategy(Strategy):
         """
         return all(x.completed(player) for x in self.strategies)
 
+    def triggers(self, player: Player) -> frozenset[int] | None:
+        """Combined triggers of the strategies, or None if any of them has none."""
+        totals: frozenset[int] = frozenset()
+        for strategy in self.strategies:
+            strategy_totals = strategy.triggers(player)
+            if strategy_totals is None:
+                return None
+            totals |= strategy_totals
+        return totals
+
+    def get_state(self) -> tuple[dict[str, Any], tuple[Any, ...]]:
+        """The attributes of the AggregateStrategy and the state of each of its strategies."""
+        own_state = self.__dict__.copy()
+        del own_state["strategies"]
+        return own_state, tuple(x.get_state() for x in self.strategies)
+
+    def set_state(self, state: tuple[dict[str, Any], tuple[Any, ...]]) -> None:
+        """Put the AggregateStrategy and each of its strategies back in the given state.
+
+        Parameters
+        ----------
+        state
+            A state returned by :func:`get_state`.
+        """
+        own_state, strategy_states = state
+        strategies = self.strategies
+        super().set_state(own_state)
+        self.strategies = strategies
+        for strategy, strategy_state in zip(self.strategies, strategy_states):
+            strategy.set_state(strategy_state)
+
     def __repr__(self) -> str:
         repr_strategies = [repr(x) for x in self.strategies]
         return f'{" + ".join(repr_strategies)}'
@@ -157,6 +235,9 @@ class NullStrategy(Strategy):
     def completed(self, player: Player) -> bool:
         return False
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        return frozenset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
@@ -322,6 +403,10 @@ class AddIfNotBet(AddIfTrue):
         """
         super().__init__(bet, lambda p: bet not in p.bets)
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the table and the player's bets."""
+        return frozenset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
 
@@ -344,6 +429,10 @@ class AddIfPointOff(AddIfTrue):
             bet, lambda p: p.table.point.status == "Off" and bet not in p.bets
         )
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the table and the player's bets."""
+        return frozenset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
 
@@ -365,6 +454,10 @@ class AddIfPointOn(AddIfTrue):
             bet, lambda p: p.table.point.status == "On" and bet not in p.bets
         )
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the table and the player's bets."""
+        return frozenset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
 
@@ -384,6 +477,10 @@ class AddIfNewShooter(AddIfTrue):
         """
         super().__init__(bet, lambda p: p.table.new_shooter and bet not in p.bets)
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the table and the player's bets."""
+        return frozenset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
 
@@ -418,6 +515,10 @@ class CountStrategy(AddIfTrue):
 
         return count_of_bets_with_type < self.count and identical_bet_is_not_on_table
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the player's bets."""
+        return frozenset()
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}(bet_type={self.bet_type}, count={self.count}, "
@@ -465,6 +566,10 @@ class RemoveIfPointOff(RemoveIfTrue):
         super().__init__(key)
         self.bet = bet
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the table and the player's bets."""
+        return frozenset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(bet={self.bet})"
 
@@ -476,6 +581,10 @@ class RemoveByType(RemoveIfTrue):
         """Remove all bets matching ``bet_type``."""
         super().__init__(lambda b, p: isinstance(b, bet_type))
 
+    def triggers(self, player: Player) -> frozenset[int]:
+        """Only depends on the player's bets."""
+        return frozenset()
+
 
 class WinProgression(Strategy):
     """Strategy that every time a bet is won, moves to the next amount in the progression and
@@ -1,13 +1,66 @@
+import bisect
 import copy
-from typing import Generator, Iterable, Literal, SupportsFloat, TypedDict
-
-from crapssim.dice import Dice, DicePair
-
-from .bet import Bet, BetResult, Odds, Put
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Sequence,
+    SupportsFloat,
+    TypedDict,
+    cast,
+)
+
+import numpy as np
+
+from crapssim.dice import Dice, DicePair, session_seed
+
+from .bet import (
+    ALL_DICE_NUMBERS,
+    Bet,
+    BetResult,
+    Odds,
+    Put,
+    _SettingsDict,
+    compiled_settings,
+)
+from .events import (
+    BetPlacedEvent,
+    BetRejectedEvent,
+    BetResolvedEvent,
+    NewShooterEvent,
+    Observer,
+    PointOffEvent,
+    PointSetEvent,
+    RollEvent,
+    SevenOutEvent,
+    TableEvent,
+)
+from .history import RollHistory
 from .point import Point
-from .strategy import BetPassLine, Strategy
-
-__all__ = ["TableUpdate", "TableSettings", "Table", "Player"]
+from .profiling import TableProfile
+from .strategy import AggregateStrategy, BetPassLine, Strategy
+from .strategy.tools import NullStrategy
+from .tape import RollLogReader, iter_tape
+
+__all__ = [
+    "TableUpdate",
+    "SkipTableUpdate",
+    "ObservedTableUpdate",
+    "ProfiledTableUpdate",
+    "TableSettings",
+    "Table",
+    "Player",
+    "PlayerSnapshot",
+    "TableSnapshot",
+    "RollRecord",
+]
 
 
 class TableUpdate:
@@ -134,6 +187,17 @@ class TableUpdate:
         for player in table.players:
             player.update_bet(verbose=verbose)
 
+    @staticmethod
+    def update_player_bets(
+        table: "Table", player: "Player", verbose: bool = False
+    ) -> None:
+        """Settle one player's bets, the part of :meth:`update_bets` for ``player``.
+
+        Returns:
+            None: Always returns ``None``.
+        """
+        player.update_bet(verbose=verbose)
+
     @staticmethod
     def set_new_shooter(table: "Table") -> None:
         if table.point == "On" and table.dice.total == 7:
@@ -157,6 +221,189 @@ class TableUpdate:
             print(f"Point is {table.point.status} ({table.point.number})")
 
 
+class SkipTableUpdate(TableUpdate):
+    """Roll/update lifecycle that rolls past inert rolls in one step.
+
+    Before each roll, :meth:`Table.active_totals` works out which totals can
+    change anything at the table. The number of inert rolls before the next
+    active one is drawn from its geometric distribution, and the table jumps
+    straight to that active roll. Because inert rolls change nothing but the
+    roll counts, the outcome distribution of the run is exact.
+
+    Args:
+        max_rolls: Total number of rolls (counted by the dice) the run may reach.
+            Skipping stops there, as the reference loop would.
+    """
+
+    def __init__(self, max_rolls: float | int = float("inf")) -> None:
+        self.max_rolls = max_rolls
+
+    def run(
+        self,
+        table: "Table",
+        dice_outcome: DicePair | None = None,
+        run_complete: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        self.run_strategies(table, run_complete, verbose)
+        self.print_player_summary(table, verbose)
+        self.before_roll(table)
+        self.update_table_stats(table)
+
+        active_totals = None if dice_outcome is not None else table.active_totals()
+        if active_totals is not None:
+            limit = max(1, self.max_rolls - table.dice.n_rolls)
+            if run_complete:
+                limit = float("inf")
+            n_skipped = table.dice.skip_inert(active_totals, limit)
+            if n_skipped > 0:
+                # the first skipped roll was counted by update_table_stats
+                table.pass_rolls += n_skipped - 1
+                table.last_roll = table.dice.total
+                if verbose:
+                    print(f"Skipped {n_skipped} rolls that could not change the table")
+            if n_skipped >= limit:
+                return
+            table.pass_rolls += n_skipped > 0
+            dice_outcome = table.dice.sample_active(active_totals)
+
+        self.roll(table, dice_outcome, verbose)
+
+        self.after_roll(table)
+        self.update_bets(table, verbose)
+        self.set_new_shooter(table)
+        self.update_numbers(table, verbose)
+
+
+class ObservedTableUpdate(TableUpdate):
+    """Roll/update lifecycle that reports each phase to the table's observers.
+
+    :meth:`Table.run` and :meth:`Table.fixed_run` use this instead of
+    :class:`TableUpdate` while the table has observers (see
+    :meth:`Table.subscribe`). The game itself is played exactly the same way.
+    """
+
+    @staticmethod
+    def roll(
+        table: "Table",
+        fixed_outcome: DicePair | None = None,
+        verbose: bool = False,
+    ) -> None:
+        point = table.point.number
+        TableUpdate.roll(table, fixed_outcome, verbose)
+        table.emit(
+            RollEvent(
+                table.dice.n_rolls,
+                table.n_shooters,
+                table.dice.result,
+                table.dice.total,
+                point,
+            )
+        )
+
+    @staticmethod
+    def set_new_shooter(table: "Table") -> None:
+        shooter = table.n_shooters
+        TableUpdate.set_new_shooter(table)
+        if table.new_shooter:
+            n_rolls = table.dice.n_rolls
+            table.emit(SevenOutEvent(n_rolls, shooter, table.point.number))
+            table.emit(NewShooterEvent(n_rolls, table.n_shooters))
+
+    @staticmethod
+    def update_numbers(table: "Table", verbose: bool) -> None:
+        point = table.point.number
+        TableUpdate.update_numbers(table, verbose)
+        if table.point.number == point:
+            return
+        n_rolls = table.dice.n_rolls
+        if point is None:
+            table.emit(PointSetEvent(n_rolls, table.n_shooters, table.point.number))
+        else:
+            table.emit(
+                PointOffEvent(n_rolls, table.n_shooters, point, table.dice.total)
+            )
+
+
+class ProfiledTableUpdate(TableUpdate):
+    """Roll/update lifecycle that times each phase of another lifecycle.
+
+    :meth:`Table.run` and :meth:`Table.fixed_run` use this while profiling is
+    enabled (see :meth:`Table.enable_profiling`). Every phase of ``update`` is
+    timed into ``profile``, and so is each player's share of the strategy and
+    bet updates. The game itself is played exactly the same way.
+
+    Args:
+        profile: Where the timings are accumulated.
+        update: The lifecycle being timed.
+    """
+
+    def __init__(self, profile: TableProfile, update: TableUpdate) -> None:
+        self.profile = profile
+        self.update = update
+
+    def run(
+        self,
+        table: "Table",
+        dice_outcome: DicePair | None = None,
+        run_complete: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        update = self.update
+        add_phase = self.profile.add_phase
+        clock = time.perf_counter_ns
+
+        start = clock()
+        if not run_complete:
+            self._time_players(
+                table, "update_bets", lambda p: p.strategy.update_bets(p)
+            )
+        add_phase("run_strategies", clock() - start)
+
+        for phase, args in (
+            ("print_player_summary", (table, verbose)),
+            ("before_roll", (table,)),
+            ("update_table_stats", (table,)),
+            ("roll", (table, dice_outcome, verbose)),
+        ):
+            start = clock()
+            getattr(update, phase)(*args)
+            add_phase(phase, clock() - start)
+
+        start = clock()
+        self._time_players(table, "after_roll", lambda p: p.strategy.after_roll(p))
+        add_phase("after_roll", clock() - start)
+
+        start = clock()
+        self._time_players(
+            table,
+            "update_player_bets",
+            lambda p: update.update_player_bets(table, p, verbose),
+        )
+        add_phase("update_bets", clock() - start)
+
+        for phase, args in (
+            ("set_new_shooter", (table,)),
+            ("update_numbers", (table, verbose)),
+        ):
+            start = clock()
+            getattr(update, phase)(*args)
+            add_phase(phase, clock() - start)
+
+    def _time_players(
+        self, table: "Table", phase: str, call: Callable[["Player"], None]
+    ) -> None:
+        """Call ``call`` for each player, timing each call."""
+        add_player_phase = self.profile.add_player_phase
+        clock = time.perf_counter_ns
+        for player in table.players:
+            start = clock()
+            call(player)
+            add_player_phase(
+                player.name, type(player.strategy).__name__, phase, clock() - start
+            )
+
+
 class TableSettings(TypedDict, total=False):
     """Simulation and payout policy toggles.
 
@@ -178,15 +425,126 @@ class TableSettings(TypedDict, total=False):
     vig_paid_on_win: bool
 
 
+@dataclass(frozen=True, slots=True)
+class PlayerSnapshot:
+    """Copy of a player's state, see :meth:`Table.snapshot`.
+
+    Attributes:
+        name: The player's name.
+        bankroll: The player's bankroll.
+        bets: State of each of the player's bets (see :meth:`Bet.get_state`).
+        strategy: The player's strategy object. It is not copied: the snapshot
+            keeps a reference and restores it with ``strategy_state``.
+        strategy_state: State of the strategy (see :meth:`Strategy.get_state`).
+    """
+
+    name: str
+    bankroll: float
+    bets: tuple[tuple, ...]
+    strategy: Strategy
+    strategy_state: Any
+
+
+_NO_STRATEGY = NullStrategy()
+
+
+def _same_strategies(strategy: Strategy, other: Strategy) -> bool:
+    """Whether ``strategy`` can take the state of ``other`` (see :meth:`Table.restore`)."""
+    if type(strategy) is not type(other):
+        return False
+    if isinstance(strategy, AggregateStrategy):
+        return len(strategy.strategies) == len(other.strategies) and all(
+            _same_strategies(x, y)
+            for x, y in zip(strategy.strategies, other.strategies)
+        )
+    return True
+
+
+def _copy_strategy(strategy: Strategy) -> Strategy:
+    """Copy ``strategy`` so that it can take a state of its own.
+
+    Strategy states only hold values the strategy replaces rather than
+    changes (see :meth:`Strategy.get_state`), so a shallow copy is enough,
+    except for the strategies an ``AggregateStrategy`` holds.
+    """
+    strategy = copy.copy(strategy)
+    if isinstance(strategy, AggregateStrategy):
+        strategy.strategies = tuple(_copy_strategy(x) for x in strategy.strategies)
+    return strategy
+
+
+@dataclass(frozen=True, slots=True)
+class TableSnapshot:
+    """Copy of a table's state between two rolls, see :meth:`Table.snapshot`.
+
+    They hold the state of bets and strategies as compact values rather than
+    copies of the objects, so taking and restoring them is cheap. Each player
+    snapshot also refers to the strategy object itself, so a snapshot can only
+    be pickled (to checkpoint a run to disk, or resume it in another process
+    with :meth:`Table.from_snapshot`) if the strategies can. Strategies built
+    on functions defined inline, such as ``AddIfTrue`` with a lambda and the
+    strategies using it (``AddIfPointOn``, ``IronCross``, ``Knockout``, ...),
+    cannot be pickled and so cannot be checkpointed this way.
+    """
+
+    dice_state: dict
+    point_number: int | None
+    pass_rolls: int
+    last_roll: int | None
+    n_shooters: int
+    new_shooter: bool
+    settings: TableSettings
+    players: tuple[PlayerSnapshot, ...]
+
+
+def _copy_settings(settings: TableSettings) -> TableSettings:
+    """Copy settings and the payout tables in them."""
+    return cast(
+        TableSettings,
+        {
+            key: value.copy() if isinstance(value, dict) else value
+            for key, value in settings.items()
+        },
+    )
+
+
+class RollRecord(NamedTuple):
+    """State of the table after one roll, as yielded by :meth:`Table.iter_run`."""
+
+    roll: int
+    """Number of rolls made by the dice, including this one"""
+    result: DicePair
+    """The pair of dice rolled"""
+    point_before: int | None
+    """The point before the roll, or None if it was off"""
+    point_after: int | None
+    """The point after the roll, or None if it is off"""
+    shooter: int
+    """Number of the shooter who rolled"""
+    bankrolls: tuple[float, ...]
+    """Bankroll of each player after the roll, in seating order"""
+
+
 class Table:
-    """Runtime state for a craps table simulation."""
+    """Runtime state for a craps table simulation.
+
+    Args:
+        seed: Seed for the table's dice.
+        seekable: If True, roll seekable dice (see :class:`~crapssim.dice.Dice`)
+            so that a run can be started at any roll of the seeded stream with
+            ``table.dice.seek(n_rolls)``.
+    """
 
-    def __init__(self, seed: int | None = None) -> None:
+    def __init__(
+        self,
+        seed: int | np.random.SeedSequence | None = None,
+        seekable: bool = False,
+    ) -> None:
         self.players: list[Player] = []
         self.point: Point = Point()
         self.seed = seed
-        self.dice: Dice = Dice(self.seed)
-        self.settings: TableSettings = {
+        self.dice: Dice = Dice(self.seed, seekable=seekable)
+        self.settings = {
             "ATS_payouts": {"all": 150, "tall": 30, "small": 30},
             "field_payouts": {2: 2, 3: 1, 4: 1, 9: 1, 10: 1, 11: 1, 12: 2},
             "fire_payouts": {4: 24, 5: 249, 6: 999},
@@ -201,6 +559,213 @@ class Table:
         self.last_roll: int | None = None
         self.n_shooters: int = 1
         self.new_shooter: bool = True
+        self._observers: list[tuple[Observer, tuple[type[TableEvent], ...]]] = []
+        self._bet_codes: dict[Hashable, int] = {}
+        self.profile: TableProfile | None = None
+        """Timings of the runs since :meth:`enable_profiling`, or None"""
+        self.history: RollHistory | None = None
+        """If set, the state after every roll of later runs is recorded here"""
+
+    @property
+    def settings(self) -> TableSettings:
+        """Table rules read by the bets (see :class:`TableSettings`).
+
+        Assigned settings are copied into a dict, payout tables included, that
+        keeps its compiled form (see :func:`~crapssim.bet.compiled_settings`)
+        until it changes.
+        """
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: TableSettings) -> None:
+        self._settings = cast(TableSettings, _SettingsDict(settings))
+
+    def enable_profiling(self) -> TableProfile:
+        """Time the phases of later runs into :attr:`profile`.
+
+        Timings keep accumulating over runs until :meth:`disable_profiling`.
+        Profiled runs use the ``"reference"`` engine.
+
+        Returns:
+            TableProfile: The profile being filled in.
+        """
+        if self.profile is None:
+            self.profile = TableProfile()
+        return self.profile
+
+    def disable_profiling(self) -> TableProfile | None:
+        """Stop timing runs.
+
+        Returns:
+            TableProfile | None: The timings collected so far, or None if
+            profiling was not enabled.
+        """
+        profile, self.profile = self.profile, None
+        return profile
+
+    def subscribe(self, observer: Observer, *event_types: type[TableEvent]) -> None:
+        """Call ``observer`` with each event of later runs (see :mod:`crapssim.events`).
+
+        Args:
+            observer: Callable taking one event.
+            *event_types: Only send events of these types (including their
+                subclasses). All events are sent if none are given.
+        """
+        self._observers.append((observer, event_types or (TableEvent,)))
+
+    def unsubscribe(self, observer: Observer) -> None:
+        """Stop sending events to ``observer``.
+
+        Args:
+            observer: A callable previously passed to :meth:`subscribe`.
+
+        Raises:
+            ValueError: If ``observer`` is not subscribed.
+        """
+        for i, (subscribed, _) in enumerate(self._observers):
+            if subscribed == observer:
+                del self._observers[i]
+                return
+        raise ValueError(f"{observer!r} is not subscribed to this table")
+
+    def emit(self, event: TableEvent) -> None:
+        """Send an event to every observer subscribed to its type.
+
+        Args:
+            event: The event to send.
+        """
+        for observer, event_types in self._observers:
+            if isinstance(event, event_types):
+                observer(event)
+
+    def _table_update(self) -> TableUpdate:
+        """Return the update lifecycle for the next roll of a reference run."""
+        update = ObservedTableUpdate() if self._observers else TableUpdate()
+        if self.profile is not None:
+            return ProfiledTableUpdate(self.profile, update)
+        return update
+
+    @classmethod
+    def from_seed_stream(
+        cls, root_seed: int, session_index: int, antithetic: bool = False
+    ) -> "Table":
+        """Create the table for session ``session_index`` of the stream ``root_seed``.
+
+        Session ``i`` always rolls the same dice, regardless of how many sessions
+        are run, how they are chunked across workers, or in which order they run,
+        so parallel batches can be reproduced exactly on a single core.
+
+        Args:
+            root_seed: Seed for the whole batch of sessions.
+            session_index: Position of the session in the batch (0, 1, 2, ...).
+            antithetic: If True, roll the antithetic twin of the session's dice
+                (see :class:`~crapssim.dice.Dice`).
+
+        Returns:
+            Table: A new table seeded for that session.
+        """
+        table = cls(seed=session_seed(root_seed, session_index))
+        if antithetic:
+            table.dice = Dice.from_seed_stream(
+                root_seed, session_index, antithetic=True
+            )
+        return table
+
+    def snapshot(self) -> TableSnapshot:
+        """Capture the state of the table between rolls.
+
+        Together with seekable dice this lets one long run be checkpointed and
+        resumed, or continued from the same point several times.
+
+        Bets are saved with :meth:`Bet.get_state` and strategies with
+        :meth:`Strategy.get_state`, so strategies that keep internal state must
+        support that protocol.
+
+        Returns:
+            TableSnapshot: The current table, dice and player state.
+        """
+        return TableSnapshot(
+            dice_state=self.dice.get_state(),
+            point_number=self.point.number,
+            pass_rolls=self.pass_rolls,
+            last_roll=self.last_roll,
+            n_shooters=self.n_shooters,
+            new_shooter=self.new_shooter,
+            settings=_copy_settings(self.settings),
+            players=tuple(
+                PlayerSnapshot(
+                    name=player.name,
+                    bankroll=player.bankroll,
+                    bets=tuple(bet.get_state() for bet in player.bets),
+                    strategy=player.strategy,
+                    strategy_state=player.strategy.get_state(),
+                )
+                for player in self.players
+            ),
+        )
+
+    def restore(self, snapshot: TableSnapshot) -> None:
+        """Return the table to the state captured by :meth:`snapshot`.
+
+        Players already seated are updated in place, in seating order. Extra
+        players are removed and missing players are added. A player keeps
+        their strategy object if it has the same class as the one in the
+        snapshot (and, for an ``AggregateStrategy``, the same classes of
+        strategies), and otherwise gets a shallow copy of it; either way its
+        state is then restored.
+
+        Args:
+            snapshot: The state to restore.
+        """
+        self.dice.set_state(snapshot.dice_state)
+        self.point.number = snapshot.point_number
+        self.pass_rolls = snapshot.pass_rolls
+        self.last_roll = snapshot.last_roll
+        self.n_shooters = snapshot.n_shooters
+        self.new_shooter = snapshot.new_shooter
+        self.settings = _copy_settings(snapshot.settings)
+
+        del self.players[len(snapshot.players) :]
+        for i, player_snapshot in enumerate(snapshot.players):
+            if i == len(self.players):
+                player = self.add_player(
+                    bankroll=player_snapshot.bankroll,
+                    strategy=_NO_STRATEGY,
+                    name=player_snapshot.name,
+                )
+            else:
+                player = self.players[i]
+                player.name = player_snapshot.name
+                player.bankroll = player_snapshot.bankroll
+            if not _same_strategies(player.strategy, player_snapshot.strategy):
+                player.strategy = _copy_strategy(player_snapshot.strategy)
+            player.strategy.set_state(player_snapshot.strategy_state)
+            player.bets = [Bet.from_state(state) for state in player_snapshot.bets]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: TableSnapshot) -> "Table":
+        """Create a table, players and dice from a :meth:`snapshot`.
+
+        Args:
+            snapshot: The state to start from.
+
+        Returns:
+            Table: A new table that continues exactly where the snapshot left off.
+        """
+        table = cls()
+        table.dice = Dice.from_state(snapshot.dice_state)
+        table.restore(snapshot)
+        return table
+
+    def clone(self) -> "Table":
+        """Create an independent copy of the table, its players and dice.
+
+        Observers, profiling and history are not copied.
+
+        Returns:
+            Table: A table that continues exactly like this one would.
+        """
+        return self.from_snapshot(self.snapshot())
 
     def yield_player_bets(self) -> Generator[tuple["Player", "Bet"], None, None]:
         for player in self.players:
@@ -255,6 +820,7 @@ class Table:
         max_shooter: float | int = float("inf"),
         verbose: bool = True,
         runout: bool = False,
+        engine: Literal["reference", "fast", "skip"] = "reference",
     ) -> None:
         """Simulate the table until shooter/roll limits or strategies finish.
 
@@ -263,20 +829,95 @@ class Table:
             max_shooter: Maximum number of shooters to process.
             verbose: If True, print updates during execution.
             runout: If True, continue resolving remaining bets after hitting limits.
+            engine: ``"reference"`` (default) runs every phase of
+                :class:`TableUpdate` for every roll. ``"fast"`` runs the same
+                phases in a dedicated loop without verbose output, giving exactly
+                the same results as ``"reference"`` for a given seed; while
+                the table has observers or is profiled it runs as
+                ``"reference"``. ``"skip"``
+                uses :class:`SkipTableUpdate` to jump over rolls that cannot
+                change the table; the run has the same distribution of outcomes
+                but draws a different sequence of dice for a given seed. It
+                cannot be used while the table has observers or is profiled.
 
         Returns:
             None: Always returns ``None``.
         """
+        if engine not in ("reference", "fast", "skip"):
+            raise ValueError(f"Unknown engine {engine!r}")
+        if engine == "skip" and (
+            self.dice.recorder is not None or self.history is not None
+        ):
+            raise ValueError("The skip engine cannot record rolls it skips")
+        if engine == "skip" and self._observers:
+            raise ValueError("The skip engine cannot report rolls it skips")
+        if engine == "skip" and self.profile is not None:
+            raise ValueError("The skip engine cannot be profiled")
 
         self._setup_run(verbose)
         n_rolls_start = self.dice.n_rolls
         # logic needs to count starting run as 0 shooters, not easy to set new_shooter in better way
         n_shooter_start = self.n_shooters if self.n_shooters != 1 else 0
 
+        if engine == "fast" and not self._observers and self.profile is None:
+            self._run_fast(
+                max_rolls + n_rolls_start, max_shooter + n_shooter_start, runout
+            )
+            return
+
+        run_complete = False
+        continue_rolling = True
+        while continue_rolling:
+            if engine == "skip":
+                update = SkipTableUpdate(max_rolls + n_rolls_start)
+            else:
+                update = self._table_update()
+            update.run(self, run_complete=run_complete, verbose=verbose)
+            if self.history is not None:
+                self.history.record(self)
+
+            run_complete = self.is_run_complete(
+                max_rolls + n_rolls_start, max_shooter + n_shooter_start
+            )
+            continue_rolling = self.should_keep_rolling(run_complete, runout)
+            if not continue_rolling:
+                self.n_shooters -= 1  # count was added but this shooter never rolled
+                TableUpdate().print_player_summary(self, verbose=verbose)
+
+    def iter_run(
+        self,
+        max_rolls: int,
+        max_shooter: float | int = float("inf"),
+        verbose: bool = False,
+        runout: bool = False,
+    ) -> Iterator[RollRecord]:
+        """Simulate the table like :meth:`run`, yielding a record after each roll.
+
+        The run stops at the same roll as :meth:`run` with the ``"reference"``
+        engine, or earlier if the caller stops iterating. Nothing is kept
+        between rolls, so arbitrarily long runs can be streamed.
+
+        Args:
+            max_rolls: Maximum number of rolls to process.
+            max_shooter: Maximum number of shooters to process.
+            verbose: If True, print updates during execution.
+            runout: If True, continue resolving remaining bets after hitting limits.
+
+        Yields:
+            RollRecord: The roll and the state of the table after it.
+        """
+        self._setup_run(verbose)
+        n_rolls_start = self.dice.n_rolls
+        n_shooter_start = self.n_shooters if self.n_shooters != 1 else 0
+
         run_complete = False
         continue_rolling = True
         while continue_rolling:
-            TableUpdate().run(self, run_complete=run_complete, verbose=verbose)
+            point_before = self.point.number
+            shooter = self.n_shooters
+            self._table_update().run(self, run_complete=run_complete, verbose=verbose)
+            if self.history is not None:
+                self.history.record(self)
 
             run_complete = self.is_run_complete(
                 max_rolls + n_rolls_start, max_shooter + n_shooter_start
@@ -286,22 +927,97 @@ class Table:
                 self.n_shooters -= 1  # count was added but this shooter never rolled
                 TableUpdate().print_player_summary(self, verbose=verbose)
 
+            yield RollRecord(
+                self.dice.n_rolls,
+                self.dice.result,
+                point_before,
+                self.point.number,
+                shooter,
+                tuple(player.bankroll for player in self.players),
+            )
+
+    def _run_fast(
+        self, max_rolls: float | int, max_shooter: float | int, runout: bool
+    ) -> None:
+        """Run the phases of :meth:`TableUpdate.run` in one tight loop.
+
+        This must stay in step with :class:`TableUpdate`: it makes the same
+        calls on players, strategies, bets, dice and point, in the same order,
+        but skips the verbose output and the per-roll dispatch.
+
+        Args:
+            max_rolls: Total number of rolls (counted by the dice) to stop at.
+            max_shooter: Total number of shooters to stop at.
+            runout: If True, continue resolving remaining bets after hitting limits.
+        """
+        players = self.players
+        dice = self.dice
+        point = self.point
+
+        run_complete = False
+        while True:
+            if not run_complete:
+                for player in players:
+                    player.strategy.update_bets(player)
+
+            self.pass_rolls += 1
+            if point.number is not None and (
+                dice.total == 7 or dice.total == point.number
+            ):
+                self.pass_rolls = 0
+
+            dice.roll()
+            self.last_roll = dice.total
+
+            for player in players:
+                player.strategy.after_roll(player)
+            for player in players:
+                player.update_bet()
+
+            if point.number is not None and dice.total == 7:
+                self.new_shooter = True
+                self.n_shooters += 1
+            else:
+                self.new_shooter = False
+
+            for player in players:
+                for bet in player.bets:
+                    bet.update_number(self)
+            point.update(dice)
+            if self.history is not None:
+                self.history.record(self)
+
+            run_complete = self.is_run_complete(max_rolls, max_shooter)
+            if not self.should_keep_rolling(run_complete, runout):
+                self.n_shooters -= 1  # count was added but this shooter never rolled
+                return
+
     def fixed_run(
-        self, dice_outcomes: Iterable[DicePair], verbose: bool = False
+        self,
+        dice_outcomes: Iterable[DicePair] | np.ndarray | RollLogReader,
+        verbose: bool = False,
     ) -> None:
         """Run the table using a predetermined dice outcome sequence.
 
         Args:
-            dice_outcomes: Iterable of dice value pairs to apply sequentially.
+            dice_outcomes: Iterable of dice value pairs to apply sequentially, or
+                a roll tape: an ``(n, 2)`` array (possibly memory-mapped, see
+                :func:`crapssim.tape.load_tape`), which is replayed chunk by
+                chunk without creating a tuple per roll. A
+                :class:`~crapssim.tape.RollLogReader` is replayed the same way.
             verbose: If True, print updates during execution.
 
         Returns:
             None: Always returns ``None``.
         """
         self._setup_run(verbose=verbose)
+        if isinstance(dice_outcomes, (np.ndarray, RollLogReader)):
+            dice_outcomes = iter_tape(dice_outcomes)
 
         for dice_outcome in dice_outcomes:
-            TableUpdate().run(self, dice_outcome, verbose=verbose)
+            self._table_update().run(self, dice_outcome, verbose=verbose)
+            if self.history is not None:
+                self.history.record(self)
 
     def is_run_complete(
         self,
@@ -347,20 +1063,386 @@ class Table:
         if len(self.players) == 0:
             self.add_player()
 
+    def active_totals(self) -> frozenset[int] | None:
+        """Dice totals that can change the table on the next roll.
+
+        These are the totals that can move the point or end the shooter, that
+        can change any player's bets (see ``Bet.get_active_numbers``), and
+        that any strategy declares as triggers (see ``Strategy.triggers``).
+        Rolling any other total only advances the roll counts.
+
+        Returns:
+            The active totals, or None if every roll may matter: there is a new
+            shooter, a strategy has no declared triggers, or every total is
+            active anyway.
+        """
+        if self.new_shooter:
+            return None
+        if self.point.status == "On":
+            totals = {7, self.point.number}
+        else:
+            totals = {4, 5, 6, 8, 9, 10}
+        for player in self.players:
+            triggers = player.strategy.triggers(player)
+            if triggers is None:
+                return None
+            totals.update(triggers)
+            totals.update(player._bets.active_numbers(self))
+        if len(totals) == 11:
+            return None
+        return frozenset(totals)
+
     @property
     def player_has_bets(self) -> bool:
         """Whether any player currently has active bets."""
-        return sum([len(p.bets) for p in self.players]) > 0
+        return any(p.bets for p in self.players)
 
     @property
     def total_player_cash(self) -> float:
         """Total bankroll plus outstanding bet amounts across all players."""
-        return sum([p.total_player_cash for p in self.players])
+        return sum(p.total_player_cash for p in self.players)
+
+    @property
+    def state_key(self) -> tuple[Hashable, ...]:
+        """Hashable key of the table state that decides how the next roll settles.
+
+        Holds the point number (0 when off), whether a new shooter is up,
+        the last roll's total (0 before the first roll) and each player's
+        :attr:`Player.state_key`, so it can be used to memoize results by
+        state. Bet states are numbered by each table (see
+        :attr:`Player.state_key`), so keys of different tables should not be
+        compared.
+        """
+        key = (self.point.number or 0, int(self.new_shooter), self.last_roll or 0)
+        return key + tuple(p._bets.state_key(self._bet_codes) for p in self.players)
+
+
+def _bet_code(bet: Bet, codes: dict[Hashable, int]) -> int:
+    """Return the int standing for the state of ``bet`` in the codebook ``codes``.
+
+    Codes are given out in the order states are first seen, so they are only
+    comparable within one codebook. A bet whose state cannot be hashed gets
+    a code of its own.
+    """
+    key = bet.get_state()
+    try:
+        code = codes.get(key)
+    except TypeError:
+        key = id(bet)
+        code = codes.get(key)
+    if code is None:
+        code = codes[key] = len(codes)
+    return code
+
+
+def _is_moving(bet: Bet) -> bool:
+    """Whether ``bet`` can change its placement key while on the layout."""
+    return type(bet).update_number is not Bet.update_number
+
+
+def _is_volatile(bet: Bet) -> bool:
+    """Whether the state of ``bet`` can change while on the layout.
+
+    Moving bets change their number, and bets that are not tabulated (like
+    Fire or All) may keep track of the rolls they have seen.
+    """
+    return _is_moving(bet) or not bet.tabulated
+
+
+def _invalidates_cache(method: Callable) -> Callable:
+    """Wrap a list method so that it clears the caches of a :class:`_BetList`."""
+
+    def changed(self: "_BetList", *args, **kwargs):
+        self._changed()
+        self._index = None
+        self._layout = None
+        return method(self, *args, **kwargs)
+
+    changed.__name__ = method.__name__
+    changed.__doc__ = method.__doc__
+    return changed
+
+
+class _BetList(list):
+    """A player's bets, with cached totals and an index of the bets.
+
+    The totals are kept until the list changes, and the costs (see
+    :meth:`costs`) also until the table settings change. They are summed in
+    list order, exactly like summing the bets directly, so they are
+    identical to the values computed without caching. Bets must not have their ``amount``
+    changed while they are in the list; take the bet off and put it back,
+    as :meth:`Player.add_bet` does.
+
+    The index groups the bets by ``_placed_key`` and by class, keeping list
+    order within each group, so lookups do not scan the whole layout.
+    ``append``, ``extend`` and ``remove`` update it; other changes rebuild it
+    on the next lookup. Bets that move (those overriding
+    :meth:`~crapssim.bet.Bet.update_number`, like Come) can change key while
+    on the layout, so they are kept apart and checked on every lookup.
+
+    The bets to settle on each dice total (see :meth:`settling`) are kept
+    for each point and position of the moving bets until the list changes,
+    and the active numbers of each placement key for as long as the list.
+
+    The sorted codes of the bets whose state cannot change on the layout,
+    which make up most of the :meth:`state_key`, are updated by ``append``
+    and ``remove`` like the index.
+    """
+
+    __slots__ = ("_totals", "_costs", "_index", "_settling", "_active", "_layout")
+
+    def __init__(self, bets: Iterable[Bet] = ()) -> None:
+        super().__init__(bets)
+        self._totals: tuple[float, tuple[Bet, ...]] | None = None
+        self._costs: tuple[int, float, float] | None = None
+        self._index: (
+            tuple[dict[Hashable, list[Bet]], dict[type[Bet], list[Bet]], list[Bet]]
+            | None
+        ) = None
+        self._settling: dict[Hashable, tuple[Bet, ...]] | None = None
+        self._active: dict[Hashable, frozenset[int]] = {}
+        self._layout: (
+            tuple[dict[Hashable, int], tuple[int, ...], tuple[Bet, ...]] | None
+        ) = None
+
+    def __reduce__(self):
+        # Rebuild from the bets alone; pickle would otherwise append them
+        # before the caches exist.
+        return type(self), (list(self),)
+
+    def _changed(self) -> None:
+        """Clear the caches that depend on the bets and their order."""
+        self._totals = None
+        self._costs = None
+        self._settling = None
+
+    def state_key(self, codes: dict[Hashable, int]) -> tuple[int, ...]:
+        """Return the sorted codes of the states of the bets.
+
+        Layouts of bets with equal states, in any order, have equal keys
+        for the same codebook ``codes`` (see :func:`_bet_code`).
+        """
+        if self._layout is None or self._layout[0] is not codes:
+            self._layout = (
+                codes,
+                tuple(
+                    sorted(
+                        _bet_code(bet, codes) for bet in self if not _is_volatile(bet)
+                    )
+                ),
+                tuple(bet for bet in self if _is_volatile(bet)),
+            )
+        _, layout, volatile = self._layout
+        if not volatile:
+            return layout
+        return tuple(sorted(layout + tuple(_bet_code(b, codes) for b in volatile)))
+
+    def totals(self) -> tuple[float, tuple[Bet, ...]]:
+        """Return the total amount of the bets and the bets with their own ``cost``."""
+        if self._totals is None:
+            self._totals = (
+                sum(bet.amount for bet in self),
+                tuple(bet for bet in self if type(bet).cost is not Bet.cost),
+            )
+        return self._totals
+
+    def costs(self, table: "Table") -> tuple[float, float]:
+        """Return the total cost of the bets on ``table`` and the vig in it.
+
+        Kept until the list changes or the table settings compile to another
+        version, since costs depend only on the bets and the settings.
+        """
+        version = compiled_settings(table.settings).version
+        if self._costs is None or self._costs[0] != version:
+            total, cost_bets = self.totals()
+            if cost_bets:
+                cost = sum(x.cost(table) for x in self)
+            else:
+                cost = total
+            vig = sum(x.cost(table) - x.amount for x in cost_bets)
+            self._costs = (version, cost, vig)
+        return self._costs[1], self._costs[2]
+
+    def _get_index(
+        self,
+    ) -> tuple[dict[Hashable, list[Bet]], dict[type[Bet], list[Bet]], list[Bet]]:
+        """Return the bets by placed key, by class, and the moving bets."""
+        if self._index is None:
+            self._index = ({}, {}, [])
+            for bet in self:
+                self._index_bet(bet)
+        return self._index
+
+    def _index_bet(self, bet: Bet) -> None:
+        by_key, by_type, moving = self._index
+        by_type.setdefault(type(bet), []).append(bet)
+        if not _is_moving(bet):
+            by_key.setdefault(bet._placed_key, []).append(bet)
+        else:
+            moving.append(bet)
+
+    def _unindex_bet(self, bet: Bet) -> None:
+        by_key, by_type, moving = self._index
+        bets = by_type[type(bet)]
+        bets.remove(bet)
+        if not bets:
+            del by_type[type(bet)]
+        if not _is_moving(bet):
+            bets = by_key[bet._placed_key]
+            bets.remove(bet)
+            if not bets:
+                del by_key[bet._placed_key]
+        else:
+            moving.remove(bet)
+
+    def placed(self, key: Hashable) -> list[Bet]:
+        """Return the bets with ``_placed_key == key``, in list order."""
+        by_key, _, moving = self._get_index()
+        bets = by_key.get(key, [])
+        moved = [bet for bet in moving if bet._placed_key == key]
+        if moved and bets:
+            return [bet for bet in self if bet._placed_key == key]
+        return list(moved or bets)
+
+    def of_type(self, bet_type: type[Bet] | tuple[type[Bet], ...]) -> list[Bet]:
+        """Return the bets that are instances of ``bet_type``, in list order."""
+        _, by_type, _ = self._get_index()
+        groups = [bets for cls, bets in by_type.items() if issubclass(cls, bet_type)]
+        if len(groups) > 1:
+            return [bet for bet in self if isinstance(bet, bet_type)]
+        return list(groups[0]) if groups else []
+
+    def _active_numbers(self, bet: Bet, point: int | None, table: "Table"):
+        """Return the active numbers of ``bet``, cached by placement key and point."""
+        key = (bet._placed_key, point)
+        numbers = self._active.get(key)
+        if numbers is None:
+            numbers = self._active[key] = bet.get_active_numbers(table)
+        return numbers
+
+    def settling(self, table: "Table") -> Sequence[Bet]:
+        """Return the bets that the latest roll of ``table`` can change.
+
+        These are the bets whose :meth:`~crapssim.bet.Bet.get_active_numbers`
+        contain the dice total, in list order. Every other bet would get a
+        result of nothing won or lost and stay on the layout, so settling only
+        these bets changes the bankroll exactly as settling all of them.
+
+        Active numbers are kept per placement key and point number, so they
+        must not depend on any other state of the table or bet.
+
+        Returns:
+            Sequence[Bet]: The bets to settle. Settling may remove bets from
+            this list; the returned sequence is not affected.
+        """
+        total = table.dice.total
+        if total not in ALL_DICE_NUMBERS:
+            return self[:]
+        point = table.point.number
+        _, _, moving = self._get_index()
+        key = (total, point, *(bet._placed_key for bet in moving))
+        if self._settling is None:
+            self._settling = {}
+        bets = self._settling.get(key)
+        if bets is None:
+            bets = self._settling[key] = tuple(
+                bet for bet in self if total in self._active_numbers(bet, point, table)
+            )
+        return bets
+
+    def active_numbers(self, table: "Table") -> set[int]:
+        """Return the dice totals that can change any of the bets on ``table``."""
+        point = table.point.number
+        return set().union(*(self._active_numbers(bet, point, table) for bet in self))
+
+    def __contains__(self, bet: object) -> bool:
+        if not isinstance(bet, Bet):
+            return super().__contains__(bet)
+        return any(x is bet or x == bet for x in self.placed(bet._placed_key))
+
+    def append(self, bet: Bet) -> None:
+        """Append a bet to the end of the list."""
+        super().append(bet)
+        self._changed()
+        if self._index is not None:
+            self._index_bet(bet)
+        if self._layout is not None:
+            codes, layout, volatile = self._layout
+            if _is_volatile(bet):
+                self._layout = codes, layout, volatile + (bet,)
+            else:
+                code = _bet_code(bet, codes)
+                i = bisect.bisect(layout, code)
+                self._layout = codes, layout[:i] + (code,) + layout[i:], volatile
+
+    def extend(self, bets: Iterable[Bet]) -> None:
+        """Append each of the bets to the end of the list."""
+        for bet in bets:
+            self.append(bet)
+
+    def remove(self, bet: Bet) -> None:
+        """Remove the first bet equal to ``bet``.
+
+        Raises:
+            ValueError: If no bet is equal to ``bet``.
+        """
+        if not isinstance(bet, Bet):
+            self._changed()
+            self._index = self._layout = None
+            return super().remove(bet)
+        for placed in self.placed(bet._placed_key):
+            if placed is bet or placed == bet:
+                break
+        else:
+            raise ValueError(f"{bet!r} is not in the list")
+        for i, x in enumerate(self):
+            if x is placed:
+                super().__delitem__(i)
+                break
+        self._changed()
+        self._unindex_bet(placed)
+        if self._layout is not None:
+            codes, layout, volatile = self._layout
+            if _is_volatile(placed):
+                volatile = tuple(x for x in volatile if x is not placed)
+            else:
+                i = layout.index(_bet_code(placed, codes))
+                layout = layout[:i] + layout[i + 1 :]
+            self._layout = codes, layout, volatile
+
+    insert = _invalidates_cache(list.insert)
+    pop = _invalidates_cache(list.pop)
+    clear = _invalidates_cache(list.clear)
+    sort = _invalidates_cache(list.sort)
+    reverse = _invalidates_cache(list.reverse)
+    __setitem__ = _invalidates_cache(list.__setitem__)
+    __delitem__ = _invalidates_cache(list.__delitem__)
+    __iadd__ = _invalidates_cache(list.__iadd__)
+    __imul__ = _invalidates_cache(list.__imul__)
+
+
+def _combined_amount(existing_bets: Sequence[Bet], bet: Bet) -> float:
+    """Amount of ``sum(existing_bets + [bet])``, without copying any bets.
+
+    The amounts are added in the same order. Summing bets starts from
+    ``0 + existing_bets[0]``, which subtracts the 0 as a float (see
+    :meth:`Bet.__add__`), so the first amount is converted with ``float``.
+    """
+    if not existing_bets:
+        return float(bet.amount)
+    total = float(existing_bets[0].amount)
+    for i in range(1, len(existing_bets)):
+        total += existing_bets[i].amount
+    return total + bet.amount
 
 
 class Player:
     """Active participant at a :class:`Table` with a bankroll and bets."""
 
+    # As for bets, the dict is only created if something else is set on a
+    # player, like a mocked method in a test.
+    __slots__ = ("bankroll", "strategy", "name", "_bets", "_table", "__dict__")
+
     def __init__(
         self,
         table: Table,
@@ -374,10 +1456,49 @@ class Player:
         self.bets: list[Bet] = []
         self._table: Table = table
 
+    @property
+    def bets(self) -> list[Bet]:
+        """Bets the player has on the layout.
+
+        The list keeps its totals (see :attr:`total_bet_amount`) until it is
+        changed. Assigning a new list of bets is supported.
+        """
+        return self._bets
+
+    @bets.setter
+    def bets(self, bets: Iterable[Bet]) -> None:
+        self._bets: _BetList = _BetList(bets)
+
+    @property
+    def total_wagered(self) -> float:
+        """Total amount of the bets on the layout, without vigs."""
+        return self._bets.totals()[0]
+
+    @property
+    def total_vig(self) -> float:
+        """Vig paid up front on the bets on the layout, recovered if they are taken down."""
+        return self._bets.costs(self._table)[1]
+
     @property
     def total_bet_amount(self) -> float:
         """Total amount currently wagered on the layout (plus any recoverable vigs)."""
-        return sum(x.cost(self.table) for x in self.bets)
+        total, cost_bets = self._bets.totals()
+        if not cost_bets:
+            return total
+        return self._bets.costs(self._table)[0]
+
+    @property
+    def state_key(self) -> tuple[int, ...]:
+        """Hashable key of the player's layout, the same for equal layouts.
+
+        The key holds a small int for the state of each bet (its class,
+        amount, number and anything else that affects how it settles, see
+        :meth:`Bet.get_state`), sorted, so it does not depend on the order
+        the bets were placed in. The ints are handed out by the player's
+        table as bet states are seen, so keys should only be compared
+        between players at the same table.
+        """
+        return self._bets.state_key(self._table._bet_codes)
 
     @property
     def total_player_cash(self) -> float:
@@ -392,20 +1513,57 @@ class Player:
     def add_bet(self, bet: Bet) -> None:
         """Attempt to place a bet while respecting bankroll and bet stacking rules.
 
+        A bet with the placement key of bets already on the layout is added to
+        them: the combined bet must be allowed and affordable, and replaces
+        them at the end of the layout. A single placed bet is increased in
+        place rather than replaced by a copy.
+
         Returns:
             None: Always returns ``None``.
         """
+        table = self._table
         existing_bets: list[Bet] = self.already_placed_bets(bet)
-        existing_cost = sum(x.cost(self.table) for x in existing_bets)
-        new_bet = sum(existing_bets + [bet])
-        new_cost = new_bet.cost(self.table)
-        required_cash = new_cost - existing_cost
-
-        if new_bet.is_allowed(self) and required_cash <= self.bankroll + 1e-9:
-            for bet in existing_bets:
-                self.bets.remove(bet)
+        new_amount = _combined_amount(existing_bets, bet)
+        if len(existing_bets) == 1:
+            # Price the combined bet on the placed bet itself instead of a copy
+            new_bet = existing_bets[0]
+            amount = new_bet.amount
+            existing_cost = new_bet.cost(table)
+            try:
+                new_bet.amount = new_amount
+                required_cash = new_bet.cost(table) - existing_cost
+                allowed = new_bet.is_allowed(self)
+            finally:
+                new_bet.amount = amount
+        else:
+            existing_cost = sum(x.cost(table) for x in existing_bets)
+            new_bet = copy.copy(existing_bets[0] if existing_bets else bet)
+            new_bet.amount = new_amount
+            required_cash = new_bet.cost(table) - existing_cost
+            allowed = new_bet.is_allowed(self)
+
+        if allowed and required_cash <= self.bankroll + 1e-9:
+            for existing_bet in existing_bets:
+                self._bets.remove(existing_bet)
             self.bankroll -= required_cash
-            self.bets.append(new_bet)
+            new_bet.amount = new_amount
+            self._bets.append(new_bet)
+            if table._observers:
+                table.emit(
+                    BetPlacedEvent(
+                        table.dice.n_rolls, table.n_shooters, self, bet, required_cash
+                    )
+                )
+        elif table._observers:
+            table.emit(
+                BetRejectedEvent(
+                    table.dice.n_rolls,
+                    table.n_shooters,
+                    self,
+                    bet,
+                    "insufficient_bankroll" if allowed else "not_allowed",
+                )
+            )
 
     def already_placed_bets(self, bet: Bet) -> list[Bet]:
         """Return existing bets with the same placement key as ``bet``.
@@ -416,7 +1574,7 @@ class Player:
         Returns:
             list[Bet]: Bets already placed with the same key.
         """
-        return [x for x in self.bets if x._placed_key == bet._placed_key]
+        return self._bets.placed(bet._placed_key)
 
     def already_placed(self, bet: Bet) -> bool:
         """Check whether a bet with the same placement key already exists.
@@ -440,7 +1598,7 @@ class Player:
         Returns:
             list[Bet]: Bets whose type matches ``bet_type``.
         """
-        return [x for x in self.bets if isinstance(x, bet_type)]
+        return self._bets.of_type(bet_type)
 
     def has_bets(self, bet_type: type[Bet] | tuple[type[Bet], ...]) -> bool:
         """Return True if any bet of ``bet_type`` is currently on the layout.
@@ -475,11 +1633,15 @@ class Player:
     def update_bet(self, verbose: bool = False) -> None:
         """Resolve outstanding bets against the latest roll.
 
+        Bets that are taken down or pay out are reported to the table's
+        observers as a :class:`~crapssim.events.BetResolvedEvent`.
+
         Returns:
             None: Always returns ``None``.
         """
-        for bet in self.bets[:]:
-            result: BetResult = bet.get_result(self.table)
+        table = self._table
+        for bet in self.bets[:] if verbose else self._bets.settling(table):
+            result: BetResult = bet.get_result(table)
             self.bankroll += result.bankroll_change
 
             if verbose:
@@ -488,6 +1650,13 @@ class Player:
             if result.remove:
                 self.bets.remove(bet)
 
+            if table._observers and (result.remove or result.amount != 0):
+                table.emit(
+                    BetResolvedEvent(
+                        table.dice.n_rolls, table.n_shooters, self, bet, result
+                    )
+                )
+
     def print_bet_update(self, bet: Bet, result: BetResult) -> None:
         """Emit verbose logging for a bet resolution.
 
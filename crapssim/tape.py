@@ -0,0 +1,289 @@
+"""
+Roll tapes store a sequence of dice rolls compactly so they can be replayed
+against many strategies. A tape is a NumPy ``uint8`` array of shape ``(n, 2)``
+holding one pair of dice per row, and is saved as a ``.npy`` file that can be
+memory-mapped when replaying, so tapes larger than memory can be used.
+
+Record the rolls of a random run by attaching a :class:`RollRecorder` to the
+dice, and replay a tape with :meth:`crapssim.table.Table.fixed_run`::
+
+    recorder = RollRecorder()
+    table.dice.recorder = recorder
+    table.run(max_rolls=1000)
+    recorder.save("rolls.npy")
+
+    other_table.fixed_run(load_tape("rolls.npy"))
+
+Logs of real rolls, with one ``d1 d2`` or ``d1,d2`` pair per line, are read in
+chunks with :class:`RollLogReader`, which can be replayed the same way::
+
+    table.fixed_run(RollLogReader("floor_rolls.csv"))
+"""
+
+import gzip
+import os
+import re
+from itertools import islice
+from typing import Iterable, Iterator, Literal
+
+import numpy as np
+
+from crapssim.dice import (
+    _DICE_PAIRS_ARRAY,
+    DEFAULT_BUFFER_SIZE,
+    DICE_PAIRS,
+    DicePair,
+)
+
+__all__ = [
+    "RollRecorder",
+    "RollLogReader",
+    "RollLogError",
+    "load_tape",
+    "tape_outcomes",
+    "iter_tape",
+]
+
+_ROLL_LINE = re.compile(rb"\s*([1-6])\s*[,\s]\s*([1-6])\s*")
+_SEPARATORS = np.frombuffer(b", \t", dtype=np.uint8)
+
+
+class RollRecorder:
+    """
+    Record every roll of a :class:`~crapssim.dice.Dice` into a growable buffer
+
+    Rolls are kept as one ``uint8`` outcome index per roll (see
+    :data:`crapssim.dice.DICE_PAIRS`) and expanded to pairs of dice when read
+    with :attr:`rolls` or saved with :meth:`save`. Attach a recorder by setting
+    ``dice.recorder``; both random and fixed rolls are recorded.
+    """
+
+    def __init__(self) -> None:
+        self._outcomes: bytearray = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n_rolls={len(self)})"
+
+    def append(self, outcome: int) -> None:
+        """Record one roll, given by its outcome index (0 to 35)."""
+        self._outcomes.append(outcome)
+
+    def clear(self) -> None:
+        """Forget all recorded rolls."""
+        self._outcomes.clear()
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        """Read-only ``uint8`` array of the recorded outcome indices."""
+        return np.frombuffer(bytes(self._outcomes), dtype=np.uint8)
+
+    @property
+    def rolls(self) -> np.ndarray:
+        """``uint8`` tape of shape ``(n, 2)`` with the recorded pairs of dice."""
+        return _DICE_PAIRS_ARRAY[self.outcomes]
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save the recorded rolls as a ``.npy`` tape, see :func:`load_tape`.
+
+        Args:
+            path: File to write.
+        """
+        np.save(path, self.rolls)
+
+
+def load_tape(path: str | os.PathLike, mmap: bool = True) -> np.ndarray:
+    """Load a tape saved with :meth:`RollRecorder.save` (or ``np.save``).
+
+    Args:
+        path: The ``.npy`` file to load.
+        mmap: If True (default), memory-map the file read-only instead of
+            reading it into memory.
+
+    Returns:
+        np.ndarray: Array of shape ``(n, 2)`` with one pair of dice per row.
+
+    Raises:
+        ValueError: If the file does not hold an ``(n, 2)`` integer array.
+    """
+    rolls = np.load(path, mmap_mode="r" if mmap else None)
+    if rolls.ndim != 2 or rolls.shape[1] != 2 or rolls.dtype.kind not in "iu":
+        raise ValueError(
+            f"A tape must be an (n, 2) integer array, got {rolls.dtype} {rolls.shape}"
+        )
+    return rolls
+
+
+def tape_outcomes(rolls: np.ndarray, start: int = 0) -> np.ndarray:
+    """Return the outcome index of each row of a tape.
+
+    Args:
+        rolls: Array of shape ``(n, 2)`` with one pair of dice per row.
+        start: Number of rows of the whole tape before ``rolls``, used in
+            error messages.
+
+    Returns:
+        np.ndarray: Integer array of ``n`` outcome indices (0 to 35).
+
+    Raises:
+        ValueError: If the array has the wrong shape or a die is not 1 to 6.
+    """
+    rolls = np.asarray(rolls)
+    if rolls.ndim != 2 or rolls.shape[1] != 2:
+        raise ValueError(f"A tape must have shape (n, 2), got {rolls.shape}")
+    valid = np.all((rolls >= 1) & (rolls <= 6), axis=1)
+    if not valid.all():
+        row = int(np.argmin(valid))
+        raise ValueError(
+            f"Invalid dice outcome {tuple(rolls[row].tolist())} "
+            f"at roll {start + row + 1} of the tape"
+        )
+    return 6 * rolls[:, 0].astype(np.intp) + rolls[:, 1] - 7
+
+
+def iter_tape(
+    rolls: np.ndarray | Iterable[np.ndarray], chunk_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[DicePair]:
+    """Yield the rolls of a tape as pairs of dice, one chunk at a time.
+
+    The pairs are the shared tuples of :data:`crapssim.dice.DICE_PAIRS`, so no
+    tuple is created per roll, and only ``chunk_size`` rows of a memory-mapped
+    tape are read at a time.
+
+    Args:
+        rolls: A tape of shape ``(n, 2)``, or an iterable of such arrays (for
+            example chunks read from a roll log).
+        chunk_size: Number of rows converted at a time.
+
+    Yields:
+        DicePair: Each roll of the tape, in order.
+
+    Raises:
+        ValueError: If a row of the tape is not a valid pair of dice.
+    """
+    chunks = [rolls] if isinstance(rolls, np.ndarray) else rolls
+    position = 0
+    for chunk in chunks:
+        for start in range(0, len(chunk), chunk_size):
+            outcomes = tape_outcomes(chunk[start : start + chunk_size], position)
+            position += len(outcomes)
+            yield from map(DICE_PAIRS.__getitem__, outcomes.tolist())
+
+
+class RollLogError(ValueError):
+    """A line of a roll log is not a valid pair of dice."""
+
+    def __init__(self, line_number: int, line: str) -> None:
+        super().__init__(f"Malformed roll on line {line_number}: {line!r}")
+        self.line_number: int = line_number
+        """Line number in the log, starting at 1"""
+        self.line: str = line
+        """Content of the line, without the line ending"""
+
+
+class RollLogReader:
+    """
+    Read a log of dice rolls in chunks
+
+    Each line holds one roll as two dice from 1 to 6, separated by a comma
+    and/or whitespace, e.g. ``3,4`` or ``3 4``. Blank lines and lines starting
+    with ``#`` are ignored. Files ending in ``.gz`` are decompressed on the fly.
+
+    Iterating over the reader yields ``uint8`` arrays of shape ``(n, 2)`` with
+    at most ``chunk_size`` rolls each, so memory use does not depend on the size
+    of the log. Each iteration reads the file again from the start. The reader
+    can be passed directly to :meth:`crapssim.table.Table.fixed_run`.
+
+    Args:
+        path: The log file.
+        chunk_size: Maximum number of rolls per chunk.
+        errors: What to do with a malformed line: ``"raise"`` (default) raises
+            :class:`RollLogError`, ``"skip"`` leaves the line out and records it
+            in :attr:`malformed_lines`.
+        header: If True, ignore the first line of the file.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        chunk_size: int = DEFAULT_BUFFER_SIZE,
+        errors: Literal["raise", "skip"] = "raise",
+        header: bool = False,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if errors not in ("raise", "skip"):
+            raise ValueError(f"errors must be 'raise' or 'skip', got {errors!r}")
+        self.path: str | os.PathLike = path
+        self.chunk_size: int = chunk_size
+        self.errors: Literal["raise", "skip"] = errors
+        self.header: bool = header
+        self.n_rolls: int = 0
+        """Number of rolls read by the latest iteration"""
+        self.malformed_lines: list[tuple[int, str]] = []
+        """Line number and content of each line skipped by the latest iteration"""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def _open(self):
+        if os.fspath(self.path).endswith(".gz"):
+            return gzip.open(self.path, "rb")
+        return open(self.path, "rb")
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        self.n_rolls = 0
+        self.malformed_lines = []
+        with self._open() as file:
+            line_number = 0
+            if self.header and next(file, None) is not None:
+                line_number = 1
+            while lines := list(islice(file, self.chunk_size)):
+                chunk = _parse_fixed_width(lines)
+                if chunk is None:
+                    chunk = self._parse_lines(lines, line_number)
+                line_number += len(lines)
+                if len(chunk) > 0:
+                    self.n_rolls += len(chunk)
+                    yield chunk
+
+    def _parse_lines(self, lines: list[bytes], line_number: int) -> np.ndarray:
+        """Parse lines one at a time, skipping or reporting malformed ones."""
+        rolls = bytearray()
+        for line_number, line in enumerate(lines, start=line_number + 1):
+            match = _ROLL_LINE.fullmatch(line)
+            if match is not None:
+                rolls += match[1]
+                rolls += match[2]
+                continue
+            text = line.decode(errors="replace").rstrip("\r\n")
+            if text.strip() == "" or text.lstrip().startswith("#"):
+                continue
+            if self.errors == "raise":
+                raise RollLogError(line_number, text)
+            self.malformed_lines.append((line_number, text))
+        return (np.frombuffer(rolls, dtype=np.uint8) - ord("0")).reshape(-1, 2)
+
+
+def _parse_fixed_width(lines: list[bytes]) -> np.ndarray | None:
+    """Parse lines that are all exactly ``d1<sep>d2<newline>``, or return None.
+
+    Most logs are written in this form, which can be checked and converted
+    for the whole chunk at once rather than line by line.
+    """
+    width = len(lines[0])
+    data = b"".join(lines)
+    if width not in (4, 5) or len(data) != width * len(lines):
+        return None
+    table = np.frombuffer(data, dtype=np.uint8).reshape(-1, width)
+    dice = table[:, [0, 2]] - ord("0")
+    ending = b"\n" if width == 4 else b"\r\n"
+    if not (
+        np.all((dice >= 1) & (dice <= 6))
+        and np.all(np.isin(table[:, 1], _SEPARATORS))
+        and np.all(table[:, 3:] == np.frombuffer(ending, dtype=np.uint8))
+    ):
+        return None
+    return dice
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from crapssim import Table
+from crapssim.batch import compare_actions, compare_strategies, run_sessions
+from crapssim.bet import Place
+from crapssim.dice import Dice, OutcomeTableDice
+from crapssim.strategy import BetDontPass, BetPassLine
+from crapssim.strategy.tools import NullStrategy
+
+
+def test_compare_strategies_matches_separate_tables():
+    comparison = compare_strategies(
+        {"pass": BetPassLine(5), "dont": BetDontPass(5)},
+        n_sessions=4,
+        max_rolls=30,
+        root_seed=8,
+    )
+    assert comparison.names == ("pass", "dont")
+    assert comparison.net.shape == (4, 2)
+
+    for session in range(4):
+        table = Table.from_seed_stream(8, session)
+        table.add_player(strategy=BetPassLine(5))
+        table.run(max_rolls=30, verbose=False)
+        net = table.players[0].total_player_cash - 100
+        assert comparison.net[session, 0] == pytest.approx(net)
+
+
+def test_paired_difference():
+    comparison = compare_strategies(
+        [BetPassLine(5), BetDontPass(5)], n_sessions=20, max_rolls=50, root_seed=8
+    )
+    first, second = comparison.names
+    difference = comparison.difference(first, second)
+    d = comparison.net[:, 0] - comparison.net[:, 1]
+
+    assert difference.mean == pytest.approx(d.mean())
+    assert difference.std_error == pytest.approx(np.std(d, ddof=1) / np.sqrt(20))
+    # pass and don't pass win on opposite rolls, so pairing adds variance
+    assert difference.variance_reduction < 1
+    assert comparison.mean()[first] == pytest.approx(comparison.net[:, 0].mean())
+
+
+def test_compare_strategies_requires_distinct_names():
+    with pytest.raises(ValueError):
+        compare_strategies([BetPassLine(5), BetPassLine(5)], 1, 10)
+
+
+def test_run_sessions_antithetic():
+    results = run_sessions(
+        BetPassLine(5), n_sessions=10, max_rolls=20, root_seed=8, antithetic=True
+    )
+    plain = run_sessions(BetPassLine(5), n_sessions=10, max_rolls=20, root_seed=8)
+
+    np.testing.assert_array_equal(results.net, plain.net)
+    assert results.antithetic_net.shape == (10,)
+    assert results.mean == pytest.approx(
+        (results.net.mean() + results.antithetic_net.mean()) / 2
+    )
+    assert plain.variance_reduction == 1
+    assert results.variance_reduction > 0
+
+
+def test_antithetic_twin_of_monotone_payoff_is_perfectly_negative():
+    table = Table.from_seed_stream(8, 0)
+    twin = Table.from_seed_stream(8, 0, antithetic=True)
+    for _ in range(100):
+        table.dice.roll()
+        twin.dice.roll()
+        assert table.dice.total - 7 == 7 - twin.dice.total
+
+
+def _table_with_place_six():
+    table = Table(seed=2)
+    table.add_player(bankroll=100, strategy=NullStrategy())
+    table.players[0].add_bet(Place(6, 6))
+    table.fixed_run([(2, 2)])
+    return table
+
+
+def test_compare_actions():
+    table = _table_with_place_six()
+    player = table.players[0]
+    comparison = compare_actions(
+        table,
+        {
+            "keep": lambda t: None,
+            "press": lambda t: t.players[0].add_bet(Place(6, 6)),
+            "take down": lambda t: t.players[0].remove_bet(t.players[0].bets[0]),
+        },
+        n_continuations=50,
+        max_rolls=3,
+        root_seed=1,
+    )
+
+    assert comparison.net.shape == (50, 3)
+    assert np.all(comparison.net[:, 2] == 0)
+    # pressing doubles every win and loss of the same continuation
+    assert np.array_equal(comparison.net[:, 1], 2 * comparison.net[:, 0])
+    assert comparison.difference("press", "keep").variance_reduction > 1
+
+    assert player.bets == [Place(6, 6)] and player.bankroll == 94
+    assert table.dice.n_rolls == 1
+
+
+def test_compare_actions_keeps_dice_model():
+    table = _table_with_place_six()
+    # 6s and 7s only, the place bet wins with probability 4/5 on every roll
+    weights = [0] * 36
+    weights[0 * 6 + 4] = weights[1 * 6 + 3] = 2  # (1, 5), (2, 4)
+    weights[0 * 6 + 5] = 1  # (1, 6)
+    table.dice = Dice(2, model=OutcomeTableDice(weights))
+    comparison = compare_actions(
+        table, {"keep": lambda t: None}, n_continuations=200, max_rolls=1
+    )
+    wins = np.mean(comparison.net[:, 0] == 7)
+    assert set(np.unique(comparison.net[:, 0])) <= {-6, 7}
+    assert wins == pytest.approx(4 / 5, abs=0.08)
+
+
+def test_compare_actions_is_reproducible():
+    actions = {"keep": lambda t: None, "again": lambda t: None}
+    first = compare_actions(_table_with_place_six(), actions, 10, 20, root_seed=3)
+    second = compare_actions(_table_with_place_six(), actions, 10, 20, root_seed=3)
+
+    assert np.array_equal(first.net, second.net)
+    assert np.array_equal(first.net[:, 0], first.net[:, 1])
+    with pytest.raises(ValueError):
+        compare_actions(_table_with_place_six(), {}, 10, 20)
@@ -1,3 +1,5 @@
+import copy
+import gc
 import math
 
 import numpy as np
@@ -19,6 +21,7 @@ from crapssim.bet import (
     Two,
     World,
     Yo,
+    compiled_settings,
 )
 from crapssim.strategy.tools import NullStrategy
 from crapssim.table import Table, TableUpdate
@@ -451,3 +454,227 @@ def test_dont_come_bet_pushes_on_12():
 
     assert result.pushed
     assert result.bankroll_change == dont_come_bet.amount
+
+
+@pytest.mark.parametrize("point", [None, 4, 6, 9])
+@pytest.mark.parametrize(
+    "bet",
+    [
+        crapssim.bet.PassLine(5),
+        crapssim.bet.DontPass(5),
+        crapssim.bet.Come(5),
+        crapssim.bet.Come(5, 8),
+        crapssim.bet.DontCome(5),
+        crapssim.bet.DontCome(5, 5),
+        crapssim.bet.Odds(crapssim.bet.PassLine, 6, 10),
+        crapssim.bet.Odds(crapssim.bet.DontCome, 4, 10, always_working=True),
+        crapssim.bet.Place(6, 6),
+        crapssim.bet.Buy(4, 20),
+        crapssim.bet.Lay(10, 20),
+        crapssim.bet.Put(8, 10),
+        crapssim.bet.Field(5),
+        crapssim.bet.Big6(5),
+        crapssim.bet.HardWay(8, 5),
+        crapssim.bet.Hop((2, 3), 5),
+        crapssim.bet.Fire(5),
+        crapssim.bet.All(5),
+        crapssim.bet.Small(5),
+    ],
+)
+def test_inactive_numbers_leave_bet_unchanged(bet, point):
+    table = Table()
+    table.point.number = point
+    table.add_player(strategy=NullStrategy())
+    active = bet.get_active_numbers(table)
+
+    for d1 in range(1, 7):
+        for d2 in range(1, 7):
+            if d1 + d2 in active:
+                continue
+            test_bet = copy.deepcopy(bet)
+            table.dice.fixed_roll((d1, d2))
+            result = test_bet.get_result(table)
+            test_bet.update_number(table)
+            assert (result.amount, result.remove) == (0, False)
+            assert repr(test_bet) == repr(bet)
+            assert test_bet.get_state() == bet.get_state()
+
+
+@pytest.mark.parametrize(
+    "bet",
+    [
+        crapssim.bet.PassLine(5),
+        crapssim.bet.Come(5, 6),
+        crapssim.bet.Odds(crapssim.bet.DontCome, 4, 12, True),
+        crapssim.bet.Place(6, 6),
+        crapssim.bet.Hop((2, 3), 5),
+        crapssim.bet.Fire(5),
+        crapssim.bet.Tall(5),
+    ],
+)
+def test_bet_state_round_trip(bet):
+    state = bet.get_state()
+    restored = crapssim.bet.Bet.from_state(state)
+
+    assert type(restored) is type(bet)
+    assert restored == bet
+    assert restored.get_state() == state
+
+
+def test_bet_state_copies_sets():
+    bet = crapssim.bet.Fire(5)
+    bet.points_made.add(4)
+    state = bet.get_state()
+    bet.points_made.add(5)
+
+    first = crapssim.bet.Bet.from_state(state)
+    first.points_made.add(6)
+    second = crapssim.bet.Bet.from_state(state)
+    assert second.points_made == {4}
+    assert first.points_made == {4, 6}
+
+
+@pytest.mark.parametrize(
+    "bet",
+    [
+        PassLine(5),
+        crapssim.bet.DontPass(5),
+        Come(5),
+        Come(5, 6),
+        DontCome(5, 9),
+        Odds(PassLine, 4, 10),
+        Odds(crapssim.bet.DontPass, 6, 12, always_working=True),
+        Odds(Come, 5, 7.5),
+        crapssim.bet.Place(6, 6),
+        crapssim.bet.Place(9, 7),
+        crapssim.bet.Put(8, 5),
+        CAndE(1),
+        Horn(4),
+        World(5),
+        Any7(3),
+        Two(1),
+        crapssim.bet.HardWay(8, 2),
+        crapssim.bet.Big6(5),
+        crapssim.bet.Field(5),
+        crapssim.bet.Buy(4, 20),
+        crapssim.bet.Lay(10, 40),
+        Hop((2, 3), 1),
+        Hop((4, 4), 1),
+    ],
+)
+@pytest.mark.parametrize("point", [None, 4, 6, 10])
+def test_tabulated_results_match_computed_results(bet, point):
+    assert bet.tabulated
+    computed = copy.copy(bet)
+    computed.tabulated = False
+    table = Table()
+    table.point.number = point
+
+    for d1 in range(1, 7):
+        for d2 in range(1, 7):
+            table.dice.fixed_roll((d1, d2))
+            assert bet.get_result(table) == computed.get_result(table)
+
+
+@pytest.mark.parametrize("bet", [crapssim.bet.Fire(1), crapssim.bet.All(1)])
+def test_stateful_bets_are_not_tabulated(bet):
+    assert not bet.tabulated
+
+
+def test_untabulated_dice_are_computed():
+    table = Table()
+    table.dice.result = (10, 1)
+    assert table.dice.outcome is None
+    assert PassLine(5).get_result(table) == crapssim.bet.BetResult(10, True, 5)
+
+
+def test_payout_tables_drop_least_recently_used(monkeypatch):
+    monkeypatch.setattr(
+        crapssim.bet, "_PAYOUT_TABLES", type(crapssim.bet._PAYOUT_TABLES)()
+    )
+    monkeypatch.setattr(crapssim.bet, "_MAX_PAYOUT_TABLES", 2)
+    tables = crapssim.bet._PAYOUT_TABLES
+    table = Table()
+    table.dice.fixed_roll((3, 4))
+    for amount in (5, 10, 5, 15):
+        assert PassLine(amount).get_result(table).amount == 2 * amount
+    assert [amount for _, amount in tables] == [5, 15]
+
+
+def test_compiled_settings_follow_changes():
+    table = Table()
+    compiled = compiled_settings(table.settings)
+    assert compiled_settings(table.settings) is compiled
+    assert compiled.field_payouts[2] == 2.0 and compiled.field_payouts[5] == 0.0
+    assert compiled.fire_payouts[:4] == (None, None, None, None)
+    assert compiled.max_odds[6] == 5
+
+    table.dice.fixed_roll((1, 1))
+    assert crapssim.bet.Field(5).get_result(table).amount == 15
+    table.settings["field_payouts"].update({2: 3})
+    assert compiled_settings(table.settings).version != compiled.version
+    assert crapssim.bet.Field(5).get_result(table).amount == 20
+
+    table.settings["field_payouts"][2] = 2
+    assert compiled_settings(table.settings) is compiled
+    table.settings["vig_paid_on_win"] = True
+    assert compiled_settings(table.settings).vig_paid_on_win
+    del table.settings["vig_paid_on_win"]
+    assert compiled_settings(table.settings).vig_paid_on_win
+
+
+def test_equal_settings_share_compiled_settings():
+    tables = [Table(), Table(), copy.deepcopy(Table())]
+    versions = {compiled_settings(t.settings).version for t in tables}
+    assert len(versions) == 1
+
+    tables[2].settings["hop_payouts"]["easy"] = 16
+    assert compiled_settings(tables[2].settings).version not in versions
+    assert compiled_settings({**tables[0].settings}).version in versions
+
+
+def test_compiled_vig_per_amount():
+    table = Table()
+    table.settings["vig_rounding"] = "none"
+    compiled = compiled_settings(table.settings)
+    assert compiled.vig(30.0) == crapssim.bet._compute_vig(30.0, "none") == 1.5
+    assert crapssim.bet.Buy(4, 30).cost(table) == 31.5
+
+
+@pytest.mark.parametrize(
+    "bet",
+    [
+        crapssim.bet.Place(6, 6),
+        crapssim.bet.Lay(4, 20),
+        crapssim.bet.Odds(PassLine, 4, 10),
+        crapssim.bet.Fire(5),
+        crapssim.bet.All(5),
+        crapssim.bet.Big8(5),
+    ],
+)
+def test_bets_keep_attributes_in_slots(bet):
+    bet.get_state()
+    copy.copy(bet)
+    assert not any(isinstance(x, dict) for x in gc.get_referents(bet))
+
+
+def test_bet_subclass_state_keeps_extra_attributes():
+    class MyBet(Yo):
+        def __init__(self, amount, label):
+            super().__init__(amount)
+            self.label = label
+
+    restored = crapssim.bet.Bet.from_state(MyBet(1, "mine").get_state())
+    assert (restored.amount, restored.label) == (1, "mine")
+
+
+def test_shared_numbers_and_results():
+    table = Table()
+    table.dice.fixed_roll((1, 2))
+    place = crapssim.bet.Place(6, 6)
+    assert place.winning_numbers is crapssim.bet.Place(6, 12).winning_numbers == (6,)
+    assert place.payout_ratio == 7 / 6
+    assert place.get_result(table) is place.get_result(table)
+    fire = crapssim.bet.Fire(5)
+    assert fire.get_result(table) is crapssim.bet.Fire(5).get_result(table)
+    assert fire.get_result(table) == crapssim.bet.BetResult(0, False, 5)
@@ -1,6 +1,16 @@
+import numpy as np
 import pytest
 
-from crapssim.dice import Dice
+from crapssim.dice import (
+    DICE_PAIRS,
+    OUTCOME_TOTALS,
+    Dice,
+    FaceWeightedDice,
+    OutcomeTableDice,
+    UniformDice,
+    outcome_index,
+    session_seed,
+)
 
 
 @pytest.fixture
@@ -49,3 +59,298 @@ def test_roll_seed_idential(seed):
     d2.roll()
     assert d1.result == d2.result
     assert d1.total == d2.total
+
+
+@pytest.mark.parametrize("seed", [8, 15, 21234, 0])
+@pytest.mark.parametrize("buffer_size", [1, 7, 64, 65_536])
+def test_buffered_roll_matches_unbuffered(seed, buffer_size):
+    d1 = Dice(seed)
+    d2 = Dice(seed, buffer_size=buffer_size)
+
+    for _ in range(200):
+        d1.roll()
+        d2.roll()
+        assert d1.result == d2.result
+        assert d1.total == d2.total
+    assert d1.n_rolls == d2.n_rolls == 200
+
+
+def test_buffered_roll_with_fixed_rolls_mixed_in():
+    d1 = Dice(8)
+    d2 = Dice(8, buffer_size=16)
+
+    for i in range(50):
+        if i % 3 == 0:
+            d1.fixed_roll((1, 1))
+            d2.fixed_roll((1, 1))
+        else:
+            d1.roll()
+            d2.roll()
+        assert d1.result == d2.result
+    assert d1.n_rolls == d2.n_rolls == 50
+
+
+@pytest.mark.parametrize("buffer_size", [0, -5])
+def test_buffer_size_must_be_positive(buffer_size):
+    with pytest.raises(ValueError):
+        Dice(buffer_size=buffer_size)
+
+
+def test_no_roll_outcome_record(d1):
+    assert (d1.outcome, d1.result, d1.total, d1.is_hard, d1.pair) == (
+        None,
+        None,
+        None,
+        None,
+        None,
+    )
+
+
+@pytest.mark.parametrize(
+    "roll, outcome, total, is_hard, pair",
+    [
+        ((1, 1), 0, 2, True, (1, 1)),
+        ((2, 2), 7, 4, True, (2, 2)),
+        ((6, 2), 31, 8, False, (2, 6)),
+        ((2, 6), 11, 8, False, (2, 6)),
+        ((6, 6), 35, 12, True, (6, 6)),
+    ],
+)
+def test_fixed_roll_outcome_record(d1, roll, outcome, total, is_hard, pair):
+    d1.fixed_roll(roll)
+    assert (d1.outcome, d1.result, d1.total, d1.is_hard, d1.pair) == (
+        outcome,
+        roll,
+        total,
+        is_hard,
+        pair,
+    )
+    assert DICE_PAIRS[outcome] == roll
+    assert OUTCOME_TOTALS[outcome] == total
+
+
+def test_result_setter_updates_outcome_record(d1):
+    d1.result = [3, 4]
+    assert (d1.outcome, d1.result, d1.total, d1.n_rolls) == (15, (3, 4), 7, 0)
+    d1.result = None
+    assert (d1.outcome, d1.result, d1.total) == (None, None, None)
+
+
+def test_fixed_roll_outside_dice_faces(d1):
+    d1.fixed_roll((10, 1))
+    assert (d1.outcome, d1.result, d1.total, d1.is_hard) == (None, (10, 1), 11, False)
+
+
+@pytest.mark.parametrize("roll", [(0, 1), (3, 7)])
+def test_outcome_index_invalid(roll):
+    with pytest.raises(ValueError):
+        outcome_index(roll)
+
+
+@pytest.mark.parametrize("buffer_size", [None, 16])
+def test_random_roll_outcome_record(buffer_size):
+    dice = Dice(seed=3, buffer_size=buffer_size)
+    for _ in range(100):
+        dice.roll()
+        assert dice.outcome == outcome_index(dice.result)
+        assert dice.total == sum(dice.result)
+        assert dice.is_hard == (dice.result[0] == dice.result[1])
+        assert dice.pair == tuple(sorted(dice.result))
+
+
+@pytest.mark.parametrize("root_seed", [0, 8, 21234])
+def test_seed_stream_matches_spawned_children(root_seed):
+    children = np.random.SeedSequence(root_seed).spawn(5)
+    for i, child in enumerate(children):
+        d1 = Dice(child)
+        d2 = Dice.from_seed_stream(root_seed, i)
+        for _ in range(20):
+            d1.roll()
+            d2.roll()
+            assert d1.result == d2.result
+
+
+def test_seed_stream_independent_of_order():
+    forward = [Dice.from_seed_stream(8, i) for i in range(4)]
+    backward = [Dice.from_seed_stream(8, i) for i in reversed(range(4))][::-1]
+    for d1, d2 in zip(forward, backward):
+        rolls_1 = [(d1.roll(), d1.result)[1] for _ in range(20)]
+        rolls_2 = [(d2.roll(), d2.result)[1] for _ in range(20)]
+        assert rolls_1 == rolls_2
+
+
+def test_seed_stream_sessions_differ():
+    d1 = Dice.from_seed_stream(8, 0)
+    d2 = Dice.from_seed_stream(8, 1)
+    rolls_1 = [(d1.roll(), d1.result)[1] for _ in range(20)]
+    rolls_2 = [(d2.roll(), d2.result)[1] for _ in range(20)]
+    assert rolls_1 != rolls_2
+
+
+def test_session_seed_negative_index():
+    with pytest.raises(ValueError):
+        session_seed(8, -1)
+
+
+@pytest.mark.parametrize("n_rolls", [0, 1, 7, 16, 45])
+def test_seek_matches_sequential_rolls(n_rolls):
+    sequential = Dice(8, buffer_size=16, seekable=True)
+    for _ in range(n_rolls):
+        sequential.roll()
+
+    sought = Dice(8, buffer_size=16, seekable=True)
+    sought.seek(n_rolls)
+    assert sought.n_rolls == n_rolls
+    for _ in range(40):
+        sequential.roll()
+        sought.roll()
+        assert sought.result == sequential.result
+
+
+def test_seek_requires_seekable_dice():
+    with pytest.raises(ValueError):
+        Dice(8).seek(10)
+    with pytest.raises(ValueError):
+        Dice(8, seekable=True).seek(-1)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"buffer_size": 8},
+        {"buffer_size": 8, "seekable": True},
+        {"model": FaceWeightedDice([1, 1, 1, 1, 1, 5])},
+    ],
+)
+def test_get_set_state_continues_stream(kwargs):
+    dice = Dice(8, **kwargs)
+    for _ in range(11):
+        dice.roll()
+    state = dice.get_state()
+    expected = [(dice.roll(), dice.result)[1] for _ in range(20)]
+
+    dice.set_state(state)
+    assert dice.n_rolls == 11
+    assert [(dice.roll(), dice.result)[1] for _ in range(20)] == expected
+
+    restored = Dice.from_state(state)
+    assert [(restored.roll(), restored.result)[1] for _ in range(20)] == expected
+
+
+def test_set_state_layout_mismatch():
+    state = Dice(8, buffer_size=8, seekable=True).get_state()
+    with pytest.raises(ValueError):
+        Dice(8).set_state(state)
+    with pytest.raises(ValueError):
+        Dice(8, buffer_size=16, seekable=True).set_state(state)
+
+    state = Dice(8, model=FaceWeightedDice([1, 1, 1, 1, 1, 5])).get_state()
+    with pytest.raises(ValueError):
+        Dice(8).set_state(state)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"buffer_size": 8, "seekable": True},
+        {"model": FaceWeightedDice([1, 1, 1, 1, 1, 5])},
+    ],
+)
+def test_reseed_keeps_configuration(kwargs):
+    dice = Dice(8, **kwargs)
+    for _ in range(5):
+        dice.roll()
+    result, model = dice.result, dice.model
+    dice.reseed(3)
+    assert (dice.n_rolls, dice.result) == (5, result)
+
+    other = Dice(1, **kwargs)
+    for _ in range(5):
+        other.roll()
+    other.reseed(3)
+    rolls = [(dice.roll(), dice.result)[1] for _ in range(20)]
+    assert rolls == [(other.roll(), other.result)[1] for _ in range(20)]
+    assert dice.model is model and dice.n_rolls == 25
+
+
+def test_set_state_restores_model():
+    model = OutcomeTableDice([1] + [0] * 35)  # only (1, 1)
+    state = Dice(8, model=model).get_state()
+    for dice in (Dice(8, buffer_size=8), Dice.from_state(state)):
+        dice.set_state(state)
+        dice.roll()
+        assert dice.model is model and dice.result == (1, 1)
+
+
+def test_uniform_model_probabilities():
+    model = UniformDice()
+    assert model.probabilities.shape == (36,)
+    assert model.probabilities.sum() == pytest.approx(1)
+    assert model.total_probabilities()[7] == pytest.approx(6 / 36)
+
+
+def test_face_weighted_model_probabilities():
+    model = FaceWeightedDice([1, 1, 1, 1, 1, 5], [2, 1, 1, 1, 1, 1])
+    assert model.probabilities[outcome_index((6, 1))] == pytest.approx(0.5 * (2 / 7))
+    assert model.probabilities.sum() == pytest.approx(1)
+
+
+def test_outcome_table_model_accepts_6x6_table():
+    weights = np.arange(1, 37).reshape(6, 6)
+    model = OutcomeTableDice(weights)
+    assert model.probabilities[outcome_index((2, 3))] == pytest.approx(
+        weights[1, 2] / weights.sum()
+    )
+
+
+@pytest.mark.parametrize(
+    "weights", [[1] * 35, [-1] + [1] * 35, [0] * 36, [np.nan] + [1] * 35]
+)
+def test_outcome_table_model_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        OutcomeTableDice(weights)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        FaceWeightedDice([1, 2, 3, 4, 5, 6]),
+        OutcomeTableDice([0] * 20 + list(range(1, 17))),
+    ],
+)
+def test_alias_sampling_matches_probabilities(model):
+    outcomes = model.sample(np.random.default_rng(8), 200_000)
+    frequencies = np.bincount(outcomes, minlength=36) / outcomes.size
+    np.testing.assert_allclose(frequencies, model.probabilities, atol=0.005)
+    assert np.all(frequencies[model.probabilities == 0] == 0)
+
+
+def test_dice_with_model_rolls_model_outcomes():
+    only_elevens = OutcomeTableDice(
+        [1 if total == 11 else 0 for total in OUTCOME_TOTALS]
+    )
+    dice = Dice(8, model=only_elevens)
+    assert dice.buffer_size is not None
+    for _ in range(50):
+        dice.roll()
+        assert dice.total == 11
+        assert dice.result in [(5, 6), (6, 5)]
+
+
+@pytest.mark.parametrize("buffer_size", [None, 7, 65_536])
+def test_antithetic_dice_mirror_faces(buffer_size):
+    dice = Dice(8)
+    twin = Dice(8, buffer_size=buffer_size, antithetic=True)
+    assert twin.buffer_size == buffer_size
+    for _ in range(50):
+        dice.roll()
+        twin.roll()
+        assert twin.result == (7 - dice.result[0], 7 - dice.result[1])
+
+
+def test_antithetic_requires_symmetric_model():
+    Dice(8, model=FaceWeightedDice([1, 2, 3, 3, 2, 1]), antithetic=True)
+    with pytest.raises(ValueError):
+        Dice(8, model=FaceWeightedDice([1, 1, 1, 1, 1, 2]), antithetic=True)
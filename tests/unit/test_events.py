@@ -0,0 +1,125 @@
+import pytest
+
+from crapssim import Table
+from crapssim.bet import PassLine
+from crapssim.events import (
+    BetPlacedEvent,
+    BetRejectedEvent,
+    BetResolvedEvent,
+    NewShooterEvent,
+    PointOffEvent,
+    PointSetEvent,
+    RollEvent,
+    SevenOutEvent,
+    TableEvent,
+)
+from crapssim.strategy import BetPassLine, BetPlace
+from crapssim.strategy.examples import Pass2Come
+
+
+def test_events_of_a_seven_out():
+    table = Table()
+    table.add_player(bankroll=100, strategy=BetPassLine(5))
+    events = []
+    table.subscribe(events.append)
+    table.fixed_run([(2, 2), (3, 4)])
+
+    player = table.players[0]
+    assert [type(event) for event in events] == [
+        BetPlacedEvent,
+        RollEvent,
+        PointSetEvent,
+        RollEvent,
+        BetResolvedEvent,
+        SevenOutEvent,
+        NewShooterEvent,
+        PointOffEvent,
+    ]
+    assert events[0] == BetPlacedEvent(0, 1, player, PassLine(5), 5.0)
+    assert events[1] == RollEvent(1, 1, (2, 2), 4, None)
+    assert events[2] == PointSetEvent(1, 1, 4)
+    assert events[3] == RollEvent(2, 1, (3, 4), 7, 4)
+    assert events[4].result.lost and events[4].bet == PassLine(5)
+    assert events[5] == SevenOutEvent(2, 1, 4)
+    assert events[6] == NewShooterEvent(2, 2)
+    assert events[7] == PointOffEvent(2, 2, 4, 7)
+
+
+def test_subscribe_to_event_types():
+    table = Table()
+    table.add_player(bankroll=3, strategy=BetPassLine(5))
+    rejected, points = [], []
+    table.subscribe(rejected.append, BetRejectedEvent)
+    table.subscribe(points.append, PointSetEvent, PointOffEvent)
+    table.fixed_run([(2, 4), (3, 3)])
+
+    assert [event.reason for event in rejected] == ["insufficient_bankroll"]
+    assert points == [PointSetEvent(1, 1, 6), PointOffEvent(2, 1, 6, 6)]
+
+
+def test_bet_rejected_when_not_allowed():
+    table = Table()
+    table.add_player(bankroll=100, strategy=BetPassLine(5))
+    table.point.number = 6
+    events = []
+    table.subscribe(events.append, BetRejectedEvent)
+    table.players[0].add_bet(PassLine(5))
+
+    assert events == [
+        BetRejectedEvent(0, 1, table.players[0], PassLine(5), "not_allowed")
+    ]
+
+
+def test_bet_resolved_when_settled_directly():
+    table = Table()
+    table.add_player(bankroll=100)
+    player = table.players[0]
+    player.add_bet(PassLine(5))
+    events = []
+    table.subscribe(events.append, BetResolvedEvent)
+    table.dice.fixed_roll((3, 4))
+    player.update_bet()
+
+    assert [(event.player, event.bet) for event in events] == [(player, PassLine(5))]
+    assert events[0].result.won and player.bets == []
+
+
+def test_unsubscribe():
+    table = Table()
+    events = []
+    table.subscribe(events.append)
+    table.unsubscribe(events.append)
+    table.fixed_run([(3, 4)])
+
+    assert events == []
+    with pytest.raises(ValueError):
+        table.unsubscribe(events.append)
+
+
+@pytest.mark.parametrize("engine", ["reference", "fast"])
+def test_observers_do_not_change_the_run(engine):
+    results = []
+    for observed in (False, True):
+        table = Table(seed=3)
+        table.add_player(strategy=Pass2Come(5))
+        table.add_player(strategy=BetPlace({6: 6, 8: 6}))
+        events = []
+        if observed:
+            table.subscribe(events.append)
+        table.run(max_rolls=300, verbose=False, engine=engine)
+        results.append(
+            (table.dice.n_rolls, table.n_shooters, [p.bankroll for p in table.players])
+        )
+
+    assert results[0] == results[1]
+    assert sum(isinstance(event, RollEvent) for event in events) == 300
+    n_new_shooters = sum(isinstance(event, NewShooterEvent) for event in events)
+    assert n_new_shooters == sum(isinstance(event, SevenOutEvent) for event in events)
+    assert all(isinstance(event, TableEvent) for event in events)
+
+
+def test_skip_engine_with_observers():
+    table = Table()
+    table.subscribe(print)
+    with pytest.raises(ValueError):
+        table.run(max_rolls=1, verbose=False, engine="skip")
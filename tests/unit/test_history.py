@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from crapssim import Table
+from crapssim.history import RollHistory, history_dtype
+from crapssim.strategy import BetPassLine, BetPlace
+
+
+def test_history_dtype_is_compact():
+    assert history_dtype(1).itemsize == 8 + 1 * 16
+    assert history_dtype(3).itemsize == 8 + 3 * 16
+
+
+def test_history_of_fixed_run():
+    table = Table()
+    table.add_player(bankroll=100, strategy=BetPassLine(5))
+    table.history = RollHistory(n_players=1)
+    table.fixed_run([(2, 2), (1, 2), (3, 4), (6, 5)])
+
+    rows = table.history.rows
+    assert len(table.history) == 4
+    assert rows["die_1"].tolist() == [2, 1, 3, 6]
+    assert rows["die_2"].tolist() == [2, 2, 4, 5]
+    assert table.history["total"].tolist() == [4, 3, 7, 11]
+    assert rows["point"].tolist() == [4, 4, 0, 0]
+    assert rows["shooter"].tolist() == [1, 1, 1, 2]
+    assert rows["bankroll"][:, 0].tolist() == [95, 95, 95, 100]
+    assert rows["exposure"][:, 0].tolist() == [5, 5, 0, 0]
+
+
+@pytest.mark.parametrize("engine", ["reference", "fast"])
+def test_history_grows_and_matches_run(engine):
+    table = Table(seed=2)
+    table.add_player(bankroll=1_000, strategy=BetPassLine(5))
+    table.add_player(bankroll=1_000, strategy=BetPlace({6: 6, 8: 6}))
+    table.history = RollHistory(n_players=2, capacity=4)
+    table.run(max_rolls=100, verbose=False, engine=engine)
+
+    assert len(table.history) == 100
+    assert table.history.capacity == 128
+    rows = table.history.rows
+    assert rows["bankroll"][-1].tolist() == [p.bankroll for p in table.players]
+    assert rows["shooter"][0] == 1
+    assert np.all(np.diff(rows["shooter"].astype(int)) >= 0)
+    assert np.all(rows["total"] == rows["die_1"] + rows["die_2"])
+
+
+def test_history_of_iter_run():
+    table = Table(seed=2)
+    table.add_player()
+    table.history = RollHistory(n_players=1)
+    records = list(table.iter_run(max_rolls=20))
+
+    assert table.history["bankroll"][:, 0].tolist() == [r.bankrolls[0] for r in records]
+    assert table.history["shooter"].tolist() == [r.shooter for r in records]
+
+
+def test_history_save(tmp_path):
+    table = Table(seed=2)
+    table.add_player()
+    table.history = RollHistory(n_players=1)
+    table.run(max_rolls=10, verbose=False)
+
+    table.history.save(tmp_path / "history.npy")
+    assert np.array_equal(np.load(tmp_path / "history.npy"), table.history.rows)
+
+    table.history.save(tmp_path / "history.npz", compressed=True)
+    with np.load(tmp_path / "history.npz") as columns:
+        assert set(columns.files) == set(history_dtype(1).names)
+        assert np.array_equal(columns["bankroll"], table.history["bankroll"])
+
+
+def test_history_player_count_mismatch():
+    table = Table()
+    table.add_player()
+    table.history = RollHistory(n_players=2)
+    with pytest.raises(ValueError):
+        table.fixed_run([(3, 4)])
+
+
+def test_history_clear():
+    history = RollHistory(n_players=1)
+    table = Table()
+    table.add_player()
+    table.history = history
+    table.fixed_run([(3, 4), (3, 3)])
+    history.clear()
+    assert len(history) == 0
+    assert history.rows.shape == (0,)
+
+
+def test_skip_engine_cannot_record_history():
+    table = Table()
+    table.add_player()
+    table.history = RollHistory(n_players=1)
+    with pytest.raises(ValueError):
+        table.run(max_rolls=1, verbose=False, engine="skip")
@@ -1,6 +1,37 @@
+import gc
+import pickle
+
+import pytest
+
 from crapssim import Table
-from crapssim.bet import PassLine
-from crapssim.strategy import BetPassLine
+from crapssim.bet import (
+    All,
+    Bet,
+    Buy,
+    Come,
+    Field,
+    Fire,
+    Odds,
+    PassLine,
+    Place,
+    _SimpleBet,
+)
+from crapssim.events import BetPlacedEvent, BetRejectedEvent
+from crapssim.strategy import BetPassLine, ComeOddsMultiplier
+from crapssim.strategy.single_bet import (
+    BetAll,
+    BetBuy,
+    BetCome,
+    BetDontCome,
+    BetField,
+    BetFire,
+    BetHardWay,
+    BetHop,
+    BetPlace,
+    StrategyMode,
+)
+from crapssim.strategy.tools import NullStrategy
+from crapssim.table import Player, _BetList
 
 
 def test_default_strategy():
@@ -31,3 +62,353 @@ def test_existing_bet():
     total_bet_amount = table.players[0].total_bet_amount
 
     assert (bet_count, bet_amount, bankroll, total_bet_amount) == (1, 100, 0, 100)
+
+
+def test_bet_totals_follow_bet_changes():
+    table = Table()
+    player = table.add_player(bankroll=100)
+    assert (player.total_wagered, player.total_bet_amount) == (0, 0)
+
+    player.add_bet(PassLine(5))
+    player.add_bet(Place(6, 6))
+    assert (player.total_wagered, player.total_bet_amount) == (11, 11)
+
+    player.add_bet(Place(6, 6))
+    assert player.total_bet_amount == 17
+
+    player.remove_bet(player.bets[1])
+    assert player.total_bet_amount == 5
+
+    player.bets.append(Field(2))
+    assert player.total_bet_amount == 7
+    player.bets = [Field(3)]
+    assert player.total_bet_amount == 3
+    del player.bets[0]
+    assert player.total_bet_amount == 0
+
+
+def test_bet_totals_after_resolution():
+    table = Table()
+    player = table.add_player(bankroll=100, strategy=NullStrategy())
+    player.add_bet(PassLine(5))
+    player.add_bet(Field(5))
+    table.fixed_run([(2, 2)])
+    assert player.total_bet_amount == 5
+    assert table.total_player_cash == player.bankroll + 5 == 105
+    table.fixed_run([(3, 4)])
+    assert player.total_bet_amount == 0
+    assert not table.player_has_bets
+
+
+def test_bet_totals_with_vig():
+    table = Table()
+    table.settings["vig_paid_on_win"] = False
+    player = table.add_player(bankroll=100)
+    player.add_bet(Buy(4, 20))
+    player.add_bet(PassLine(5))
+    assert (player.total_wagered, player.total_vig) == (25, 1)
+    assert player.total_bet_amount == 26
+
+    table.settings["vig_paid_on_win"] = True
+    assert (player.total_vig, player.total_bet_amount) == (0, 25)
+
+
+def test_bet_costs_kept_until_bets_or_settings_change(monkeypatch):
+    table = Table()
+    player = table.add_player(bankroll=100, strategy=NullStrategy())
+    player.add_bet(Buy(4, 20))
+    player.add_bet(PassLine(5))
+    calls = []
+    cost = Buy.cost
+    monkeypatch.setattr(Buy, "cost", lambda bet, t: calls.append(bet) or cost(bet, t))
+
+    assert (player.total_bet_amount, player.total_vig) == (26, 1)
+    n_calls = len(calls)
+    assert (player.total_bet_amount, player.total_vig) == (26, 1)
+    assert len(calls) == n_calls
+
+    table.settings["vig_paid_on_win"] = True
+    assert (player.total_bet_amount, player.total_vig) == (25, 0)
+    player.add_bet(Buy(10, 20))
+    assert len(calls) > n_calls
+    assert player.total_bet_amount == 45
+
+
+def _linear_lookups(player):
+    bets = list(player.bets)
+    return (
+        {
+            b._placed_key: [x for x in bets if x._placed_key == b._placed_key]
+            for b in bets
+        },
+        {
+            t: [x for x in bets if isinstance(x, t)]
+            for t in (Bet, Come, Place, _SimpleBet)
+        },
+    )
+
+
+def _indexed_lookups(player):
+    return (
+        {b._placed_key: player.already_placed_bets(b) for b in player.bets},
+        {t: player.get_bets_by_type(t) for t in (Bet, Come, Place, _SimpleBet)},
+    )
+
+
+def test_bet_index_matches_linear_scans():
+    table = Table()
+    player = table.add_player(bankroll=1_000, strategy=NullStrategy())
+    for bet in (PassLine(5), Place(6, 6), Place(8, 6), Field(5)):
+        player.add_bet(bet)
+    table.fixed_run([(2, 2)])
+    assert _indexed_lookups(player) == _linear_lookups(player)
+
+    # come bets move to their numbers
+    player.add_bet(Come(5))
+    table.fixed_run([(4, 4)])
+    player.add_bet(Come(5))
+    assert player.already_placed(Come(5, 8)) and player.already_placed(Come(5))
+    assert _indexed_lookups(player) == _linear_lookups(player)
+    table.fixed_run([(5, 5)])
+    assert player.already_placed(Come(5, 10)) and not player.already_placed(Come(5))
+    assert _indexed_lookups(player) == _linear_lookups(player)
+
+    player.remove_bet(Place(6, 6))
+    player.bets.insert(0, Field(2))
+    player.bets.pop()
+    assert _indexed_lookups(player) == _linear_lookups(player)
+
+    player.bets = [Place(5, 5), Come(5, 5)]
+    assert player.already_placed_bets(Place(5, 1)) == [Place(5, 5)]
+    assert player.get_bets_by_type((Come, Place)) == [Place(5, 5), Come(5, 5)]
+    assert Come(5, 5) in player.bets and Come(5, 6) not in player.bets
+
+
+def test_bet_index_remove_keeps_list_order():
+    player = Table().add_player(bankroll=1_000, strategy=NullStrategy())
+    first, second = Field(5), Field(5)
+    player.bets = [first, PassLine(5), second]
+    player.bets.remove(Field(5))
+    assert player.bets[1] is second
+    assert player.get_bets_by_type(Field)[0] is second
+    player.bets.remove(Field(5))
+    assert player.bets == [PassLine(5)]
+    with pytest.raises(ValueError):
+        player.bets.remove(Field(5))
+
+
+def test_pickle_player_with_bets():
+    table = Table(seed=2)
+    player = table.add_player(bankroll=1_000, strategy=BetPlace({6: 6, 8: 6}))
+    table.run(max_rolls=10, verbose=False)
+    player.add_bet(Field(5))
+
+    copy = pickle.loads(pickle.dumps(table))
+    copied = copy.players[0]
+    assert type(copied.bets) is _BetList
+    assert (copied.bankroll, copied.bets) == (player.bankroll, player.bets)
+    assert copied.get_bets_by_type(Field) == [Field(5)]
+
+    table.run(max_rolls=50, verbose=False)
+    copy.run(max_rolls=50, verbose=False)
+    assert (copied.bankroll, copied.bets) == (player.bankroll, player.bets)
+
+
+def test_settling_only_active_bets_matches_settling_all(monkeypatch):
+    def strategy():
+        return (
+            BetPassLine(5)
+            + BetCome(5)
+            + BetDontCome(5)
+            + ComeOddsMultiplier(2)
+            + BetFire(1)
+            + BetAll(1)
+            + BetHop((2, 3), 1)
+            + BetHardWay(6, 1)
+            + BetField(1)
+        )
+
+    def run():
+        table = Table(seed=5)
+        player = table.add_player(bankroll=10_000, strategy=strategy())
+        bankrolls = [(r.bankrolls, list(player.bets)) for r in table.iter_run(1_000)]
+        return bankrolls, player.bets
+
+    indexed = run()
+    monkeypatch.setattr(_BetList, "settling", lambda bets, table: bets[:])
+    assert indexed == run()
+
+
+def test_settling_bets_for_the_rolled_total():
+    table = Table()
+    player = table.add_player(bankroll=100, strategy=NullStrategy())
+    player.add_bet(PassLine(5))
+    player.add_bet(Field(5))
+    table.dice.fixed_roll((2, 3))
+    assert list(player.bets.settling(table)) == [Field(5)]
+    table.dice.fixed_roll((3, 4))
+    assert list(player.bets.settling(table)) == [PassLine(5), Field(5)]
+    assert player.bets.active_numbers(table) == {2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12}
+
+    player.bets.remove(Field(5))
+    table.point.number = 6
+    assert player.bets.active_numbers(table) == {6, 7}
+
+
+def test_player_and_point_keep_attributes_in_slots():
+    table = Table()
+    player = table.add_player()
+    assert not any(isinstance(x, dict) for x in gc.get_referents(player))
+    with pytest.raises(AttributeError):
+        table.point.status_name = "On"
+
+
+def test_state_key_follows_layout():
+    table = Table()
+    player = table.add_player(bankroll=1_000, strategy=NullStrategy())
+    other = table.add_player(bankroll=1_000, strategy=NullStrategy())
+    player.add_bet(PassLine(5))
+    player.add_bet(Field(5))
+    other.add_bet(Field(5))
+    other.add_bet(PassLine(5))
+    assert player.state_key == other.state_key
+    assert hash(table.state_key)
+
+    player.add_bet(Place(6, 6))
+    assert player.state_key != other.state_key
+    player.remove_bet(Place(6, 6))
+    assert player.state_key == other.state_key
+    player.add_bet(Field(5))
+    assert player.state_key != other.state_key
+    player.bets = [Field(10), PassLine(5)]
+    assert player.state_key != other.state_key
+
+    # come bets keep the key in step as they move
+    table.fixed_run([(2, 2)])
+    player.bets, other.bets = [Come(5)], [Come(5, 8)]
+    assert player.state_key != other.state_key
+    table.fixed_run([(3, 5)])
+    other.bets = [Come(5, 8)]
+    assert player.bets == [Come(5, 8)]
+    assert player.state_key == other.state_key
+
+
+def test_state_key_tells_bet_states_apart():
+    table = Table()
+    table.fixed_run([(2, 2)])
+    player = table.add_player(bankroll=1_000, strategy=NullStrategy())
+    other = table.add_player(bankroll=1_000, strategy=NullStrategy())
+    player.bets = [Odds(PassLine, 4, 10, always_working=True)]
+    other.bets = [Odds(PassLine, 4, 10, always_working=False)]
+    assert player.state_key != other.state_key
+
+    player.bets, other.bets = [Fire(1), All(1)], [Fire(1), All(1)]
+    assert player.state_key == other.state_key
+    table.fixed_run([(1, 3)])  # makes the point for Fire, rolls a 4 for All
+    assert player.state_key == other.state_key
+    other.bets = [Fire(1), All(1)]
+    assert player.state_key != other.state_key
+
+
+def test_state_key_codes_belong_to_the_table():
+    tables = [Table(), Table()]
+    for table in tables:
+        table.add_player(strategy=NullStrategy()).add_bet(Field(5))
+    assert tables[0].state_key == tables[1].state_key
+    tables[1].players[0].add_bet(PassLine(5))
+    assert len(tables[0]._bet_codes) == 1 and len(tables[1]._bet_codes) == 2
+
+
+def test_table_state_key():
+    table = Table()
+    table.add_player(bankroll=1_000, strategy=NullStrategy())
+    start = table.state_key
+    assert start[:3] == (0, 1, 0)
+    table.fixed_run([(2, 2)])
+    assert table.state_key[:3] == (4, 0, 4)
+    table.fixed_run([(3, 4)])
+    assert table.state_key[:3] == (0, 1, 7)
+    assert table.state_key != start
+
+
+def _add_bet_by_sum(player, bet):
+    existing_bets = player.already_placed_bets(bet)
+    existing_cost = sum(x.cost(player.table) for x in existing_bets)
+    new_bet = sum(existing_bets + [bet])
+    required_cash = new_bet.cost(player.table) - existing_cost
+    allowed = new_bet.is_allowed(player)
+    if allowed and required_cash <= player.bankroll + 1e-9:
+        for existing_bet in existing_bets:
+            player.bets.remove(existing_bet)
+        player.bankroll -= required_cash
+        player.bets.append(new_bet)
+        event = BetPlacedEvent(0, 0, player, bet, required_cash)
+    else:
+        reason = "insufficient_bankroll" if allowed else "not_allowed"
+        event = BetRejectedEvent(0, 0, player, bet, reason)
+    if player.table._observers:
+        player.table.emit(event)
+
+
+def test_increasing_bets_in_place_matches_replacing_them(monkeypatch):
+    increase = StrategyMode.ADD_OR_INCREASE
+
+    def run():
+        table = Table(seed=3)
+        table.settings["vig_paid_on_win"] = False
+        strategy = (
+            BetPassLine(5)
+            + ComeOddsMultiplier(2)
+            + BetPlace({6: 6, 8: 6}, mode=increase)
+            + BetBuy(4, 20, mode=increase)
+            + BetField(1.5, mode=increase)
+        )
+        player = table.add_player(bankroll=500, strategy=strategy)
+        events = []
+        table.subscribe(
+            lambda e: events.append((type(e), e.bet, getattr(e, "reason", None))),
+            BetPlacedEvent,
+            BetRejectedEvent,
+        )
+        rolls = [
+            (r.bankrolls, [(repr(b), b.amount) for b in player.bets])
+            for r in table.iter_run(300)
+        ]
+        return rolls, events
+
+    in_place = run()
+    assert any(e[0] is BetRejectedEvent for e in in_place[1])
+    monkeypatch.setattr(Player, "add_bet", _add_bet_by_sum)
+    assert in_place == run()
+
+
+def test_rejected_increase_leaves_bet_unchanged():
+    table = Table()
+    player = table.add_player(bankroll=20, strategy=NullStrategy())
+    player.add_bet(Place(6, 6))
+    player.add_bet(PassLine(5))
+    key = player.state_key
+    placed = player.bets[0]
+    player.add_bet(Place(6, 12))
+    assert placed.amount == 6 and player.bankroll == 9
+    assert player.bets == [Place(6, 6), PassLine(5)]
+    assert player.state_key == key
+
+    player.add_bet(Place(6, 6))
+    assert player.bets == [PassLine(5), Place(6, 12)]
+    assert player.bets[1] is placed
+    assert player.total_bet_amount == 17 and player.bankroll == 3
+    assert player.state_key != key and Place(6, 12) in player.bets
+
+
+def test_failed_increase_leaves_bet_unchanged(monkeypatch):
+    player = Table().add_player(bankroll=100, strategy=NullStrategy())
+    player.add_bet(Place(6, 6))
+
+    def is_allowed(bet, player):
+        raise RuntimeError("no table")
+
+    monkeypatch.setattr(Place, "is_allowed", is_allowed)
+    with pytest.raises(RuntimeError):
+        player.add_bet(Place(6, 6))
+    assert player.bets == [Place(6, 6)] and player.bankroll == 94
@@ -0,0 +1,75 @@
+import pytest
+
+from crapssim import Table
+from crapssim.events import RollEvent
+from crapssim.profiling import PLAYER_PHASES, TABLE_PHASES, PhaseTiming, TableProfile
+from crapssim.strategy import BetPassLine, BetPlace
+
+
+def test_phase_timing():
+    timing = PhaseTiming()
+    assert timing.mean_ns == 0
+    timing.add(10)
+    timing.add(30)
+    assert (timing.calls, timing.total_ns, timing.mean_ns) == (2, 40, 20)
+
+
+@pytest.mark.parametrize("engine", ["reference", "fast"])
+def test_profiled_run_matches_plain_run(engine):
+    results = []
+    for profiled in (False, True):
+        table = Table(seed=4)
+        table.add_player(strategy=BetPassLine(5), name="Pass")
+        table.add_player(strategy=BetPlace({6: 6, 8: 6}), name="Place")
+        if profiled:
+            profile = table.enable_profiling()
+        table.run(max_rolls=200, verbose=False, engine=engine)
+        results.append((table.n_shooters, [p.bankroll for p in table.players]))
+
+    assert results[0] == results[1]
+    assert set(profile.phases) == set(TABLE_PHASES)
+    assert all(timing.calls == 200 for timing in profile.phases.values())
+    assert set(profile.players) == {"Pass", "Place"}
+    assert set(profile.strategies) == {"BetPassLine", "BetPlace"}
+    for phases in profile.players.values():
+        assert set(phases) == set(PLAYER_PHASES)
+        assert phases["update_bets"].calls == 200
+    assert profile.as_dict()["phases"]["roll"]["calls"] == 200
+    assert "update_table_stats" in profile.report()
+
+
+def test_profiling_accumulates_until_disabled():
+    table = Table(seed=1)
+    table.add_player()
+    profile = table.enable_profiling()
+    table.fixed_run([(3, 4)] * 3)
+    assert table.enable_profiling() is profile
+    table.fixed_run([(3, 4)] * 2)
+    assert profile.phases["roll"].calls == 5
+
+    assert table.disable_profiling() is profile
+    assert table.profile is None
+    table.fixed_run([(3, 4)])
+    assert profile.phases["roll"].calls == 5
+
+    profile.reset()
+    assert profile == TableProfile()
+
+
+def test_profiling_with_observers():
+    table = Table(seed=1)
+    table.add_player()
+    events = []
+    table.subscribe(events.append, RollEvent)
+    profile = table.enable_profiling()
+    table.run(max_rolls=10, verbose=False)
+
+    assert len(events) == 10
+    assert profile.phases["roll"].calls == 10
+
+
+def test_skip_engine_cannot_be_profiled():
+    table = Table()
+    table.enable_profiling()
+    with pytest.raises(ValueError):
+        table.run(max_rolls=1, verbose=False, engine="skip")
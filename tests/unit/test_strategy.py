@@ -1,3 +1,4 @@
+import copy
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -26,6 +27,7 @@ from crapssim.strategy import (
     AddIfPointOn,
     AddIfTrue,
     AggregateStrategy,
+    BetPassLine,
     BetPlace,
     CountStrategy,
     RemoveIfTrue,
@@ -48,10 +50,16 @@ from crapssim.strategy.odds import (
     DontPassOddsMultiplier,
     OddsAmount,
     OddsMultiplier,
+    PassLineOddsMultiplier,
     WinMultiplier,
 )
 from crapssim.strategy.single_bet import StrategyMode, _BaseSingleBet
-from crapssim.strategy.tools import RemoveByType, RemoveIfPointOff, ReplaceIfTrue
+from crapssim.strategy.tools import (
+    NullStrategy,
+    RemoveByType,
+    RemoveIfPointOff,
+    ReplaceIfTrue,
+)
 
 
 @pytest.fixture
@@ -1514,3 +1522,52 @@ def test_place_68_cpr_update_bets_initial_bets_placed_no_update(player):
 def test_repr_names(strategy, strategy_name):
     # Check above visually make sense
     assert repr(strategy) == strategy_name
+
+
+def test_strategy_triggers(player):
+    assert NullStrategy().triggers(player) == frozenset()
+    assert BetPassLine(5).triggers(player) == frozenset()
+    assert (BetPassLine(5) + PassLineOddsMultiplier(2)).triggers(player) == frozenset()
+    assert AddIfTrue(PassLine(5), lambda p: True).triggers(player) is None
+    assert (BetPassLine(5) + AddIfTrue(Field(5), lambda p: True)).triggers(
+        player
+    ) is None
+    assert BetPassLine(5, mode=StrategyMode.ADD_OR_INCREASE).triggers(player) is None
+
+
+def test_strategy_state():
+    strategy = HammerLock(5)
+    strategy.place_win_count = 2
+    state = strategy.get_state()
+    strategy.place_win_count = 5
+
+    strategy.set_state(state)
+    assert strategy.place_win_count == 2
+
+
+def test_strategy_state_drops_later_attributes():
+    strategy = Risk12()
+    state = strategy.get_state()
+    table = Table()
+    player = table.add_player(strategy=strategy)
+    player.strategy.update_bets(player)
+    assert hasattr(player.strategy, "min_bankroll")
+
+    player.strategy.set_state(state)
+    assert not hasattr(player.strategy, "min_bankroll")
+
+
+def test_aggregate_strategy_state_restores_children_of_a_copy():
+    strategy = AggregateStrategy(DiceDoctor(), Place68PR())
+    strategy.strategies[0].current_progression = 3
+    strategy.strategies[1].six_winnings = 7.0
+    state = strategy.get_state()
+
+    other = copy.deepcopy(strategy)
+    other.strategies[0].current_progression = 0
+    other.strategies[1].six_winnings = 0.0
+    other.set_state(state)
+
+    assert other.strategies[0] is not strategy.strategies[0]
+    assert other.strategies[0].current_progression == 3
+    assert other.strategies[1].six_winnings == 7.0
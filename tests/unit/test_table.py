@@ -1,9 +1,24 @@
+import pickle
+
 import pytest
 
 from crapssim import Table
-from crapssim.bet import Come
+from crapssim.bet import Come, Place
+from crapssim.dice import Dice, OutcomeTableDice
 from crapssim.point import Point
-from crapssim.strategy import BetPassLine
+from crapssim.strategy import AddIfTrue, BetPassLine, BetPlace
+from crapssim.strategy.examples import (
+    DiceDoctor,
+    HammerLock,
+    IronCross,
+    Knockout,
+    Pass2Come,
+    PassLinePlace68Move59,
+    Place68PR,
+    Risk12,
+)
+from crapssim.strategy.single_bet import BetAll, BetFire
+from crapssim.strategy.tools import NullStrategy
 
 
 def test_ensure_one_player():
@@ -108,3 +123,307 @@ def test_table_rerunning_with_shooters():
 
     table.run(max_rolls=float("inf"), max_shooter=5)
     assert table.n_shooters == 7
+
+
+def test_table_from_seed_stream_reproducible():
+    table1 = Table.from_seed_stream(8, 3)
+    table2 = Table.from_seed_stream(8, 3)
+    table1.add_player(strategy=BetPassLine(5))
+    table2.add_player(strategy=BetPassLine(5))
+
+    table1.run(max_rolls=50, verbose=False)
+    table2.run(max_rolls=50, verbose=False)
+
+    assert table1.dice.result == table2.dice.result
+    assert table1.players[0].bankroll == table2.players[0].bankroll
+
+
+def test_table_snapshot_restore_continues_run():
+    table = Table(seed=8, seekable=True)
+    table.add_player(strategy=BetPassLine(5))
+    table.run(max_rolls=30, verbose=False)
+    snapshot = table.snapshot()
+
+    table.run(max_rolls=30, verbose=False)
+    expected = (table.dice.n_rolls, table.players[0].bankroll, table.point.number)
+
+    table.restore(snapshot)
+    table.run(max_rolls=30, verbose=False)
+    assert (table.dice.n_rolls, table.players[0].bankroll, table.point.number) == (
+        expected
+    )
+
+    resumed = Table.from_snapshot(snapshot)
+    resumed.run(max_rolls=30, verbose=False)
+    assert (
+        resumed.dice.n_rolls,
+        resumed.players[0].bankroll,
+        resumed.point.number,
+    ) == expected
+
+
+def test_table_restore_into_other_table_reuses_strategies():
+    table = Table(seed=3, seekable=True)
+    table.add_player(bankroll=1_000, strategy=HammerLock(5) + Place68PR())
+    table.add_player(bankroll=1_000, strategy=Risk12())
+    table.run(max_rolls=40, verbose=False)
+    snapshot = table.snapshot()
+    table.run(max_rolls=60, verbose=False)
+    expected = [(p.bankroll, p.bets) for p in table.players]
+
+    branch = Table(seed=1, seekable=True)
+    branch.add_player(strategy=HammerLock(10) + Place68PR())
+    branch.add_player(strategy=Pass2Come(5))
+    kept = branch.players[0].strategy
+    branch.restore(snapshot)
+
+    assert branch.players[0].strategy is kept
+    assert isinstance(branch.players[1].strategy, Risk12)
+    assert branch.players[1].strategy is not snapshot.players[1].strategy
+    branch.run(max_rolls=60, verbose=False)
+    assert [(p.bankroll, p.bets) for p in branch.players] == expected
+    assert repr(kept) == repr(table.players[0].strategy)
+
+
+def test_table_clone_keeps_dice_model():
+    table = Table(seed=8)
+    table.dice = Dice(8, model=OutcomeTableDice([1] + [0] * 35))  # only (1, 1)
+    table.add_player(strategy=NullStrategy())
+    table.run(max_rolls=3, verbose=False)
+
+    clone = table.clone()
+    clone.run(max_rolls=3, verbose=False)
+    assert clone.dice.model is table.dice.model
+    assert (clone.dice.n_rolls, clone.dice.result) == (6, (1, 1))
+
+
+def test_table_snapshot_pickles_stateful_strategies():
+    table = Table(seed=3, seekable=True)
+    table.add_player(bankroll=1_000, strategy=HammerLock(5) + Place68PR())
+    table.run(max_rolls=40, verbose=False)
+    snapshot = pickle.loads(pickle.dumps(table.snapshot()))
+
+    table.run(max_rolls=60, verbose=False)
+    resumed = Table.from_snapshot(snapshot)
+    resumed.run(max_rolls=60, verbose=False)
+    assert (resumed.players[0].bankroll, resumed.players[0].bets) == (
+        table.players[0].bankroll,
+        table.players[0].bets,
+    )
+    assert repr(resumed.players[0].strategy) == repr(table.players[0].strategy)
+
+
+def test_table_snapshot_with_inline_functions_cannot_be_pickled():
+    table = Table()
+    table.add_player(strategy=IronCross(10))
+    with pytest.raises((AttributeError, pickle.PicklingError)):
+        pickle.dumps(table.snapshot())
+
+
+def test_table_snapshot_is_independent_of_table():
+    table = Table(seed=8)
+    table.add_player(strategy=BetPassLine(5))
+    table.run(max_rolls=3, verbose=False)
+    snapshot = table.snapshot()
+    n_bets = len(table.players[0].bets)
+
+    table.players[0].bets.clear()
+    table.players[0].bankroll = 0
+    table.restore(snapshot)
+
+    assert len(table.players[0].bets) == n_bets
+    assert table.players[0].bankroll == snapshot.players[0].bankroll
+
+
+@pytest.mark.parametrize(
+    "strategy", [HammerLock(5), Place68PR(), DiceDoctor(), Pass2Come(5) + BetFire(5)]
+)
+def test_table_snapshot_restores_strategy_state(strategy):
+    table = Table(seed=3, seekable=True)
+    table.add_player(bankroll=1_000, strategy=strategy)
+    table.run(max_rolls=40, verbose=False)
+    snapshot = table.snapshot()
+    strategy_object = table.players[0].strategy
+
+    table.run(max_rolls=60, verbose=False)
+    expected = (table.players[0].bankroll, table.players[0].bets)
+
+    for _ in range(2):
+        table.restore(snapshot)
+        assert table.players[0].strategy is strategy_object
+        table.run(max_rolls=60, verbose=False)
+        assert (table.players[0].bankroll, table.players[0].bets) == expected
+
+    clone = Table.from_snapshot(snapshot).clone()
+    assert clone.players[0].strategy is not strategy_object
+    clone.run(max_rolls=60, verbose=False)
+    assert (clone.players[0].bankroll, clone.players[0].bets) == expected
+
+
+def test_active_totals():
+    table = Table()
+    table.add_player(strategy=BetPlace({8: 6}))
+    assert table.active_totals() is None  # new shooter
+
+    table.new_shooter = False
+    table.point.number = 6
+    table.players[0].add_bet(Place(8, 6))
+    assert table.active_totals() == {6, 7, 8}
+
+    table.add_player(strategy=AddIfTrue(Place(5, 5), lambda p: True))
+    assert table.active_totals() is None
+
+
+def test_active_totals_include_placement_totals():
+    # All bets can only be placed after a 7, so come-out 7s are not inert
+    table = Table()
+    table.add_player(strategy=BetAll(1))
+    table.new_shooter = False
+    table.last_roll = 5
+    assert table.active_totals() == {4, 5, 6, 7, 8, 9, 10}
+
+
+def test_skip_engine_without_triggers_matches_reference():
+    strategy = AddIfTrue(Place(6, 6), lambda p: True)
+    results = []
+    for engine in ("reference", "skip"):
+        table = Table(seed=8)
+        table.add_player(strategy=strategy)
+        table.run(max_rolls=200, verbose=False, engine=engine)
+        results.append((table.dice.n_rolls, table.players[0].bankroll))
+    assert results[0] == results[1]
+
+
+def test_skip_engine_counts_skipped_rolls():
+    for engine in ("reference", "skip"):
+        table = Table()
+        table.dice = Dice(8, model=OutcomeTableDice([1] + [0] * 35))  # only 2s
+        table.add_player(strategy=NullStrategy())
+        table.new_shooter = False
+        table.point.number = 6
+        table.run(max_rolls=25, verbose=False, engine=engine)
+
+        assert table.dice.n_rolls == 25
+        assert table.pass_rolls == 25
+        assert (table.last_roll, table.dice.result) == (2, (1, 1))
+
+
+class _CountingBetAll(BetAll):
+    """BetAll that counts the All bets it places."""
+
+    def __init__(self, bet_amount):
+        super().__init__(bet_amount)
+        self.n_placed = 0
+
+    def update_bets(self, player):
+        n_bets = len(player.bets)
+        super().update_bets(player)
+        self.n_placed += len(player.bets) > n_bets
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        lambda: BetPassLine(5),
+        lambda: BetPlace({6: 6, 8: 6}, skip_point=False),
+        lambda: _CountingBetAll(1),
+    ],
+)
+def test_skip_engine_matches_reference_distribution(strategy):
+    n_shooters, n_placed = {}, {}
+    for engine in ("reference", "skip"):
+        table = Table(seed=8)
+        player = table.add_player(bankroll=10_000, strategy=strategy())
+        table.run(max_rolls=20_000, verbose=False, engine=engine)
+        assert table.dice.n_rolls == 20_000
+        n_shooters[engine] = table.n_shooters
+        n_placed[engine] = getattr(player.strategy, "n_placed", 0)
+    # about 2350 shooters, with a standard deviation around 45
+    assert n_shooters["skip"] == pytest.approx(n_shooters["reference"], rel=0.08)
+    assert n_placed["skip"] == pytest.approx(n_placed["reference"], rel=0.08)
+
+
+@pytest.mark.parametrize(
+    "strategies",
+    [
+        [Pass2Come(5)],
+        [IronCross(10)],
+        [HammerLock(5), Risk12()],
+        [Knockout(5), PassLinePlace68Move59(5)],
+    ],
+)
+@pytest.mark.parametrize(
+    "seed, max_shooter, runout", [(1, float("inf"), False), (2, 10, True)]
+)
+def test_fast_engine_matches_reference(strategies, seed, max_shooter, runout):
+    tables = {}
+    for engine in ("reference", "fast"):
+        table = Table(seed=seed)
+        for strategy in strategies:
+            table.add_player(bankroll=1_000, strategy=strategy)
+        table.run(
+            max_rolls=500,
+            max_shooter=max_shooter,
+            verbose=False,
+            runout=runout,
+            engine=engine,
+        )
+        tables[engine] = table
+
+    reference, fast = tables["reference"], tables["fast"]
+    for attribute in ("n_shooters", "pass_rolls", "last_roll", "new_shooter"):
+        assert getattr(fast, attribute) == getattr(reference, attribute)
+    assert fast.dice.n_rolls == reference.dice.n_rolls
+    assert fast.point.number == reference.point.number
+    for fast_player, reference_player in zip(fast.players, reference.players):
+        assert fast_player.bankroll == reference_player.bankroll
+        assert fast_player.bets == reference_player.bets
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        Table().run(max_rolls=1, engine="turbo")
+
+
+@pytest.mark.parametrize(
+    "max_rolls, max_shooter, runout",
+    [(200, float("inf"), False), (200, 5, False), (30, float("inf"), True)],
+)
+def test_iter_run_matches_run(max_rolls, max_shooter, runout):
+    tables = []
+    for use_iter in (False, True):
+        table = Table(seed=6)
+        table.add_player(strategy=Pass2Come(5))
+        if use_iter:
+            records = list(table.iter_run(max_rolls, max_shooter, runout=runout))
+        else:
+            table.run(max_rolls, max_shooter, verbose=False, runout=runout)
+        tables.append(table)
+
+    run_table, iter_table = tables
+    assert iter_table.dice.n_rolls == run_table.dice.n_rolls == len(records)
+    assert iter_table.n_shooters == run_table.n_shooters
+    assert iter_table.players[0].bankroll == run_table.players[0].bankroll
+    assert records[-1].bankrolls == (run_table.players[0].bankroll,)
+    assert [record.roll for record in records] == list(range(1, len(records) + 1))
+
+
+def test_iter_run_records():
+    table = Table()
+    table.add_player(bankroll=100, strategy=BetPlace({6: 6}, skip_point=False))
+    table.dice = Dice(seed=1, model=OutcomeTableDice([0] * 8 + [1] + [0] * 27))
+    table.point.number = 4
+    table.new_shooter = False
+
+    first, second = table.iter_run(max_rolls=2)
+    assert first == (1, (2, 3), 4, 4, 1, (94.0,))
+    assert second == (2, (2, 3), 4, 4, 1, (94.0,))
+
+
+def test_iter_run_stops_early():
+    table = Table(seed=1)
+    table.add_player()
+    for record in table.iter_run(max_rolls=1_000):
+        if record.point_after is not None:
+            break
+    assert table.dice.n_rolls == record.roll < 1_000
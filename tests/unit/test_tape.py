@@ -0,0 +1,147 @@
+import gzip
+
+import numpy as np
+import pytest
+
+from crapssim import Table
+from crapssim.dice import Dice
+from crapssim.strategy import BetPassLine
+from crapssim.tape import (
+    RollLogError,
+    RollLogReader,
+    RollRecorder,
+    iter_tape,
+    load_tape,
+    tape_outcomes,
+)
+
+
+def test_recorder_records_random_and_fixed_rolls():
+    dice = Dice(8)
+    dice.recorder = RollRecorder()
+    results = []
+    for _ in range(10):
+        dice.roll()
+        results.append(dice.result)
+    dice.fixed_roll((3, 4))
+    results.append((3, 4))
+
+    assert len(dice.recorder) == 11
+    assert dice.recorder.rolls.dtype == np.uint8
+    assert [tuple(roll) for roll in dice.recorder.rolls.tolist()] == results
+
+
+def test_recorder_rejects_invalid_fixed_roll():
+    dice = Dice(8)
+    dice.recorder = RollRecorder()
+    with pytest.raises(ValueError):
+        dice.fixed_roll((10, 1))
+    assert dice.n_rolls == 0
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_and_load_tape(tmp_path, mmap):
+    recorder = RollRecorder()
+    for outcome in [0, 35, 7, 20]:
+        recorder.append(outcome)
+    recorder.save(tmp_path / "rolls.npy")
+
+    tape = load_tape(tmp_path / "rolls.npy", mmap=mmap)
+    assert isinstance(tape, np.memmap) == mmap
+    np.testing.assert_array_equal(tape, [[1, 1], [6, 6], [2, 2], [4, 3]])
+
+
+def test_load_tape_wrong_shape(tmp_path):
+    np.save(tmp_path / "rolls.npy", np.ones((4, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        load_tape(tmp_path / "rolls.npy")
+
+
+def test_tape_outcomes_reports_invalid_roll():
+    with pytest.raises(ValueError, match="at roll 5"):
+        tape_outcomes(np.array([[1, 1], [7, 1]]), start=3)
+
+
+def test_iter_tape_chunks():
+    tape = np.array([[1, 2], [3, 4], [5, 6], [6, 6], [2, 1]], dtype=np.uint8)
+    expected = [tuple(roll) for roll in tape.tolist()]
+    assert list(iter_tape(tape, chunk_size=2)) == expected
+    assert list(iter_tape([tape[:3], tape[3:]], chunk_size=2)) == expected
+
+
+def test_replayed_tape_matches_random_run(tmp_path):
+    table = Table(seed=8)
+    table.add_player(strategy=BetPassLine(5))
+    table.dice.recorder = RollRecorder()
+    table.run(max_rolls=200, verbose=False)
+    table.dice.recorder.save(tmp_path / "rolls.npy")
+
+    replay = Table()
+    replay.add_player(strategy=BetPassLine(5))
+    replay.fixed_run(load_tape(tmp_path / "rolls.npy"))
+
+    assert replay.dice.n_rolls == table.dice.n_rolls
+    assert replay.players[0].bankroll == table.players[0].bankroll
+    assert replay.players[0].bets == table.players[0].bets
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "1,2\n3,4\n5,6\n6,6\n2,1\n",
+        "1 2\r\n3 4\r\n5 6\r\n6 6\r\n2 1\r\n",
+        "# floor log\n1, 2\n\n3\t4\n 5 6 \n6,6\n2,1",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_roll_log_reader(tmp_path, text, chunk_size):
+    path = tmp_path / "rolls.log"
+    path.write_text(text)
+    reader = RollLogReader(path, chunk_size=chunk_size)
+    chunks = list(reader)
+
+    assert all(chunk.dtype == np.uint8 and len(chunk) <= chunk_size for chunk in chunks)
+    np.testing.assert_array_equal(
+        np.concatenate(chunks), [[1, 2], [3, 4], [5, 6], [6, 6], [2, 1]]
+    )
+    assert reader.n_rolls == 5
+
+
+def test_roll_log_reader_gzip_and_header(tmp_path):
+    path = tmp_path / "rolls.csv.gz"
+    with gzip.open(path, "wt") as file:
+        file.write("d1,d2\n4,3\n")
+    chunks = list(RollLogReader(path, header=True))
+    np.testing.assert_array_equal(np.concatenate(chunks), [[4, 3]])
+
+
+def test_roll_log_reader_malformed_line(tmp_path):
+    path = tmp_path / "rolls.log"
+    path.write_text("1,2\n3,4\n7,1\n5,6\n1 2 3\n")
+
+    with pytest.raises(RollLogError, match="line 3") as error:
+        list(RollLogReader(path))
+    assert (error.value.line_number, error.value.line) == (3, "7,1")
+
+    reader = RollLogReader(path, errors="skip")
+    np.testing.assert_array_equal(
+        np.concatenate(list(reader)), [[1, 2], [3, 4], [5, 6]]
+    )
+    assert reader.malformed_lines == [(3, "7,1"), (5, "1 2 3")]
+
+
+def test_roll_log_replay_matches_tuples(tmp_path):
+    rolls = np.random.default_rng(8).integers(1, 7, size=(300, 2))
+    path = tmp_path / "rolls.csv"
+    path.write_text("".join(f"{d1},{d2}\n" for d1, d2 in rolls))
+
+    table = Table()
+    table.add_player(strategy=BetPassLine(5))
+    table.fixed_run([tuple(roll) for roll in rolls.tolist()])
+
+    replay = Table()
+    replay.add_player(strategy=BetPassLine(5))
+    replay.fixed_run(RollLogReader(path, chunk_size=64))
+
+    assert replay.dice.n_rolls == 300
+    assert replay.players[0].bankroll == table.players[0].bankroll